@@ -3,94 +3,548 @@ Main Dash application for SIH Logistics Optimization Simulator
 Production-quality web interface with interactive optimization and visualization
 """
 import dash
-from dash import dcc, html, Input, Output, State, callback_context, dash_table
+from dash import dcc, html, Input, Output, State, callback_context, dash_table, DiskcacheManager, Patch
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
+import diskcache
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
 import numpy as np
-import json
+import pyarrow as pa
+from pyarrow import ipc
+import base64
+import hashlib
+from types import SimpleNamespace
+import math
+import os
+import orjson
 import time
+from datetime import datetime
 import io
+import tempfile
 import zipfile
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 # Import our modules
 from data_loader import DataLoader
-from milp_optimizer import MILPOptimizer
-from heuristics import HeuristicOptimizer
-from simulation import LogisticsSimulator
 from visuals import LogisticsVisualizer
-from utils import ETAPredictor, ScenarioGenerator, calculate_kpis, format_currency
-from seed_utils import reseed_for_phase, set_global_seed
+from utils import BoundedMemo, ETAPredictor, ScenarioGenerator, calculate_kpis, format_currency
+from seed_utils import derive_phase_seed, reseed_for_phase, set_global_seed
+
+# Long-running solver and simulation callbacks execute off the request thread.
+background_callback_manager = DiskcacheManager(diskcache.Cache("./dash_bg_cache"))
 
 app = dash.Dash(
     __name__,
     external_stylesheets=[
         dbc.themes.BOOTSTRAP
     ],
-    suppress_callback_exceptions=True
+    suppress_callback_exceptions=True,
+    background_callback_manager=background_callback_manager
 )
 
 app.title = "SIH Logistics Optimization Simulator"
 
+# Serialize figures with orjson (native numpy support) instead of the stdlib encoder.
+pio.json.config.default_engine = "orjson"
+
+# WSGI entry point, e.g. ``gunicorn -w 8 app:server``; per-browser state lives in dcc.Store,
+# with loaded datasets kept in the server-side cache below and referenced by token.
+server = app.server
+
+# Datasets, solved plans and simulation runs live in a server-side cache. Set REDIS_URL to
+# share it across gunicorn workers/hosts; otherwise it is kept on local disk.
+if os.environ.get("REDIS_URL"):
+    _CACHE_CONFIG = {
+        'CACHE_TYPE': 'RedisCache',
+        'CACHE_REDIS_URL': os.environ["REDIS_URL"],
+        'CACHE_KEY_PREFIX': 'vessel-opt:'
+    }
+else:
+    _CACHE_CONFIG = {
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': '.dash_cache',
+        'CACHE_THRESHOLD': 200
+    }
+cache = Cache(server, config=_CACHE_CONFIG)
+PLAN_CACHE_TIMEOUT = 3600
+# Loaded datasets are referenced from stored-data by token. Their TTL slides: any callback
+# that reads a dataset re-arms it (at most once per refresh interval), so only datasets
+# nobody has used for DATASET_CACHE_TIMEOUT seconds age out. Once one is gone the user is
+# asked to reload the data.
+DATASET_CACHE_TIMEOUT = 12 * 3600
+DATASET_REFRESH_INTERVAL = DATASET_CACHE_TIMEOUT // 4
+DATASET_TOKEN_PREFIX = "dataset:"
+DATASET_EXPIRED_MESSAGE = (
+    "The loaded dataset has expired from the server cache. "
+    "Click 'Load Sample Data' or upload your CSV files again."
+)
+# Export archives spill from memory to a temp file past this size.
+EXPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Solver and simulation modules pull in PuLP/DEAP; load them on first run, not at startup.
+@lru_cache(maxsize=1)
+def _milp_optimizer_cls():
+    from milp_optimizer import MILPOptimizer
+    return MILPOptimizer
+
+
+@lru_cache(maxsize=1)
+def _heuristic_optimizer_cls():
+    from heuristics import HeuristicOptimizer
+    return HeuristicOptimizer
+
+
+@lru_cache(maxsize=1)
+def _simulator_cls():
+    from simulation import LogisticsSimulator
+    return LogisticsSimulator
+
+
+# Subplot support (and its figure-factory imports) is only needed by the scenario comparison.
+@lru_cache(maxsize=1)
+def _make_subplots():
+    from plotly.subplots import make_subplots
+    return make_subplots
+
+
 # Establish a deterministic baseline seed for all stochastic components.
 BASE_RANDOM_SEED = set_global_seed(quiet=True)
 
-# Global variables for storing data and results
-current_data = None
-current_solution = None
-current_simulation = None
-baseline_solution = None
-
 # Initialize ETA predictor
 eta_predictor = ETAPredictor()
 
 
-def get_data_frames(stored_data: Optional[str]) -> Dict[str, pd.DataFrame]:
-    """Rehydrate cached dataset JSON back into pandas DataFrames."""
-    if not stored_data:
-        return {}
+# zstd-compressed record batches; readers decompress transparently.
+_IPC_WRITE_OPTIONS = ipc.IpcWriteOptions(compression=pa.Codec("zstd", compression_level=3))
+
+
+def _table_to_ipc_b64(table: pa.Table) -> str:
+    """Encode an Arrow table as a base64, zstd-compressed Arrow IPC stream."""
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema, options=_IPC_WRITE_OPTIONS) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
+
+
+def dataset_token(frames: Dict[str, pd.DataFrame]) -> str:
+    """Content-hash token for a dataset, as kept in stored-data."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(frames):
+        df = frames[name]
+        digest.update(name.encode("utf-8"))
+        digest.update(dump_json_bytes([str(col) for col in df.columns]))
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return DATASET_TOKEN_PREFIX + digest.hexdigest()
+
+
+# When each dataset's cache TTL was last re-armed by this process (time.monotonic())
+_DATASET_REFRESHED = BoundedMemo(maxsize=64)
+
+
+def store_dataset(frames: Dict[str, pd.DataFrame]) -> str:
+    """Put a dataset in the server-side cache and return the token kept in stored-data.
+
+    The token is a content hash, so re-uploading identical files reuses the cached entry
+    (and every plan/simulation cached against it).
+    """
+    token = dataset_token(frames)
+    cache.set(token, dict(frames), timeout=DATASET_CACHE_TIMEOUT)
+    _DATASET_REFRESHED.set(token, time.monotonic())
+    return token
+
 
+@lru_cache(maxsize=8)
+def _load_dataset(token: str) -> Dict[str, pd.DataFrame]:
+    """Fetch a tokenized dataset from the server-side cache; cached per process."""
+    frames = cache.get(token)
+    if frames is None:
+        raise KeyError(token)
+    _DATASET_REFRESHED.set(token, time.monotonic())
+    return frames
+
+
+def load_dataset(token: str) -> Dict[str, pd.DataFrame]:
+    """_load_dataset, re-arming the server-side TTL of a dataset that is still in use.
+
+    Raises KeyError once the dataset has expired from the cache.
+    """
+    frames = _load_dataset(token)
+    now = time.monotonic()
+    refreshed = _DATASET_REFRESHED.get(token)
+    if refreshed is None or now - refreshed >= DATASET_REFRESH_INTERVAL:
+        # Re-set rather than touch: cachelib backends have no portable touch, and this also
+        # restores an entry another worker's cache pruning removed while we held it in memory
+        cache.set(token, frames, timeout=DATASET_CACHE_TIMEOUT)
+        _DATASET_REFRESHED.set(token, now)
+    return frames
+
+
+def dataset_expired(stored_data) -> bool:
+    """True when stored-data references a dataset that is no longer in the server cache."""
+    if not (isinstance(stored_data, str) and stored_data.startswith(DATASET_TOKEN_PREFIX)):
+        return False
+    if stored_data == _SAMPLE_DATA_STORE:
+        return False
     try:
-        if isinstance(stored_data, str):
-            data_dict = json.loads(stored_data)
-        else:
-            data_dict = stored_data
+        load_dataset(stored_data)
+    except KeyError:
+        return True
+    return False
 
-        if not isinstance(data_dict, dict):
-            return {}
 
-        frames = {}
-        for name, records in data_dict.items():
-            try:
-                frames[name] = pd.DataFrame(records)
-            except Exception:
-                frames[name] = pd.DataFrame()
-        return frames
-    except (TypeError, ValueError, json.JSONDecodeError):
+def get_data_frames(stored_data) -> Dict[str, pd.DataFrame]:
+    """Resolve a stored-data dataset token into DataFrames.
+
+    Frames are shared with the dataset caches, so callers must treat them as read-only.
+    """
+    if not (isinstance(stored_data, str) and stored_data.startswith(DATASET_TOKEN_PREFIX)):
+        return {}
+
+    if stored_data == _SAMPLE_DATA_STORE:
+        # The sample dataset is rebuilt per process and never goes through the cache
+        return dict(_SAMPLE_DATASET)
+    try:
+        return dict(load_dataset(stored_data))
+    except KeyError:
+        print(f"Dataset {stored_data} is no longer in the server cache; reload the data.")
         return {}
 
 
-def parse_solution_payload(stored_solution: Optional[str]) -> Dict:
-    """Return a dict representation of the stored solution payload."""
+def dataset_shapes(stored_data) -> Dict[str, Tuple[int, List]]:
+    """Row count and column names per dataset."""
+    return {name: (len(df), df.columns.tolist()) for name, df in get_data_frames(stored_data).items()}
+
+
+def dataset_fingerprint(stored_data) -> str:
+    """Stable digest of the stored dataset payload, used to key cached runs."""
+    if isinstance(stored_data, str) and stored_data.startswith(DATASET_TOKEN_PREFIX):
+        # Tokens are already content hashes
+        return stored_data[len(DATASET_TOKEN_PREFIX):]
+    return hashlib.blake2b(dump_json_bytes(stored_data), digest_size=16).hexdigest()
+
+
+# Vessels re-indexed by vessel_id, memoized per vessels frame object (frames come from the
+# dataset caches, so the same object is seen on every callback for a loaded dataset).
+_VESSEL_INDEXES = BoundedMemo(maxsize=4)
+
+
+def indexed_vessels(vessels_df: pd.DataFrame) -> pd.DataFrame:
+    """First row per vessel_id, indexed by vessel_id, for hash joins; treat as read-only."""
+    indexed = _VESSEL_INDEXES.get(id(vessels_df), anchors=(vessels_df,))
+    if indexed is None:
+        indexed = _VESSEL_INDEXES.set(
+            id(vessels_df), vessels_df.drop_duplicates('vessel_id').set_index('vessel_id'), anchors=(vessels_df,)
+        )
+    return indexed
+
+
+def make_cache_key(prefix: str, *parts) -> str:
+    """Build a flask-caching key from a prefix and JSON-encodable parts."""
+    return f"{prefix}:" + hashlib.blake2b(dump_json_bytes(list(parts)), digest_size=16).hexdigest()
+
+
+# Store wire format for plans: the assignment table (the only bulky part) travels as a
+# zstd-compressed Arrow IPC blob under ASSIGNMENTS_IPC_KEY; the remaining keys are scalars
+# and small dicts left as plain JSON so the browser-side stores stay inspectable.
+ASSIGNMENTS_IPC_KEY = 'assignments_ipc'
+ASSIGNMENT_COUNT_KEY = 'assignment_count'
+RESULT_REF_KEY = 'result_ref'
+
+# Fields kept in a result reference so the UI still has something to show if the
+# server-side entry has expired.
+_RESULT_REF_FIELDS = ('run_id', 'status', 'simulation_days', 'rng_seed')
+
+
+def stash_result(result, key: str):
+    """Keep a computed result in the server-side cache and hand the browser a small reference."""
+    if not isinstance(result, dict) or not key:
+        return result
+    cache.set(key, result, timeout=PLAN_CACHE_TIMEOUT)
+    reference = {field: result[field] for field in _RESULT_REF_FIELDS if field in result}
+    reference[RESULT_REF_KEY] = key
+    return reference
+
+
+@lru_cache(maxsize=8)
+def _load_result(key: str) -> Dict:
+    """Fetch a stashed result from the server-side cache; cached per process."""
+    result = cache.get(key)
+    if result is None:
+        raise KeyError(key)
+    return result
+
+
+def pack_solution_payload(solution):
+    """Swap a solution's assignment list for a compressed Arrow IPC table before it hits a store.
+
+    Only plans whose assignments all share one key set are packed, so the table's columns
+    are exactly each record's keys and decoding restores the records as they were.
+    """
+    if not isinstance(solution, dict) or not solution.get('assignments'):
+        return solution
+    assignments = solution['assignments']
+    key_set = assignments[0].keys() if isinstance(assignments[0], dict) else None
+    if key_set is None or any(not isinstance(a, dict) or a.keys() != key_set for a in assignments):
+        # Ragged records would come back with padded keys; keep the plain list
+        return solution
+    try:
+        # Built from the records directly: Arrow keeps int columns int even where a value is None
+        assignments_ipc = _table_to_ipc_b64(pa.Table.from_pylist(assignments))
+    except (pa.ArrowException, TypeError, ValueError) as exc:
+        # Mixed-type columns Arrow cannot type; keep the plain list
+        print(f"Assignment table packing skipped: {exc}")
+        return solution
+    packed = {key: value for key, value in solution.items() if key != 'assignments'}
+    packed[ASSIGNMENTS_IPC_KEY] = assignments_ipc
+    packed[ASSIGNMENT_COUNT_KEY] = len(solution['assignments'])
+    return packed
+
+
+def plan_totals(stored_plan) -> Optional[Tuple[float, int]]:
+    """(objective_value, vessel count) of a stored plan, read without unpacking its assignments."""
+    if not stored_plan:
+        return None
+    plan = stored_plan if isinstance(stored_plan, dict) else parse_solution_payload(stored_plan)
+    if not plan:
+        return None
+    if ASSIGNMENT_COUNT_KEY in plan:
+        vessel_count = int(plan[ASSIGNMENT_COUNT_KEY])
+    elif ASSIGNMENTS_IPC_KEY in plan or RESULT_REF_KEY in plan:
+        vessel_count = len(parse_solution_payload(plan).get('assignments', []))
+    else:
+        vessel_count = len(plan.get('assignments', []))
+    return float(plan.get('objective_value', 0) or 0), vessel_count
+
+
+@lru_cache(maxsize=8)
+def _assignments_table_from_ipc(payload: str) -> pa.Table:
+    return ipc.open_stream(pa.py_buffer(base64.b64decode(payload))).read_all()
+
+
+@lru_cache(maxsize=8)
+def _assignments_from_ipc(payload: str) -> pd.DataFrame:
+    return _assignments_table_from_ipc(payload).to_pandas()
+
+
+@lru_cache(maxsize=8)
+def _assignment_records_from_ipc(payload: str) -> tuple:
+    """Assignment dicts for a packed plan, built once per payload; the dicts are shared and read-only.
+
+    Read straight from the Arrow table rather than the pandas frame, so integer columns
+    stay ints and keys set to None keep their None.
+    """
+    return tuple(_assignments_table_from_ipc(payload).to_pylist())
+
+
+def parse_solution_payload(stored_solution) -> Dict:
+    """Return a dict representation of the stored solution payload.
+
+    Packed assignment tables are decoded once per payload and shared between callbacks,
+    so the returned assignment dicts must not be mutated in place.
+    """
     if not stored_solution:
         return {}
 
     if isinstance(stored_solution, dict):
-        return stored_solution
+        payload = stored_solution
+    else:
+        try:
+            payload = orjson.loads(stored_solution)
+        except (TypeError, ValueError, orjson.JSONDecodeError):
+            return {}
+
+    if isinstance(payload, dict) and RESULT_REF_KEY in payload:
+        try:
+            payload = _load_result(payload[RESULT_REF_KEY])
+        except KeyError:
+            print(f"Stored result {payload[RESULT_REF_KEY]} expired from the cache")
+            return {key: value for key, value in payload.items() if key != RESULT_REF_KEY}
+
+    if not isinstance(payload, dict) or ASSIGNMENTS_IPC_KEY not in payload:
+        return payload
 
     try:
-        return json.loads(stored_solution)
-    except (TypeError, ValueError, json.JSONDecodeError):
-        return {}
+        frame = _assignments_from_ipc(payload[ASSIGNMENTS_IPC_KEY])
+        records = _assignment_records_from_ipc(payload[ASSIGNMENTS_IPC_KEY])
+    except (pa.ArrowException, TypeError, ValueError):
+        frame, records = pd.DataFrame(), ()
+    solution = {key: value for key, value in payload.items() if key != ASSIGNMENTS_IPC_KEY}
+    solution['assignments'] = list(records)
+    if solution.get('plan_id'):
+        _remember_assignments_frame(solution['plan_id'], frame)
+    return solution
+
+
+def solution_fingerprint(solution) -> str:
+    """Plan identity of a parsed solution: its plan_id, else a digest of its assignments."""
+    if not isinstance(solution, dict):
+        return ""
+    plan_id = solution.get('plan_id')
+    if plan_id:
+        return plan_id
+    return hashlib.blake2b(dump_json_bytes(solution.get('assignments', [])), digest_size=16).hexdigest()
+
+
+_ASSIGNMENT_FRAMES = BoundedMemo(maxsize=4)
+_PANEL_ASSIGNMENT_FRAMES = BoundedMemo(maxsize=4)
+
+# Columns the summary panels read, with the value used when a plan lacks them. Only the
+# panel view gets these; exports keep the plan's own columns.
+_PANEL_COLUMN_DEFAULTS = {
+    'vessel_id': None,
+    'port_id': None,
+    'plant_id': None,
+    'cargo_mt': 0.0,
+}
+
+
+def _normalize_assignments_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Guarantee the panel columns exist, with a float cargo_mt."""
+    missing = [col for col in _PANEL_COLUMN_DEFAULTS if col not in frame.columns]
+    if not missing and pd.api.types.is_float_dtype(frame['cargo_mt']):
+        return frame
+
+    # Assignment frames are shared with the plan caches, so never modify them in place
+    frame = frame.copy()
+    for col in missing:
+        frame[col] = _PANEL_COLUMN_DEFAULTS[col]
+    frame['cargo_mt'] = pd.to_numeric(frame['cargo_mt'], errors='coerce').fillna(0.0).astype('float64')
+    return frame
+
+
+def get_assignments_frame(solution) -> pd.DataFrame:
+    """Assignments of a parsed solution as a DataFrame, cached per plan across callbacks.
+
+    Carries exactly the plan's own columns, as exported. Keyed by the solution's plan_id
+    (or a digest of its assignments for older payloads); the frame is shared, so callers
+    must treat it as read-only.
+    """
+    assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
+    if not assignments:
+        return pd.DataFrame()
+
+    plan_key = solution_fingerprint(solution)
+    frame = _ASSIGNMENT_FRAMES.get(plan_key)
+    if frame is None:
+        frame = _remember_assignments_frame(plan_key, pd.DataFrame.from_records(assignments))
+    return frame
+
+
+def _remember_assignments_frame(plan_key: str, frame: pd.DataFrame) -> pd.DataFrame:
+    return _ASSIGNMENT_FRAMES.set(plan_key, frame)
+
+
+def panel_assignments_frame(solution) -> pd.DataFrame:
+    """get_assignments_frame with the panel columns guaranteed (see _PANEL_COLUMN_DEFAULTS).
+
+    For the summary panels only; cached per plan and shared, so treat it as read-only.
+    """
+    assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
+    if not assignments:
+        return _normalize_assignments_frame(pd.DataFrame())
+
+    plan_key = solution_fingerprint(solution)
+    frame = _PANEL_ASSIGNMENT_FRAMES.get(plan_key)
+    if frame is None:
+        frame = _PANEL_ASSIGNMENT_FRAMES.set(plan_key, _normalize_assignments_frame(get_assignments_frame(solution)))
+    return frame
+
+
+def port_assignment_counts(assignments_df: pd.DataFrame, column: str = 'port_id') -> pd.Series:
+    """Assignments per port (or other id column) in first-seen order; missing ids count as 'Unknown'."""
+    if assignments_df.empty:
+        return pd.Series(dtype='int64')
+    return assignments_df[column].fillna('Unknown').value_counts(sort=False)
+
+
+_SOLUTION_VIEWS = BoundedMemo(maxsize=4)
+
+
+def solution_view(solution) -> SimpleNamespace:
+    """Assignments frame plus the per-plan aggregates the summary panels share.
+
+    Computed once per plan and reused by every solution-driven callback; treat it as read-only.
+    """
+    plan_key = solution_fingerprint(solution) if isinstance(solution, dict) and solution.get('assignments') else ""
+    view = _SOLUTION_VIEWS.get(plan_key)
+    if view is not None:
+        return view
+
+    assignments_df = panel_assignments_frame(solution)
+    # Rakes are summed only where the plan states them; none are invented for plans without them
+    rakes = (pd.to_numeric(assignments_df['rakes_required'], errors='coerce')
+             if 'rakes_required' in assignments_df.columns else pd.Series(dtype='float64'))
+    view = SimpleNamespace(
+        assignments_df=assignments_df,
+        port_counts=port_assignment_counts(assignments_df),
+        plant_counts=port_assignment_counts(assignments_df, 'plant_id'),
+        total_cargo=float(assignments_df['cargo_mt'].sum()),
+        total_rakes=int(rakes.sum()),
+    )
+    return _SOLUTION_VIEWS.set(plan_key, view)
+
+
+def write_zip_csv(zip_file: zipfile.ZipFile, name: str, df: pd.DataFrame) -> None:
+    """Stream a DataFrame as CSV straight into a zip entry without an intermediate string."""
+    with zip_file.open(name, "w", force_zip64=True) as entry:
+        with io.TextIOWrapper(entry, encoding="utf-8", newline="") as text_entry:
+            df.to_csv(text_entry, index=False)
+
+
+def export_spool() -> tempfile.SpooledTemporaryFile:
+    """Scratch file for building an export archive; stays in memory until it outgrows EXPORT_SPOOL_BYTES."""
+    return tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+
+
+def send_spooled(buffer, filename: str):
+    """Hand a finished export spool to dcc.Download and release it."""
+    try:
+        buffer.seek(0)
+        return dcc.send_bytes(buffer.read(), filename)
+    finally:
+        buffer.close()
+
+
+def stored_identity(stored) -> Optional[str]:
+    """Stable id stamped on a stored plan or simulation ('' when empty, None when unknown)."""
+    if not stored:
+        return ""
+    if isinstance(stored, dict):
+        return stored.get('plan_id') or stored.get('run_id') or stored.get(RESULT_REF_KEY)
+    return None
+
+
+def render_fingerprint(*stores) -> Optional[str]:
+    """Fingerprint of several stores for skip_if_rendered; None if any store has no stable id."""
+    identities = [stored_identity(stored) for stored in stores]
+    if any(identity is None for identity in identities):
+        return None
+    return "|".join(identities)
+
+
+def skip_if_rendered(fingerprint: Optional[str], rendered: Optional[str]) -> Optional[str]:
+    """Stop a render callback when this client already shows output for the same inputs."""
+    if fingerprint and fingerprint == rendered:
+        raise PreventUpdate
+    return fingerprint
+
+
+def send_csv_bytes(df: pd.DataFrame, filename: str):
+    """Render a DataFrame to CSV bytes inside the callback and hand them to dcc.Download."""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding="utf-8")
+    return dcc.send_bytes(buffer.getvalue(), filename)
 
 
 def build_dispatch_export(trigger_source: str,
-                          stored_solution: Optional[str],
-                          stored_simulation: Optional[str],
-                          stored_data: Optional[str]):
+                          stored_solution: Optional[Dict],
+                          stored_simulation: Optional[Dict],
+                          stored_data: Optional[Dict]):
     """Create dispatch export payload based on trigger source."""
     solution = parse_solution_payload(stored_solution)
     assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
@@ -98,15 +552,15 @@ def build_dispatch_export(trigger_source: str,
         print("Dispatch export skipped: no assignments available.")
         return None
 
-    df = pd.DataFrame(assignments)
+    df = get_assignments_frame(solution)
     if df.empty:
         print("Dispatch export skipped: assignment dataframe empty.")
         return None
 
     if trigger_source == "export-csv-btn":
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_buffer:
-            zip_buffer.writestr("dispatch_plan.csv", df.to_csv(index=False))
+        buffer = export_spool()
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_buffer:
+            write_zip_csv(zip_buffer, "dispatch_plan.csv", df)
 
             simulation = parse_solution_payload(stored_simulation)
             data_frames = get_data_frames(stored_data)
@@ -127,15 +581,13 @@ def build_dispatch_export(trigger_source: str,
 
             if kpis:
                 kpi_df = pd.DataFrame([kpis])
-                zip_buffer.writestr("kpi_summary.csv", kpi_df.to_csv(index=False))
+                write_zip_csv(zip_buffer, "kpi_summary.csv", kpi_df)
 
             try:
-                summary_df = (
-                    df.groupby(['port_id', 'plant_id'], dropna=False)
-                      .agg(assignments=('vessel_id', 'count'), cargo_mt=('cargo_mt', 'sum'))
-                      .reset_index()
-                )
-                zip_buffer.writestr("port_plant_summary.csv", summary_df.to_csv(index=False))
+                summary_df = df.groupby(
+                    ['port_id', 'plant_id'], dropna=False, sort=False, as_index=False
+                ).agg(assignments=('vessel_id', 'size'), cargo_mt=('cargo_mt', 'sum'))
+                write_zip_csv(zip_buffer, "port_plant_summary.csv", summary_df)
             except Exception as exc:
                 print(f"Dispatch export summary error: {exc}")
 
@@ -150,30 +602,32 @@ def build_dispatch_export(trigger_source: str,
             ]
             zip_buffer.writestr("README.txt", "\n".join(summary_lines))
 
-        buffer.seek(0)
-        return dcc.send_bytes(buffer.getvalue(), "dispatch_export_bundle.zip")
+        return send_spooled(buffer, "dispatch_export_bundle.zip")
 
-    return dcc.send_data_frame(df.to_csv, filename="dispatch_plan.csv", index=False)
+    return send_csv_bytes(df, "dispatch_plan.csv")
 
 
 def build_sap_export(trigger_source: str,
-                     stored_solution: Optional[str],
-                     stored_data: Optional[str]):
+                     stored_solution: Optional[Dict],
+                     stored_data: Optional[Dict]):
     """Create SAP export payload based on trigger source."""
     solution = parse_solution_payload(stored_solution)
     data_frames = get_data_frames(stored_data)
 
-    assignments = pd.DataFrame(solution.get('assignments', [])) if isinstance(solution, dict) else pd.DataFrame()
+    assignments = get_assignments_frame(solution)
     vessels = data_frames.get('vessels', pd.DataFrame())
 
     if assignments.empty:
         print("SAP export skipped: no assignments available.")
         return None
 
-    sap = assignments.merge(
-        vessels[['vessel_id', 'eta_day', 'port_id']].drop_duplicates(),
-        on='vessel_id', how='left'
-    )
+    sap = assignments.drop(columns=['eta_day'], errors='ignore')
+    if not vessels.empty and 'vessel_id' in vessels.columns and 'vessel_id' in sap.columns:
+        vessel_lookup = indexed_vessels(vessels)
+        lookup_cols = [col for col in ('eta_day', 'port_id') if col in vessel_lookup.columns]
+        sap = sap.join(vessel_lookup[lookup_cols], on='vessel_id', rsuffix='_vessel')
+        if 'port_id_vessel' in sap.columns:
+            sap['port_id'] = sap['port_id'].fillna(sap.pop('port_id_vessel'))
     sap = sap.rename(columns={
         'vessel_id': 'Vessel',
         'port_id': 'Port',
@@ -190,9 +644,9 @@ def build_sap_export(trigger_source: str,
     sap = sap[cols]
 
     if trigger_source == "export-sap-btn":
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_buffer:
-            zip_buffer.writestr("sap_dispatch_template.csv", sap.to_csv(index=False))
+        buffer = export_spool()
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_buffer:
+            write_zip_csv(zip_buffer, "sap_dispatch_template.csv", sap)
 
             if not vessels.empty:
                 meta_cols = ['_id', 'vessel_id', 'cargo_mt', 'eta_day', 'port_id', 'demurrage_rate']
@@ -201,9 +655,9 @@ def build_sap_export(trigger_source: str,
                     vessel_meta = vessels[available_meta_cols].copy()
                     if '_id' in vessel_meta.columns:
                         vessel_meta = vessel_meta.rename(columns={'_id': 'RecordID'})
-                    zip_buffer.writestr("vessel_metadata.csv", vessel_meta.to_csv(index=False))
+                    write_zip_csv(zip_buffer, "vessel_metadata.csv", vessel_meta)
 
-            zip_buffer.writestr("assignment_details.csv", assignments.to_csv(index=False))
+            write_zip_csv(zip_buffer, "assignment_details.csv", assignments)
 
             instructions = [
                 "SAP Upload Package",
@@ -213,31 +667,61 @@ def build_sap_export(trigger_source: str,
             ]
             zip_buffer.writestr("README.txt", "\n".join(instructions))
 
-        buffer.seek(0)
-        return dcc.send_bytes(buffer.getvalue(), "sap_export_bundle.zip")
+        return send_spooled(buffer, "sap_export_bundle.zip")
 
-    return dcc.send_data_frame(sap.to_csv, filename="dispatch_sap_export.csv", index=False)
+    return send_csv_bytes(sap, "dispatch_sap_export.csv")
 
 
-def make_json_safe(value):
-    """Recursively convert numpy/pandas objects to JSON-safe Python types."""
-    if isinstance(value, dict):
-        return {key: make_json_safe(val) for key, val in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [make_json_safe(item) for item in value]
-    if isinstance(value, (np.integer, np.int64, np.int32)):
-        return int(value)
-    if isinstance(value, (np.floating, np.float64, np.float32)):
-        return float(value)
-    if isinstance(value, (np.bool_,)):
-        return bool(value)
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_fallback(value):
+    """Handle the few types orjson cannot serialize natively."""
+    if value is pd.NaT or value is pd.NA:
+        return None
     if isinstance(value, pd.Timestamp):
         return value.isoformat()
     if isinstance(value, pd.DataFrame):
         return value.to_dict("records")
     if isinstance(value, (pd.Series, pd.Index)):
+        # Numeric arrays go through OPT_SERIALIZE_NUMPY; object arrays come back here as ndarray
+        return value.to_numpy()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, np.ndarray):
         return value.tolist()
-    return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def dump_json_bytes(value) -> bytes:
+    """Encode numpy/pandas-laden payloads to JSON bytes in a single orjson pass."""
+    return orjson.dumps(value, default=_json_fallback, option=_ORJSON_OPTIONS)
+
+
+def build_plant_options(plants_df: pd.DataFrame) -> List[Dict]:
+    """Build spike-plant dropdown options from the plants table without per-row Series."""
+    if plants_df is None or plants_df.empty or 'plant_id' not in plants_df.columns:
+        return []
+    ids = plants_df['plant_id'].tolist()
+    if 'plant_name' in plants_df.columns:
+        names = plants_df['plant_name'].where(plants_df['plant_name'].notna(), plants_df['plant_id']).tolist()
+    else:
+        names = ids
+    return [{"label": name, "value": plant_id} for name, plant_id in zip(names, ids)]
+
+
+# The sample dataset only depends on the base seed, so every process builds the same frames
+# at import; its token is served from memory and never written to the shared cache.
+_SAMPLE_DATASET = DataLoader.get_toy_dataset(BASE_RANDOM_SEED)
+_SAMPLE_DATA_STORE = dataset_token(_SAMPLE_DATASET)
+_SAMPLE_PLANT_OPTIONS = build_plant_options(_SAMPLE_DATASET['plants'])
+
+
+def make_json_safe(value):
+    """Convert numpy/pandas objects to JSON-safe Python types via an orjson round-trip."""
+    return orjson.loads(dump_json_bytes(value))
 
 
 def attach_solution_kpis(solution: Dict, data_frames: Dict[str, pd.DataFrame],
@@ -263,6 +747,88 @@ def attach_solution_kpis(solution: Dict, data_frames: Dict[str, pd.DataFrame],
         print(f"Solution KPI attachment error: {exc}")
     return solution
 
+
+# KPI results keyed by (plan, dataset, simulation) fingerprints so re-renders of an
+# unchanged plan or baseline skip calculate_kpis entirely.
+_KPI_RESULTS = BoundedMemo(maxsize=8)
+
+
+def cached_kpis(solution: Dict, stored_data, data_frames: Dict[str, pd.DataFrame],
+                simulation_results: Optional[Dict] = None) -> Dict:
+    """calculate_kpis for a stored plan, memoized on content fingerprints.
+
+    Returns a fresh dict each call so callers may adjust the values.
+    """
+    sim_key = None
+    if simulation_results:
+        sim_key = simulation_results.get('run_id') or hashlib.blake2b(
+            dump_json_bytes(simulation_results), digest_size=16
+        ).hexdigest()
+    memo_key = (solution_fingerprint(solution), dataset_fingerprint(stored_data), sim_key)
+    kpis = _KPI_RESULTS.get(memo_key)
+    if kpis is None:
+        kpis = calculate_kpis(
+            solution.get('assignments', []) if isinstance(solution, dict) else [],
+            data_frames.get('vessels', pd.DataFrame()),
+            data_frames.get('plants', pd.DataFrame()),
+            simulation_results,
+            data_frames.get('ports', pd.DataFrame()),
+            data_frames.get('rail_costs', pd.DataFrame())
+        )
+        _KPI_RESULTS.set(memo_key, kpis)
+    return dict(kpis)
+
+
+# Cost component totals keyed by (plan, dataset) fingerprints
+_COST_COMPONENTS = BoundedMemo(maxsize=8)
+
+
+def cached_cost_components(solution: Dict, stored_data, data_frames: Dict[str, pd.DataFrame]) -> Dict[str, float]:
+    """Estimated port handling, rail and demurrage totals for a plan, computed once per plan and dataset.
+
+    One mapped rate column per component; returns a fresh dict each call.
+    """
+    memo_key = (solution_fingerprint(solution), dataset_fingerprint(stored_data))
+    costs = _COST_COMPONENTS.get(memo_key)
+    if costs is not None:
+        return dict(costs)
+
+    assignments_df = panel_assignments_frame(solution)
+    vessels_df = data_frames['vessels']
+    ports_df = data_frames['ports']
+    rail_costs_df = data_frames['rail_costs']
+
+    port_handling_cost = 0.0
+    rail_transport_cost = 0.0
+    demurrage_cost = 0.0
+
+    if not assignments_df.empty:
+        cargo_mt = assignments_df['cargo_mt'].to_numpy(dtype=float)
+
+        # Port handling
+        handling_rate = ports_df.drop_duplicates('port_id').set_index('port_id')['handling_cost_per_mt']
+        port_handling_cost = cost_dot(cargo_mt, assignments_df['port_id'].map(handling_rate))
+
+        # Rail transport
+        rail_rate = rail_costs_df.drop_duplicates(['port_id', 'plant_id']).set_index(
+            ['port_id', 'plant_id']
+        )['cost_per_mt']
+        lanes = pd.MultiIndex.from_arrays([assignments_df['port_id'], assignments_df['plant_id']])
+        rail_transport_cost = cost_dot(cargo_mt, rail_rate.reindex(lanes))
+
+        # Demurrage (simplified - would need actual wait times); 12 hours estimated wait
+        demurrage_rate = assignments_df['vessel_id'].map(indexed_vessels(vessels_df)['demurrage_rate'])
+        demurrage_cost = float(demurrage_rate.sum() * 12)
+
+    costs = {
+        'port_handling': port_handling_cost,
+        'rail_transport': rail_transport_cost,
+        'demurrage': demurrage_cost,
+    }
+    _COST_COMPONENTS.set(memo_key, costs)
+    return dict(costs)
+
+@lru_cache(maxsize=None)
 def create_header():
     """Create application header"""
     return dbc.Navbar(
@@ -287,6 +853,107 @@ def create_header():
     )
 
 
+# Static control-panel blocks are built once at import and shared by every page load.
+_UPLOAD_COMPONENT = dcc.Upload(
+    id='upload-data',
+    children=html.Div([
+        html.Strong("Upload planning datasets"),
+        html.P("Drag and drop or choose CSV files.", className="text-muted small mb-2"),
+        html.Small(
+            [
+                "Required files: ",
+                html.Code("vessels.csv"), ", ",
+                html.Code("ports.csv"), ", ",
+                html.Code("plants.csv"), ", ",
+                html.Code("rail_costs.csv")
+            ],
+            className="text-muted"
+        )
+    ], className="text-center"),
+    multiple=True,
+    className="upload-dropzone mb-3"
+)
+
+_CSV_GUIDE_COLLAPSE = dbc.Collapse([
+    dbc.Card([
+        dbc.CardHeader("CSV format guide", className="bg-info text-white"),
+        dbc.CardBody([
+            html.P("Required CSV files and their columns:", className="fw-bold"),
+            html.Ul([
+                html.Li([html.Code("vessels.csv"), ": vessel_id, cargo_mt, eta_day, port_id, demurrage_rate, cargo_grade"]),
+                html.Li([html.Code("ports.csv"), ": port_id, port_name, handling_cost_per_mt, daily_capacity_mt, rakes_available_per_day"]),
+                html.Li([html.Code("plants.csv"), ": plant_id, plant_name, daily_demand_mt, quality_requirements"]),
+                html.Li([html.Code("rail_costs.csv"), ": port_id, plant_id, cost_per_mt, distance_km, transit_days"])
+            ]),
+            dbc.Button("Download templates", id="download-templates-btn", color="light", size="sm", className="mt-2")
+        ])
+    ])
+], id="csv-guide-collapse", is_open=False, className="mb-3")
+
+_OPTIMIZATION_SETTINGS = dbc.Accordion([
+    dbc.AccordionItem([
+        html.P(
+            "Tune solver parameters before running the optimized plan.",
+            className="text-muted small mb-3"
+        ),
+        dbc.Row([
+            dbc.Col([
+                dbc.Label("Optimization method"),
+                dcc.Dropdown(
+                    id="optimization-method",
+                    options=[
+                        {"label": "MILP (exact optimization)", "value": "milp"},
+                        {"label": "Genetic algorithm", "value": "ga"},
+                        {"label": "MILP warm start + GA", "value": "milp_ga"},
+                        {"label": "Hybrid (MILP + GA + SA)", "value": "hybrid"}
+                    ],
+                    value="milp",
+                    clearable=False
+                )
+            ], md=6),
+            dbc.Col([
+                dbc.Label("MILP solver"),
+                dcc.Dropdown(
+                    id="solver-selection",
+                    options=[
+                        {"label": "PuLP CBC", "value": "CBC"},
+                        {"label": "Gurobi", "value": "GUROBI"}
+                    ],
+                    value="CBC",
+                    clearable=False
+                )
+            ], md=6)
+        ], className="g-3 mb-3"),
+        dbc.Row([
+            dbc.Col([
+                dbc.Label("MILP time limit (seconds)"),
+                dbc.Input(
+                    id="time-limit",
+                    type="number",
+                    value=300,
+                    min=60,
+                    max=3600,
+                    step=30
+                ),
+                dbc.FormText("Increase for harder planning problems.", className="text-muted")
+            ], md=6),
+            dbc.Col([
+                dbc.Label("GA generations"),
+                dbc.Input(
+                    id="ga-generations",
+                    type="number",
+                    value=40,
+                    min=10,
+                    max=200,
+                    step=5
+                ),
+                dbc.FormText("Higher values improve quality but take longer.", className="text-muted")
+            ], md=6)
+        ], className="g-3")
+    ], title="Advanced optimization settings", item_id="advanced-optimization")
+], start_collapsed=True, flush=True, className="mb-3")
+
+
 def create_controls_panel():
     """Create left controls panel"""
     return dbc.Card([
@@ -298,49 +965,11 @@ def create_controls_panel():
                 dbc.Button("CSV guide", id="csv-guide-btn", color="info", size="sm", outline=True)
             ], className="mb-3 w-100"),
 
-            dcc.Upload(
-                id='upload-data',
-                children=html.Div([
-                    html.Strong("Upload planning datasets"),
-                    html.P("Drag and drop or choose CSV files.", className="text-muted small mb-2"),
-                    html.Small(
-                        [
-                            "Required files: ",
-                            html.Code("vessels.csv"), ", ",
-                            html.Code("ports.csv"), ", ",
-                            html.Code("plants.csv"), ", ",
-                            html.Code("rail_costs.csv")
-                        ],
-                        className="text-muted"
-                    )
-                ], className="text-center"),
-                style={
-                    'width': '100%', 'minHeight': '120px', 'lineHeight': '1.4',
-                    'borderWidth': '2px', 'borderStyle': 'dashed',
-                    'borderRadius': '8px', 'textAlign': 'center',
-                    'padding': '20px', 'backgroundColor': '#f8f9fa'
-                },
-                multiple=True,
-                className="mb-3"
-            ),
+            _UPLOAD_COMPONENT,
 
             html.Div(id="data-status", className="mb-3"),
 
-            dbc.Collapse([
-                dbc.Card([
-                    dbc.CardHeader("CSV format guide", className="bg-info text-white"),
-                    dbc.CardBody([
-                        html.P("Required CSV files and their columns:", className="fw-bold"),
-                        html.Ul([
-                            html.Li([html.Code("vessels.csv"), ": vessel_id, cargo_mt, eta_day, port_id, demurrage_rate, cargo_grade"]),
-                            html.Li([html.Code("ports.csv"), ": port_id, port_name, handling_cost_per_mt, daily_capacity_mt, rakes_available_per_day"]),
-                            html.Li([html.Code("plants.csv"), ": plant_id, plant_name, daily_demand_mt, quality_requirements"]),
-                            html.Li([html.Code("rail_costs.csv"), ": port_id, plant_id, cost_per_mt, distance_km, transit_days"])
-                        ]),
-                        dbc.Button("Download templates", id="download-templates-btn", color="light", size="sm", className="mt-2")
-                    ])
-                ])
-            ], id="csv-guide-collapse", is_open=False, className="mb-3"),
+            _CSV_GUIDE_COLLAPSE,
 
             html.Hr(),
 
@@ -387,74 +1016,17 @@ def create_controls_panel():
             dbc.Button("Run baseline plan", id="run-baseline-btn", color="secondary", size="sm", className="mb-2 w-100"),
             dbc.Button("Run optimized plan", id="run-optimized-btn", color="success", size="sm", className="mb-2 w-100"),
             dbc.Button("Simulate dispatch performance", id="run-simulation-btn", color="info", size="sm", className="mb-2 w-100"),
-            dbc.Button("Compare scenario outcomes", id="compare-scenarios-btn", color="warning", size="sm", className="mb-3 w-100"),
+            dbc.Button("Compare scenario outcomes", id="compare-scenarios-btn", color="warning", size="sm", className="mb-2 w-100"),
+            dbc.Button("Cancel running job", id="cancel-run-btn", color="danger", size="sm", outline=True,
+                       className="mb-2 w-100", style={"display": "none"}),
+            html.Div(id="action-progress", className="text-muted small mb-2"),
+            html.Div(id="simulation-progress", className="text-muted small mb-2"),
             dbc.FormText(
                 "Run the baseline plan first, then generate an optimized plan before launching simulation, comparison, or exports.",
                 className="text-muted mb-3"
             ),
 
-            dbc.Accordion([
-                dbc.AccordionItem([
-                    html.P(
-                        "Tune solver parameters before running the optimized plan.",
-                        className="text-muted small mb-3"
-                    ),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Label("Optimization method"),
-                            dcc.Dropdown(
-                                id="optimization-method",
-                                options=[
-                                    {"label": "MILP (exact optimization)", "value": "milp"},
-                                    {"label": "Genetic algorithm", "value": "ga"},
-                                    {"label": "MILP warm start + GA", "value": "milp_ga"},
-                                    {"label": "Hybrid (MILP + GA + SA)", "value": "hybrid"}
-                                ],
-                                value="milp",
-                                clearable=False
-                            )
-                        ], md=6),
-                        dbc.Col([
-                            dbc.Label("MILP solver"),
-                            dcc.Dropdown(
-                                id="solver-selection",
-                                options=[
-                                    {"label": "PuLP CBC", "value": "CBC"},
-                                    {"label": "Gurobi", "value": "GUROBI"}
-                                ],
-                                value="CBC",
-                                clearable=False
-                            )
-                        ], md=6)
-                    ], className="g-3 mb-3"),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Label("MILP time limit (seconds)"),
-                            dbc.Input(
-                                id="time-limit",
-                                type="number",
-                                value=300,
-                                min=60,
-                                max=3600,
-                                step=30
-                            ),
-                            dbc.FormText("Increase for harder planning problems.", className="text-muted")
-                        ], md=6),
-                        dbc.Col([
-                            dbc.Label("GA generations"),
-                            dbc.Input(
-                                id="ga-generations",
-                                type="number",
-                                value=40,
-                                min=10,
-                                max=200,
-                                step=5
-                            ),
-                            dbc.FormText("Higher values improve quality but take longer.", className="text-muted")
-                        ], md=6)
-                    ], className="g-3")
-                ], title="Advanced optimization settings", item_id="advanced-optimization")
-            ], start_collapsed=True, flush=True, className="mb-3"),
+            _OPTIMIZATION_SETTINGS,
 
             html.Hr(),
             html.H6("Exports", className="text-primary mb-3"),
@@ -493,15 +1065,235 @@ def create_main_content():
             )
         ]),
         dbc.CardBody([
-            html.Div(id="tab-content")
+            html.Div(id="tab-content", children=[
+                html.Div(
+                    tab_layout,
+                    id=f"tab-pane-{tab_id}",
+                    style={"display": "block" if tab_id == "overview" else "none"}
+                )
+                for tab_id, tab_layout in _TAB_LAYOUTS.items()
+            ])
         ])
     ])
 
+# Assignment tables page, sort and slice on the server so only the visible rows are sent.
+TABLE_PAGE_SIZE = 50
+
+SCHEDULE_DETAIL_COLUMNS = ['Vessel', 'ETA Day', 'Port', 'Plant']
+RAKE_DETAIL_COLUMNS = ['Vessel', 'Port', 'Plant', 'Cargo (MT)',
+                       'Rakes Required', 'Scheduled Day', 'Berth Day', 'ETA Day']
+
+# Shared DataTable styling, built once rather than on every callback run
+TABLE_STRIPED_ROWS = [{'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}]
+DATA_SUMMARY_COLUMNS = [{'name': col, 'id': col} for col in ('Dataset', 'Records', 'Columns', 'Key Columns')]
+DATA_SUMMARY_STYLE_CELL = {'textAlign': 'left', 'padding': '10px'}
+DATA_SUMMARY_STYLE_HEADER = {'backgroundColor': '#343a40', 'color': 'white', 'fontWeight': 'bold'}
+EXPORT_PREVIEW_ROWS = 5
+EXPORT_PREVIEW_COLUMNS = [{'name': col, 'id': col} for col in ('Vessel', 'Port', 'Plant', 'Cargo (MT)', 'ETA Day')]
+EXPORT_PREVIEW_STYLE_CELL = {'textAlign': 'left', 'padding': '8px', 'fontSize': '12px'}
+EXPORT_PREVIEW_STYLE_HEADER = {'backgroundColor': '#6c757d', 'color': 'white', 'fontWeight': 'bold'}
+VARIANCE_COLUMNS = [{'name': col, 'id': col} for col in ('Metric', 'Planned', 'Simulated', 'Delta', 'Delta %')]
+VARIANCE_STYLE_CELL = {"padding": "8px", "fontSize": "13px"}
+VARIANCE_STYLE_HEADER = {"backgroundColor": "#f8f9fa", "fontWeight": "bold"}
+
+COST_BREAKDOWN_LABELS = ['Port Handling', 'Rail Transport', 'Demurrage', 'Other']
+COST_BREAKDOWN_COLORS = ['#007bff', '#28a745', '#ffc107', '#6c757d']
+# Baseline / optimized bar colours in the scenario and cost comparison charts
+BASELINE_BAR_COLOR = '#6c757d'
+OPTIMIZED_BAR_COLOR = '#28a745'
+SCENARIO_BAR_COLORS = [BASELINE_BAR_COLOR, OPTIMIZED_BAR_COLOR]
+
+# Empty-state placeholders; callbacks return these as-is and never mutate them
+NO_LOGS_PLACEHOLDER = [html.P("No logs available. Run an optimization first.", className="text-muted")]
+NO_AUDIT_PLACEHOLDER = [html.P("No activities yet.", className="text-muted")]
+NO_EXPORT_PREVIEW_PLACEHOLDER = html.P("Run an optimization to preview export data", className="text-muted")
+NO_EXPORT_ASSIGNMENTS_PLACEHOLDER = html.P("No assignments to export", className="text-muted")
+
+
+def _build_paged_table(table_id: str, columns: List[str], header_color: str, font_size) -> dash_table.DataTable:
+    return dash_table.DataTable(
+        id=table_id,
+        columns=[{'name': col, 'id': col} for col in columns],
+        data=[],
+        page_action='custom',
+        page_current=0,
+        page_size=TABLE_PAGE_SIZE,
+        page_count=1,
+        sort_action='custom',
+        sort_mode='single',
+        sort_by=[],
+        style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': font_size},
+        style_header={'backgroundColor': header_color, 'color': 'white', 'fontWeight': 'bold'},
+        style_data_conditional=TABLE_STRIPED_ROWS
+    )
+
+
+_EXPORT_PREVIEWS = BoundedMemo(maxsize=4)
+_EXPORT_PREVIEW_FIELDS = itemgetter('vessel_id', 'port_id', 'plant_id', 'cargo_mt', 'eta_day')
+
+
+def _export_preview_fields(assign: Dict) -> tuple:
+    """(vessel, port, plant, cargo, eta) of an assignment, with defaults for absent keys."""
+    try:
+        return _EXPORT_PREVIEW_FIELDS(assign)
+    except KeyError:
+        return (assign.get('vessel_id', 'N/A'), assign.get('port_id', 'N/A'), assign.get('plant_id', 'N/A'),
+                assign.get('cargo_mt', 0), assign.get('eta_day', 'N/A'))
+
+
+def export_preview_rows(solution: Dict) -> List[Dict]:
+    """First few assignments formatted for the export preview, built once per plan."""
+    plan_key = solution_fingerprint(solution)
+    rows = _EXPORT_PREVIEWS.get(plan_key)
+    if rows is None:
+        head = solution.get('assignments', [])[:EXPORT_PREVIEW_ROWS]
+        rows = [
+            {'Vessel': vessel, 'Port': port, 'Plant': plant, 'Cargo (MT)': f"{cargo:,.0f}", 'ETA Day': eta}
+            for vessel, port, plant, cargo, eta in map(_export_preview_fields, head)
+        ]
+        _EXPORT_PREVIEWS.set(plan_key, rows)
+    return rows
+
+
+def cost_dot(quantities: np.ndarray, rates) -> float:
+    """Sum of quantity * rate as one fused dot product; unmatched (NaN) rates contribute nothing."""
+    rate_values = np.nan_to_num(pd.to_numeric(pd.Series(rates), errors='coerce').to_numpy(dtype=float))
+    return float(np.dot(quantities, rate_values))
+
+
+def page_table_frame(df: pd.DataFrame, page_current: Optional[int], page_size: Optional[int],
+                     sort_by: Optional[List[Dict]]):
+    """Sort and slice a frame for a page_action='custom' DataTable; returns (records, page_count)."""
+    if df.empty:
+        return [], 1
+
+    if sort_by:
+        sort_columns = [item['column_id'] for item in sort_by if item.get('column_id') in df.columns]
+        if sort_columns:
+            ascending = [item.get('direction') != 'desc' for item in sort_by if item.get('column_id') in df.columns]
+            try:
+                df = df.sort_values(sort_columns, ascending=ascending, kind='mergesort', na_position='last')
+            except TypeError:
+                # Mixed-type column; fall back to string ordering
+                df = df.sort_values(sort_columns, ascending=ascending, kind='mergesort',
+                                    key=lambda col: col.astype(str))
+
+    page_size = page_size or TABLE_PAGE_SIZE
+    page_count = max(1, math.ceil(len(df) / page_size))
+    page_current = min(page_current or 0, page_count - 1)
+    start = page_current * page_size
+    page = df.iloc[start:start + page_size]
+    return page.astype(object).where(page.notna(), None).to_dict('records'), page_count
+
+
+def schedule_details_frame(assignments_df: pd.DataFrame, vessels_df: pd.DataFrame) -> pd.DataFrame:
+    """Vessel/ETA/port/plant rows for the schedule details table."""
+    details = assignments_df[['vessel_id', 'port_id', 'plant_id']].set_axis(
+        ['Vessel', 'Port', 'Plant'], axis=1
+    ).fillna('N/A')
+    if not vessels_df.empty and 'eta_day' in vessels_df.columns:
+        eta_lookup = indexed_vessels(vessels_df)['eta_day']
+        details['ETA Day'] = pd.to_numeric(details['Vessel'].map(eta_lookup), errors='coerce').round(1)
+    else:
+        details['ETA Day'] = np.nan
+    return details[SCHEDULE_DETAIL_COLUMNS]
+
+
+def rake_details_frame(assignments_df: pd.DataFrame) -> pd.DataFrame:
+    """Renamed assignment columns for the rake assignment detail table."""
+    display_df = assignments_df.rename(columns={
+        'vessel_id': 'Vessel',
+        'port_id': 'Port',
+        'plant_id': 'Plant',
+        'cargo_mt': 'Cargo (MT)',
+        'rakes_required': 'Rakes Required',
+        'scheduled_day': 'Scheduled Day',
+        'berth_time': 'Berth Day',
+        'eta_day': 'ETA Day'
+    })
+    display_columns = [col for col in RAKE_DETAIL_COLUMNS if col in display_df.columns]
+    return display_df[display_columns]
+
+
+# KPI cards where a decrease is an improvement; everything else improves upward.
+_LOWER_IS_BETTER_KPIS = frozenset({'Total Cost', 'Demurrage Cost', 'Avg Vessel Wait'})
+# (lower_is_better, delta_is_negative) -> Bootstrap text colour
+_KPI_DELTA_COLORS = {
+    (True, True): "success",
+    (True, False): "danger",
+    (False, True): "danger",
+    (False, False): "success",
+}
+
+
+def kpi_delta_color(card_data: Dict) -> str:
+    """Bootstrap colour for a KPI card's change vs its comparison value."""
+    delta = card_data.get('delta')
+    if not delta:
+        return "secondary"
+    return _KPI_DELTA_COLORS[(card_data.get('title') in _LOWER_IS_BETTER_KPIS, delta < 0)]
+
+
+def _build_kpi_card_skeleton(card_data: Dict):
+    """KPI card with fixed slots (badge, value, delta) that update_kpi_cards patches in place."""
+    tooltip_content = html.Div([
+        html.H6(
+            card_data.get('tooltip_title', card_data['title']),
+            className="kpi-tooltip-title mb-2"
+        ),
+        html.Div([
+            html.Strong("Formula: "),
+            html.Span(card_data.get('formula', 'N/A'), className="kpi-tooltip-formula")
+        ], className="mb-2"),
+        html.P(
+            card_data.get('description', ''),
+            className="kpi-tooltip-description mb-2 small"
+        ),
+        html.Div([
+            html.Strong("Key factors", className="d-block mb-1"),
+            html.Ul(
+                [html.Li(factor, className="mb-1") for factor in card_data.get('factors', [])],
+                className="kpi-tooltip-factors ps-3 mb-0"
+            )
+        ])
+    ], className="kpi-tooltip")
+
+    return dbc.Col([
+        dbc.Card(
+            dbc.CardBody(
+                [
+                    tooltip_content,
+                    html.Div(),
+                    html.Div(
+                        [
+                            html.H3("—", className="kpi-value mb-1"),
+                            html.P(card_data['title'], className="text-muted mb-1 fw-semibold"),
+                            html.Div()
+                        ],
+                        className="text-center",
+                        style={'position': 'relative', 'zIndex': 1}
+                    )
+                ],
+                style={'position': 'relative'}
+            ),
+            className=f"kpi-card kpi-card-{card_data['color']} h-100",
+            style={'minHeight': '200px'}
+        )
+    ], width=2)
+
+
+_KPI_CARD_SKELETON = [
+    _build_kpi_card_skeleton(card_data)
+    for card_data in LogisticsVisualizer.create_kpi_cards({})
+]
+
+
+@lru_cache(maxsize=None)
 def create_overview_tab():
     """Create overview tab content"""
     return html.Div([
         # KPI Cards Row
-        dbc.Row(id="kpi-cards-row", className="mb-4"),
+        dbc.Row(_KPI_CARD_SKELETON, id="kpi-cards-row", className="mb-4"),
         
         # Charts Row
         dbc.Row([
@@ -536,6 +1328,7 @@ def create_overview_tab():
         ])
     ])
 
+@lru_cache(maxsize=None)
 def create_gantt_tab():
     """Create Gantt chart tab content"""
     return html.Div([
@@ -572,7 +1365,7 @@ def create_gantt_tab():
                         className="d-flex align-items-center"
                     ),
                     dbc.CardBody([
-                        dcc.Graph(id="gantt-chart", style={"height": "600px"})
+                        dcc.Graph(id="gantt-chart", className="chart-h-600")
                     ])
                 ])
             ], width=12)
@@ -583,7 +1376,10 @@ def create_gantt_tab():
                 dbc.Card([
                     dbc.CardHeader("Schedule details"),
                     dbc.CardBody([
-                        html.Div(id="schedule-details")
+                        html.Div(
+                            _build_paged_table("schedule-details-table", SCHEDULE_DETAIL_COLUMNS, '#343a40', '13px'),
+                            id="schedule-details"
+                        )
                     ])
                 ])
             ], width=6),
@@ -598,6 +1394,7 @@ def create_gantt_tab():
         ])
     ])
 
+@lru_cache(maxsize=None)
 def create_cost_tab():
     """Create cost breakdown tab content"""
     return html.Div([
@@ -611,7 +1408,7 @@ def create_cost_tab():
                             "Use the chart to pinpoint where scenario changes drive savings or penalties.",
                             className="text-muted small"
                         ),
-                        dcc.Graph(id="cost-breakdown-chart", style={"height": "420px"})
+                        dcc.Graph(id="cost-breakdown-chart", className="chart-h-420")
                     ])
                 ])
             ], width=8),
@@ -630,13 +1427,14 @@ def create_cost_tab():
                 dbc.Card([
                     dbc.CardHeader("Cost timeline and baseline comparison"),
                     dbc.CardBody([
-                        dcc.Graph(id="cost-timeline-chart", style={"height": "400px"})
+                        dcc.Graph(id="cost-timeline-chart", className="chart-h-400")
                     ])
                 ])
             ], width=12)
         ])
     ])
 
+@lru_cache(maxsize=None)
 def create_rake_tab():
     """Create rake dashboard tab content"""
     return html.Div([
@@ -649,7 +1447,7 @@ def create_rake_tab():
                             "Assess rake loading intensity across the horizon. Darker cells indicate higher trip counts per port/plant pair.",
                             className="text-muted small"
                         ),
-                        dcc.Graph(id="rake-heatmap", style={"height": "400px"})
+                        dcc.Graph(id="rake-heatmap", className="chart-h-400")
                     ])
                 ])
             ], width=8),
@@ -668,7 +1466,10 @@ def create_rake_tab():
                 dbc.Card([
                     dbc.CardHeader("Rake assignment detail"),
                     dbc.CardBody([
-                        html.Div(id="rake-assignment-table")
+                        html.Div(
+                            _build_paged_table("rake-assignment-datatable", RAKE_DETAIL_COLUMNS, '#0d6efd', 12),
+                            id="rake-assignment-table"
+                        )
                     ])
                 ])
             ], width=12)
@@ -676,6 +1477,7 @@ def create_rake_tab():
     ])
 
 
+@lru_cache(maxsize=None)
 def create_simulation_tab():
     """Create simulation comparator tab content"""
     return html.Div([
@@ -729,7 +1531,7 @@ def create_simulation_tab():
                     children=dbc.Card([
                         dbc.CardHeader("Plan vs simulated cost structure", className="fw-semibold"),
                         dbc.CardBody([
-                            dcc.Graph(id="simulation-performance-chart", style={"height": "380px"})
+                            dcc.Graph(id="simulation-performance-chart", className="chart-h-380")
                         ])
                     ])
                 )
@@ -766,6 +1568,103 @@ def create_simulation_tab():
         ])
     ])
 
+@lru_cache(maxsize=None)
+def create_whatif_tab():
+    """Create what-if analysis tab"""
+    return html.Div([
+        dbc.Alert([
+            html.H6("Scenario comparison", className="mb-2"),
+            html.P(
+                "Use this workspace to evaluate the financial and operational impact of alternate planning assumptions. "
+                "Run multiple scenarios from the control panel, then review their KPIs and cost differentials side by side.",
+                className="mb-0"
+            )
+        ], color="light", className="mb-3 border"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Scenario summary"),
+                    dbc.CardBody([
+                        html.Div(id="scenario-comparison-summary")
+                    ])
+                ])
+            ], width=12)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Scenario impact analysis"),
+                    dbc.CardBody([
+                        dcc.Graph(id="scenario-comparison-chart", className="chart-h-500")
+                    ])
+                ])
+            ], width=12)
+        ])
+    ])
+
+@lru_cache(maxsize=None)
+def create_logs_tab():
+    """Create logs and export tab"""
+    return html.Div([
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Optimization logs"),
+                    dbc.CardBody([
+                        html.Div(id="solver-logs", className="scroll-panel")
+                    ])
+                ])
+            ], width=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Audit trail"),
+                    dbc.CardBody([
+                        html.Div(id="audit-trail")
+                    ])
+                ])
+            ], width=6)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Export deliverables"),
+                    dbc.CardBody([
+                        dbc.Alert(
+                            "Downloads become available after a plan is generated. Run baseline and optimized plans first. Use the buttons here for quick CSVs, or the sidebar export controls for a zipped planning bundle.",
+                            color="light",
+                            className="mb-3 border"
+                        ),
+                        html.H6("Download planning outputs", className="mb-3"),
+                        dbc.ButtonGroup([
+                            dbc.Button("Dispatch plan (CSV)", id="download-dispatch-csv", color="primary", className="mb-2"),
+                            dbc.Button("SAP upload template", id="download-sap-format", color="secondary", className="mb-2"),
+                            dbc.Button("Full JSON report", id="download-full-report", color="info", className="mb-2")
+                        ], vertical=True, className="w-100"),
+                        html.Hr(),
+                        html.H6("Preview sample rows", className="mt-3"),
+                        html.Div(id="export-preview")
+                    ])
+                ])
+            ], width=12)
+        ])
+    ])
+
+
+# Tab panes are rendered once at import and shown/hidden client-side.
+TAB_PANES = [
+    ("overview", create_overview_tab),
+    ("gantt", create_gantt_tab),
+    ("costs", create_cost_tab),
+    ("rakes", create_rake_tab),
+    ("simcompare", create_simulation_tab),
+    ("whatif", create_whatif_tab),
+    ("logs", create_logs_tab),
+]
+_TAB_LAYOUTS = {tab_id: builder() for tab_id, builder in TAB_PANES}
+
 # App Layout
 app.layout = dbc.Container([
     create_header(),
@@ -779,10 +1678,16 @@ app.layout = dbc.Container([
         ], width=9)
     ]),
     
-    # Hidden divs for storing data
-    html.Div(id="stored-data", style={"display": "none"}),
-    html.Div(id="stored-solution", style={"display": "none"}),
-    html.Div(id="stored-simulation", style={"display": "none"}),
+    # In-memory stores for dataset, plan, and simulation payloads
+    dcc.Store(id="stored-data", storage_type="memory"),
+    dcc.Store(id="stored-solution", storage_type="memory"),
+    dcc.Store(id="stored-simulation", storage_type="memory"),
+    dcc.Store(id="stored-baseline", storage_type="memory"),
+    # Input fingerprints behind the currently rendered summary table and gantt chart
+    dcc.Store(id="data-summary-rendered", storage_type="memory"),
+    dcc.Store(id="gantt-rendered", storage_type="memory"),
+    dcc.Store(id="logs-rendered", storage_type="memory"),
+    dcc.Store(id="export-preview-rendered", storage_type="memory"),
 
     dbc.Modal(
         [
@@ -792,7 +1697,7 @@ app.layout = dbc.Container([
             ),
             dbc.ModalBody([
                 html.Div(id="modal-scenario-summary", className="mb-3"),
-                dcc.Graph(id="modal-scenario-chart", style={"height": "320px"}),
+                dcc.Graph(id="modal-scenario-chart", className="chart-h-320"),
                 html.Div(id="modal-scenario-meta", className="small mt-3")
             ]),
             dbc.ModalFooter(
@@ -812,17 +1717,14 @@ app.layout = dbc.Container([
     dcc.Download(id="download-sap-file"),
     dcc.Download(id="download-full-report-file"),
     dcc.Download(id="download-gantt-csv"),
-    dcc.Download(id="sample-csv-download"),
-    
-    # Interval component for progress updates
-    dcc.Interval(id="progress-interval", interval=1000, n_intervals=0, disabled=True)
+    dcc.Download(id="sample-csv-download")
     
 ], fluid=True)
 
 # Callbacks
 
 @app.callback(
-    [Output("stored-data", "children"),
+    [Output("stored-data", "data"),
      Output("data-status", "children"),
      Output("spike-plant", "options")],
     [Input("load-sample-btn", "n_clicks"),
@@ -831,8 +1733,6 @@ app.layout = dbc.Container([
 )
 def load_data(load_sample_clicks, upload_contents, upload_filenames):
     """Load sample data or process uploaded files"""
-    global current_data
-    
     ctx = callback_context
     if not ctx.triggered:
         return None, "", []
@@ -840,28 +1740,17 @@ def load_data(load_sample_clicks, upload_contents, upload_filenames):
     trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
     
     if trigger_id == "load-sample-btn" and load_sample_clicks:
-        # Load sample data
-        set_global_seed(BASE_RANDOM_SEED, quiet=True)
-        current_data = DataLoader.get_toy_dataset()
-        # Restore the base seed so downstream stages start from the same RNG state
-        set_global_seed(BASE_RANDOM_SEED, quiet=True)
-        
+        # Sample data is generated and cached at import
         status = dbc.Alert("Sample data loaded successfully.", color="success")
         
-        # Plant options for spike scenario
-        plant_options = [
-            {"label": row['plant_name'], "value": row['plant_id']} 
-            for _, row in current_data['plants'].iterrows()
-        ]
-        
-        return json.dumps({k: v.to_dict('records') for k, v in current_data.items()}), status, plant_options
+        return _SAMPLE_DATA_STORE, status, _SAMPLE_PLANT_OPTIONS
     
     elif trigger_id == "upload-data" and upload_contents:
         # Process uploaded files
         try:
             uploaded_data = {}
-            for content, filename in zip(upload_contents, upload_filenames):
-                df = DataLoader.parse_uploaded_file(content, filename)
+            parsed_frames = DataLoader.parse_uploaded_files(upload_contents, upload_filenames)
+            for df, filename in zip(parsed_frames, upload_filenames):
                 if df is not None:
                     # Determine dataset type from filename
                     if 'vessel' in filename.lower():
@@ -879,18 +1768,15 @@ def load_data(load_sample_clicks, upload_contents, upload_filenames):
             is_valid, errors = DataLoader.validate_csv_data(cleaned_data)
             
             if is_valid:
-                current_data = cleaned_data
+                dataset = cleaned_data
                 status = dbc.Alert(
                     f"Uploaded {len(uploaded_data)} datasets successfully.",
                     color="success"
                 )
                 
-                plant_options = [
-                    {"label": row.get('plant_name', row['plant_id']), "value": row['plant_id']} 
-                    for _, row in current_data['plants'].iterrows()
-                ]
+                plant_options = build_plant_options(dataset['plants'])
                 
-                return json.dumps({k: v.to_dict('records') for k, v in current_data.items()}), status, plant_options
+                return store_dataset(dataset), status, plant_options
             else:
                 status = dbc.Alert(
                     html.Div([html.Strong("Data checks:"), html.Ul([html.Li(err) for err in errors])]),
@@ -904,133 +1790,43 @@ def load_data(load_sample_clicks, upload_contents, upload_filenames):
             
             return None, status, []
     
-    return None, "", []
-
-# Toggle CSV guide
-@app.callback(
-    Output("csv-guide-collapse", "is_open"),
-    [Input("csv-guide-btn", "n_clicks")],
-    [State("csv-guide-collapse", "is_open")]
-)
-def toggle_csv_guide(n_clicks, is_open):
-    """Toggle CSV format guide"""
-    if n_clicks:
-        return not is_open
-    return is_open
-
-@app.callback(
-    Output("tab-content", "children"),
-    [Input("main-tabs", "active_tab")]
-)
-def render_tab_content(active_tab):
-    """Render content based on active tab"""
-    if active_tab == "overview":
-        return create_overview_tab()
-    elif active_tab == "gantt":
-        return create_gantt_tab()
-    elif active_tab == "costs":
-        return create_cost_tab()
-    elif active_tab == "rakes":
-        return create_rake_tab()
-    elif active_tab == "simcompare":
-        return create_simulation_tab()
-    elif active_tab == "whatif":
-        return create_whatif_tab()
-    elif active_tab == "logs":
-        return create_logs_tab()
-    else:
-        return html.Div("Select a tab to view content")
-
-def create_whatif_tab():
-    """Create what-if analysis tab"""
-    return html.Div([
-        dbc.Alert([
-            html.H6("Scenario comparison", className="mb-2"),
-            html.P(
-                "Use this workspace to evaluate the financial and operational impact of alternate planning assumptions. "
-                "Run multiple scenarios from the control panel, then review their KPIs and cost differentials side by side.",
-                className="mb-0"
-            )
-        ], color="light", className="mb-3 border"),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Scenario summary"),
-                    dbc.CardBody([
-                        html.Div(id="scenario-comparison-summary")
-                    ])
-                ])
-            ], width=12)
-        ], className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Scenario impact analysis"),
-                    dbc.CardBody([
-                        dcc.Graph(id="scenario-comparison-chart", style={"height": "500px"})
-                    ])
-                ])
-            ], width=12)
-        ])
-    ])
+    return None, "", []
 
-def create_logs_tab():
-    """Create logs and export tab"""
-    return html.Div([
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Optimization logs"),
-                    dbc.CardBody([
-                        html.Div(id="solver-logs", style={"maxHeight": "300px", "overflowY": "auto"})
-                    ])
-                ])
-            ], width=6),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Audit trail"),
-                    dbc.CardBody([
-                        html.Div(id="audit-trail")
-                    ])
-                ])
-            ], width=6)
-        ], className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Export deliverables"),
-                    dbc.CardBody([
-                        dbc.Alert(
-                            "Downloads become available after a plan is generated. Run baseline and optimized plans first. Use the buttons here for quick CSVs, or the sidebar export controls for a zipped planning bundle.",
-                            color="light",
-                            className="mb-3 border"
-                        ),
-                        html.H6("Download planning outputs", className="mb-3"),
-                        dbc.ButtonGroup([
-                            dbc.Button("Dispatch plan (CSV)", id="download-dispatch-csv", color="primary", className="mb-2"),
-                            dbc.Button("SAP upload template", id="download-sap-format", color="secondary", className="mb-2"),
-                            dbc.Button("Full JSON report", id="download-full-report", color="info", className="mb-2")
-                        ], vertical=True, className="w-100"),
-                        html.Hr(),
-                        html.H6("Preview sample rows", className="mt-3"),
-                        html.Div(id="export-preview")
-                    ])
-                ])
-            ], width=12)
-        ])
-    ])
+# Toggle CSV guide and switch tabs in the browser; both are pure UI state.
+app.clientside_callback(
+    """
+    function(n_clicks, is_open) {
+        return n_clicks ? !is_open : is_open;
+    }
+    """,
+    Output("csv-guide-collapse", "is_open"),
+    [Input("csv-guide-btn", "n_clicks")],
+    [State("csv-guide-collapse", "is_open")]
+)
+
+app.clientside_callback(
+    """
+    function(active_tab) {
+        var tabIds = %s;
+        return tabIds.map(function(tabId) {
+            return tabId === active_tab ? {"display": "block"} : {"display": "none"};
+        });
+    }
+    """ % orjson.dumps([tab_id for tab_id, _ in TAB_PANES]).decode(),
+    [Output(f"tab-pane-{tab_id}", "style") for tab_id, _ in TAB_PANES],
+    [Input("main-tabs", "active_tab")]
+)
 
 @app.callback(
-    [Output("stored-solution", "children"),
+    [Output("stored-solution", "data"),
+     Output("stored-baseline", "data"),
      Output("action-status", "children"),
      Output("action-status", "color"),
      Output("action-status", "style")],
     [Input("run-baseline-btn", "n_clicks"),
      Input("run-optimized-btn", "n_clicks")],
-    [State("stored-data", "children"),
+    [State("stored-data", "data"),
+     State("stored-baseline", "data"),
      State("optimization-method", "value"),
      State("solver-selection", "value"),
      State("time-limit", "value"),
@@ -1038,17 +1834,25 @@ def create_logs_tab():
      State("eta-delay-scenario", "value"),
      State("rake-reduction", "value"),
      State("demand-spike", "value"),
-     State("spike-plant", "value")]
+     State("spike-plant", "value")],
+    background=True,
+    running=[
+        (Output("run-baseline-btn", "disabled"), True, False),
+        (Output("run-optimized-btn", "disabled"), True, False),
+        (Output("cancel-run-btn", "style"), {"display": "block"}, {"display": "none"}),
+        (Output("action-progress", "style"), {"display": "block"}, {"display": "none"})
+    ],
+    cancel=[Input("cancel-run-btn", "n_clicks")],
+    progress=Output("action-progress", "children"),
+    prevent_initial_call=True
 )
-def run_optimization(baseline_clicks, optimized_clicks, stored_data, opt_method, 
+def run_optimization(set_progress, baseline_clicks, optimized_clicks, stored_data, stored_baseline, opt_method,
                     solver, time_limit, ga_generations, eta_delay, rake_reduction, 
                     demand_spike, spike_plant):
     """Run optimization based on selected method"""
-    global current_solution, baseline_solution
-    
     ctx = callback_context
     if not ctx.triggered or not stored_data:
-        return None, "", "light", {"display": "none"}
+        return None, dash.no_update, "", "light", {"display": "none"}
     
     trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
@@ -1075,9 +1879,13 @@ def run_optimization(baseline_clicks, optimized_clicks, stored_data, opt_method,
         ga_generations = 40
     
     try:
-        # Reconstruct data from stored JSON
-        data_dict = json.loads(stored_data)
-        data = {k: pd.DataFrame(v) for k, v in data_dict.items()}
+        # Resolve the dataset referenced by the stored token
+        data = get_data_frames(stored_data)
+        if not data and dataset_expired(stored_data):
+            return dash.no_update, dash.no_update, html.Div(DATASET_EXPIRED_MESSAGE), "warning", {"display": "block"}
+        data_key = dataset_fingerprint(stored_data)
+        scenario_settings = [eta_delay, rake_reduction, demand_spike, spike_plant]
+        baseline_output = dash.no_update
         
         # Apply scenario modifications
         if eta_delay != "none":
@@ -1091,16 +1899,21 @@ def run_optimization(baseline_clicks, optimized_clicks, stored_data, opt_method,
         
         if trigger_id == "run-baseline-btn":
             # Run baseline FCFS solution
+            set_progress("Building baseline FCFS plan...")
             status_msg = html.Div("Running baseline FCFS optimization...")
             status_color = "info"
             
-            milp_optimizer = MILPOptimizer(data)
-            solution = milp_optimizer.create_baseline_solution()
-            solution['rng_seed'] = active_seed
-            solution = attach_solution_kpis(solution, data)
-            solution = make_json_safe(solution)
-            baseline_solution = solution
-            current_solution = solution
+            cache_key = make_cache_key("plan", data_key, "baseline", scenario_settings)
+            solution = cache.get(cache_key)
+            if solution is None:
+                milp_optimizer = _milp_optimizer_cls()(data)
+                solution = milp_optimizer.create_baseline_solution()
+                solution['rng_seed'] = active_seed
+                solution['plan_id'] = cache_key
+                solution = attach_solution_kpis(solution, data)
+                solution = make_json_safe(solution)
+                cache.set(cache_key, solution, timeout=PLAN_CACHE_TIMEOUT)
+            baseline_output = solution
             
             status_msg = html.Div(
                 f"Baseline plan completed. Cost: {format_currency(solution.get('objective_value', 0))}"
@@ -1112,52 +1925,69 @@ def run_optimization(baseline_clicks, optimized_clicks, stored_data, opt_method,
             status_msg = html.Div(f"Running {opt_method.upper()} optimization...")
             status_color = "info"
             
-            if opt_method == "milp":
-                milp_optimizer = MILPOptimizer(data)
-                solution = milp_optimizer.solve_milp(solver, time_limit)
-                
-            elif opt_method == "ga":
-                heuristic_optimizer = HeuristicOptimizer(data)
-                solution = heuristic_optimizer.run_genetic_algorithm(
-                    population_size=30, generations=ga_generations
-                )
-                
-            elif opt_method == "milp_ga":
-                # MILP + GA pipeline
-                milp_optimizer = MILPOptimizer(data)
-                milp_solution = milp_optimizer.solve_milp(solver, time_limit // 2)
-                
-                heuristic_optimizer = HeuristicOptimizer(data)
-                solution = heuristic_optimizer.run_genetic_algorithm(
-                    population_size=20, generations=ga_generations // 2,
-                    seed_solution=milp_solution.get('assignments', [])
-                )
-                
-            elif opt_method == "hybrid":
-                # Full hybrid pipeline: MILP + GA + SA
-                milp_optimizer = MILPOptimizer(data)
-                milp_solution = milp_optimizer.solve_milp(solver, time_limit // 3)
-                
-                heuristic_optimizer = HeuristicOptimizer(data)
-                ga_solution = heuristic_optimizer.run_genetic_algorithm(
-                    population_size=20, generations=ga_generations // 2,
-                    seed_solution=milp_solution.get('assignments', [])
-                )
-                
-                solution = heuristic_optimizer.run_simulated_annealing(
-                    ga_solution, max_iterations=500
-                )
+            cache_key = make_cache_key(
+                "plan", data_key, "optimized", scenario_settings,
+                opt_method, solver, time_limit, ga_generations
+            )
+            solution = cache.get(cache_key)
+            if solution is None:
+                if opt_method == "milp":
+                    set_progress(f"Solving MILP with {solver} (limit {time_limit}s)...")
+                    milp_optimizer = _milp_optimizer_cls()(data)
+                    solution = milp_optimizer.solve_milp(solver, time_limit)
             
-            if isinstance(solution, dict):
-                solution['rng_seed'] = active_seed
-            solution = attach_solution_kpis(solution, data)
-            solution = make_json_safe(solution)
-            current_solution = solution
+                elif opt_method == "ga":
+                    set_progress(f"Running genetic algorithm ({ga_generations} generations)...")
+                    heuristic_optimizer = _heuristic_optimizer_cls()(data)
+                    solution = heuristic_optimizer.run_island_genetic_algorithm(
+                        population_size=30, generations=ga_generations,
+                        progress_callback=set_progress
+                    )
             
+                elif opt_method == "milp_ga":
+                    # MILP + GA pipeline
+                    set_progress("Step 1/2: solving MILP warm start...")
+                    milp_optimizer = _milp_optimizer_cls()(data)
+                    milp_solution = milp_optimizer.solve_milp(solver, time_limit // 2)
+            
+                    set_progress("Step 2/2: refining with genetic algorithm...")
+                    heuristic_optimizer = _heuristic_optimizer_cls()(data)
+                    solution = heuristic_optimizer.run_island_genetic_algorithm(
+                        population_size=20, generations=ga_generations // 2,
+                        seed_solution=milp_solution.get('assignments', []),
+                        progress_callback=lambda message: set_progress(f"Step 2/2: {message}")
+                    )
+            
+                elif opt_method == "hybrid":
+                    # Full hybrid pipeline: MILP + GA + SA
+                    set_progress("Step 1/3: solving MILP warm start...")
+                    milp_optimizer = _milp_optimizer_cls()(data)
+                    milp_solution = milp_optimizer.solve_milp(solver, time_limit // 3)
+            
+                    set_progress("Step 2/3: refining with genetic algorithm...")
+                    heuristic_optimizer = _heuristic_optimizer_cls()(data)
+                    ga_solution = heuristic_optimizer.run_island_genetic_algorithm(
+                        population_size=20, generations=ga_generations // 2,
+                        seed_solution=milp_solution.get('assignments', []),
+                        progress_callback=lambda message: set_progress(f"Step 2/3: {message}")
+                    )
+            
+                    set_progress("Step 3/3: polishing with parallel simulated annealing chains...")
+                    solution = heuristic_optimizer.run_parallel_simulated_annealing(
+                        ga_solution, max_iterations=500
+                    )
+        
+                if isinstance(solution, dict):
+                    solution['rng_seed'] = active_seed
+                    solution['plan_id'] = cache_key
+                solution = attach_solution_kpis(solution, data)
+                solution = make_json_safe(solution)
+                cache.set(cache_key, solution, timeout=PLAN_CACHE_TIMEOUT)
             # Calculate savings if baseline exists
             savings_msg = ""
-            if baseline_solution:
-                baseline_cost = baseline_solution.get('objective_value', 0)
+            baseline_totals = plan_totals(stored_baseline)
+            if baseline_totals:
+                baseline_cost = baseline_totals[0]
                 optimized_cost = solution.get('objective_value', 0)
                 
                 # Sanity checks
@@ -1185,28 +2015,35 @@ def run_optimization(baseline_clicks, optimized_clicks, stored_data, opt_method,
             )
             status_color = "success"
         
-        # Store solution
-        solution_json = json.dumps(solution, default=str)
-        
-        return solution_json, status_msg, status_color, {"display": "block"}
+        # Assignments travel to the store as a compressed Arrow table
+        if baseline_output is not dash.no_update:
+            baseline_output = pack_solution_payload(baseline_output)
+        return pack_solution_payload(solution), baseline_output, status_msg, status_color, {"display": "block"}
         
     except Exception as e:
         error_msg = html.Div(f"Error: {str(e)}")
-        return None, error_msg, "danger", {"display": "block"}
+        return None, dash.no_update, error_msg, "danger", {"display": "block"}
 
 @app.callback(
-    [Output("stored-simulation", "children"),
+    [Output("stored-simulation", "data"),
      Output("simulation-status", "children"),
      Output("simulation-status", "color"),
      Output("simulation-status", "style")],
     [Input("run-simulation-btn", "n_clicks")],
-    [State("stored-data", "children"),
-     State("stored-solution", "children")]
+    [State("stored-data", "data"),
+     State("stored-solution", "data")],
+    background=True,
+    running=[
+        (Output("run-simulation-btn", "disabled"), True, False),
+        (Output("cancel-run-btn", "style"), {"display": "block"}, {"display": "none"}),
+        (Output("simulation-progress", "style"), {"display": "block"}, {"display": "none"})
+    ],
+    cancel=[Input("cancel-run-btn", "n_clicks")],
+    progress=Output("simulation-progress", "children"),
+    prevent_initial_call=True
 )
-def run_simulation(simulation_clicks, stored_data, stored_solution):
+def run_simulation(set_progress, simulation_clicks, stored_data, stored_solution):
     """Run discrete-time simulation"""
-    global current_simulation, current_solution
-
     if not simulation_clicks or not stored_data or not stored_solution:
         return None, "", "light", {"display": "none"}
 
@@ -1215,34 +2052,35 @@ def run_simulation(simulation_clicks, stored_data, stored_solution):
 
     try:
         data = get_data_frames(stored_data)
+        if not data and dataset_expired(stored_data):
+            return dash.no_update, DATASET_EXPIRED_MESSAGE, "warning", {"display": "block"}
         solution = parse_solution_payload(stored_solution)
         assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
 
         if not assignments:
             print("Simulation skipped: no vessel assignments available.")
-            current_simulation = None
-            return json.dumps({
+            return {
                 "status": "no_assignments",
                 "message": "Run a baseline or optimized plan before simulating."
-            }), "No assignments available. Generate a plan first.", "warning", {"display": "block"}
-
-        simulator = LogisticsSimulator(data, time_step_hours=6)
-        simulation_results = simulator.run_simulation(assignments, simulation_days=30)
-        simulation_results = make_json_safe(simulation_results)
-        if isinstance(simulation_results, dict):
-            simulation_results['rng_seed'] = active_seed
-
-        current_simulation = simulation_results
-
-        if current_solution:
-            enriched_solution = attach_solution_kpis(current_solution, data, simulation_results)
-            current_solution = make_json_safe(enriched_solution)
+            }, "No assignments available. Generate a plan first.", "warning", {"display": "block"}
+
+        cache_key = make_cache_key("simulation", dataset_fingerprint(stored_data), assignments)
+        simulation_results = cache.get(cache_key)
+        if simulation_results is None:
+            set_progress(f"Simulating {len(assignments)} vessel assignments over 30 days...")
+            simulator = _simulator_cls()(data, time_step_hours=6)
+            simulation_results = simulator.run_simulation(assignments, simulation_days=30)
+            simulation_results = make_json_safe(simulation_results)
+            if isinstance(simulation_results, dict):
+                simulation_results['rng_seed'] = active_seed
+                simulation_results['run_id'] = cache_key
 
         message = f"Simulation completed for {len(assignments)} vessel assignments."
         if isinstance(simulation_results, dict) and simulation_results.get('simulation_days'):
             message += f" Horizon evaluated: {simulation_results['simulation_days']} days."
 
-        return json.dumps(simulation_results), message, "info", {"display": "block"}
+        # The full event log stays server-side; the store only carries a reference to it
+        return stash_result(simulation_results, cache_key), message, "info", {"display": "block"}
 
     except Exception as e:
         print(f"Simulation error: {e}")
@@ -1253,9 +2091,9 @@ def run_simulation(simulation_clicks, stored_data, stored_solution):
     Output("download-dispatch-csv-file", "data"),
     [Input("download-dispatch-csv", "n_clicks"),
      Input("export-csv-btn", "n_clicks")],
-    [State("stored-solution", "children"),
-     State("stored-simulation", "children"),
-     State("stored-data", "children")],
+    [State("stored-solution", "data"),
+     State("stored-simulation", "data"),
+     State("stored-data", "data")],
     prevent_initial_call=True
 )
 def download_dispatch_csv(_export_logs_clicks, _export_sidebar_clicks, stored_solution, stored_simulation, stored_data):
@@ -1282,8 +2120,8 @@ def download_dispatch_csv(_export_logs_clicks, _export_sidebar_clicks, stored_so
     Output("download-sap-file", "data"),
     [Input("download-sap-format", "n_clicks"),
      Input("export-sap-btn", "n_clicks")],
-    [State("stored-solution", "children"),
-     State("stored-data", "children")],
+    [State("stored-solution", "data"),
+     State("stored-data", "data")],
     prevent_initial_call=True
 )
 def download_sap_format(_export_logs_clicks, _export_sidebar_clicks, stored_solution, stored_data):
@@ -1311,60 +2149,64 @@ def download_sap_format(_export_logs_clicks, _export_sidebar_clicks, stored_solu
 @app.callback(
     Output("download-full-report-file", "data"),
     [Input("download-full-report", "n_clicks")],
-    [State("stored-solution", "children"), State("stored-simulation", "children")],
+    [State("stored-solution", "data"), State("stored-simulation", "data")],
     prevent_initial_call=True
 )
 def download_full_report(n_clicks, stored_solution, stored_simulation):
     if not n_clicks or not stored_solution:
         return None
     try:
-        solution = json.loads(stored_solution)
-        sim = json.loads(stored_simulation) if stored_simulation else {}
+        # The summary leaves assignments out, so skip rebuilding them from the packed table
+        solution = stored_solution if isinstance(stored_solution, dict) else parse_solution_payload(stored_solution)
+        sim = parse_solution_payload(stored_simulation) if stored_simulation else {}
         report = {
-            'solution_summary': {k: v for k, v in solution.items() if k != 'assignments'},
+            'solution_summary': {
+                k: v for k, v in solution.items() if k not in ('assignments', ASSIGNMENTS_IPC_KEY)
+            },
             'kpis': (sim.get('kpis') if sim else {}),
             'cost_components': (sim.get('cost_components') if sim else {}),
         }
-        import io
-        buf = io.StringIO()
-        import json as _json
-        buf.write(_json.dumps(report, indent=2))
-        return dict(content=buf.getvalue(), filename="full_report.json")
+        content = orjson.dumps(report, default=_json_fallback,
+                               option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        # orjson already produced UTF-8 bytes; send them as-is rather than decoding to str
+        return dcc.send_bytes(content, "full_report.json")
     except Exception:
         return None
 
+
+@app.callback(
+    Output("sample-csv-download", "data"),
+    [Input("download-templates-btn", "n_clicks")],
+    prevent_initial_call=True
+)
+def download_templates(n_clicks):
+    """Send the sample CSV templates as one zip"""
+    if not n_clicks:
+        return None
+    try:
+        return dcc.send_bytes(DataLoader.create_sample_csvs_zip(BASE_RANDOM_SEED), "sample_templates.zip")
+    except Exception as e:
+        print(f"Template download error: {e}")
+        return None
+
 @app.callback(
     Output("kpi-cards-row", "children"),
-    [Input("stored-solution", "children"),
-     Input("stored-simulation", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data"),
+     Input("stored-simulation", "data")],
+    [State("stored-data", "data"),
+     State("stored-baseline", "data")]
 )
-def update_kpi_cards(stored_solution, stored_simulation, stored_data):
+def update_kpi_cards(stored_solution, stored_simulation, stored_data, stored_baseline):
     """Update KPI cards in overview tab"""
     if not stored_solution:
-        return []
+        return _KPI_CARD_SKELETON
     
     try:
         solution = parse_solution_payload(stored_solution)
-        assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
-        simulation_results = json.loads(stored_simulation) if stored_simulation else None
-        data_frames = {}
-        if stored_data:
-            data_dict = json.loads(stored_data)
-            data_frames = {k: pd.DataFrame(v) for k, v in data_dict.items()}
-        vessels_df = data_frames.get('vessels', pd.DataFrame())
-        plants_df = data_frames.get('plants', pd.DataFrame())
-        ports_df = data_frames.get('ports', pd.DataFrame())
-        rail_costs_df = data_frames.get('rail_costs', pd.DataFrame())
-        
-        kpis = calculate_kpis(
-            assignments,
-            vessels_df,
-            plants_df,
-            simulation_results,
-            ports_df,
-            rail_costs_df
-        )
+        simulation_results = parse_solution_payload(stored_simulation) if stored_simulation else None
+        data_frames = get_data_frames(stored_data)
+
+        kpis = cached_kpis(solution, stored_data, data_frames, simulation_results)
         
         # If no simulation has been run yet, fall back to solution objective
         if not stored_simulation:
@@ -1373,29 +2215,16 @@ def update_kpi_cards(stored_solution, stored_simulation, stored_data):
         
         # Get baseline KPIs for comparison
         baseline_kpis = None
+        baseline_solution = parse_solution_payload(stored_baseline)
         if baseline_solution:
-            baseline_assignments = baseline_solution.get('assignments', [])
-            baseline_kpis = calculate_kpis(
-                baseline_assignments,
-                vessels_df,
-                plants_df,
-                None,
-                ports_df,
-                rail_costs_df
-            )
+            baseline_kpis = cached_kpis(baseline_solution, stored_data, data_frames)
         
-        # Create KPI cards
+        # Patch only the values that change; the card skeleton and tooltips stay put
         cards_data = LogisticsVisualizer.create_kpi_cards(kpis, baseline_kpis)
         
-        cards = []
-        for card_data in cards_data:
-            # Determine delta color
-            delta_color = "secondary"
-            if card_data['delta'] is not None and card_data['delta'] != 0:
-                if card_data['title'] in ['Total Cost', 'Demurrage Cost', 'Avg Vessel Wait']:
-                    delta_color = "success" if card_data['delta'] < 0 else "danger"
-                else:
-                    delta_color = "success" if card_data['delta'] > 0 else "danger"
+        patched = Patch()
+        for index, card_data in enumerate(cards_data):
+            delta_color = kpi_delta_color(card_data)
 
             delta_display = None
             if card_data['delta_pct'] is not None:
@@ -1404,139 +2233,104 @@ def update_kpi_cards(stored_solution, stored_simulation, stored_data):
                     className=f"text-{delta_color} small fw-semibold mt-1"
                 )
 
-            tooltip_content = html.Div([
-                html.H6(
-                    card_data.get('tooltip_title', card_data['title']),
-                    className="kpi-tooltip-title mb-2"
-                ),
-                html.Div([
-                    html.Strong("Formula: "),
-                    html.Span(card_data.get('formula', 'N/A'), className="kpi-tooltip-formula")
-                ], className="mb-2"),
-                html.P(
-                    card_data.get('description', ''),
-                    className="kpi-tooltip-description mb-2 small"
-                ),
-                html.Div([
-                    html.Strong("Key factors", className="d-block mb-1"),
-                    html.Ul(
-                        [html.Li(factor, className="mb-1") for factor in card_data.get('factors', [])],
-                        className="kpi-tooltip-factors ps-3 mb-0"
-                    )
-                ])
-            ], className="kpi-tooltip")
-
             card_classes = f"kpi-card kpi-card-{card_data['color']} h-100"
-            if card_data.get('is_demurrage') and card_data['raw_value'] > 0:
-                card_classes += " demurrage-card"
-
             demurrage_badge = None
             if card_data.get('is_demurrage') and card_data['raw_value'] > 0:
+                card_classes += " demurrage-card"
                 demurrage_badge = html.Div(
                     "Penalty exposure",
                     className="demurrage-badge text-uppercase",
                     style={'fontSize': '11px', 'padding': '4px 8px'}
                 )
 
-            metric_section_children = [
-                html.H3(card_data['value'], className="kpi-value mb-1"),
-                html.P(card_data['title'], className="text-muted mb-1 fw-semibold")
-            ]
-            if delta_display:
-                metric_section_children.append(delta_display)
-
-            card_body_children = [tooltip_content]
-            if demurrage_badge:
-                card_body_children.append(demurrage_badge)
-            card_body_children.append(
-                html.Div(
-                    metric_section_children,
-                    className="text-center",
-                    style={'position': 'relative', 'zIndex': 1}
-                )
-            )
-
-            card = dbc.Col([
-                dbc.Card(
-                    dbc.CardBody(
-                        card_body_children,
-                        style={'position': 'relative'}
-                    ),
-                    className=card_classes,
-                    style={'minHeight': '200px'}
-                )
-            ], width=2)
-            
-            cards.append(card)
+            card = patched[index]["props"]["children"][0]
+            card["props"]["className"] = card_classes
+            body = card["props"]["children"]["props"]["children"]
+            body[1]["props"]["children"] = demurrage_badge
+            metric = body[2]["props"]["children"]
+            metric[0]["props"]["children"] = card_data['value']
+            metric[2]["props"]["children"] = delta_display
         
-        return cards
+        return patched
         
     except Exception as e:
         print(f"KPI cards error: {e}")
-        return []
+        return _KPI_CARD_SKELETON
 
-def build_gantt_dataframe(stored_solution: Optional[str], stored_data: Optional[str]) -> pd.DataFrame:
+def _id_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Identifier column as a compact categorical, with missing values labelled 'Unknown'."""
+    if column not in df.columns:
+        return pd.Series('Unknown', index=df.index, dtype='category')
+    return df[column].fillna('Unknown').astype('category')
+
+
+def build_gantt_dataframe(stored_solution: Optional[Dict], stored_data: Optional[Dict]) -> pd.DataFrame:
     """Generate a normalized dataframe used by gantt chart and exports."""
     if not stored_solution or not stored_data:
         return pd.DataFrame()
 
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
+        solution = parse_solution_payload(stored_solution)
+        data_frames = get_data_frames(stored_data)
 
         assignments = solution.get('assignments', [])
         if not assignments:
             return pd.DataFrame()
 
-        vessels_df = pd.DataFrame(data_dict.get('vessels', []))
+        vessels_df = data_frames.get('vessels', pd.DataFrame())
         if vessels_df.empty:
             return pd.DataFrame()
 
-        rows = []
-        for assign in assignments:
-            vessel_id = assign.get('vessel_id', 'Unknown')
-            vessel_row = vessels_df[vessels_df['vessel_id'] == vessel_id]
-            if vessel_row.empty:
-                continue
+        if 'vessel_id' not in vessels_df.columns or 'eta_day' not in vessels_df.columns:
+            return pd.DataFrame()
 
-            eta_day = vessel_row.iloc[0].get('eta_day', 0)
-            try:
-                eta_day = float(eta_day)
-            except (TypeError, ValueError):
-                continue
+        eta_lookup = indexed_vessels(vessels_df)[['eta_day']]
+        adf = panel_assignments_frame(solution).drop(columns=['eta_day'], errors='ignore').join(eta_lookup, on='vessel_id', how='inner')
 
-            cargo_mt = assign.get('cargo_mt', 0)
-            try:
-                cargo_mt = float(cargo_mt)
-            except (TypeError, ValueError):
-                cargo_mt = 0.0
-
-            processing_days = max(1.0, cargo_mt / 10000.0) if cargo_mt else 1.0
-
-            rows.append({
-                'Vessel': vessel_id,
-                'Port': assign.get('port_id', 'Unknown'),
-                'Plant': assign.get('plant_id', 'Unknown'),
-                'CargoMT': cargo_mt,
-                'StartDay': eta_day,
-                'FinishDay': eta_day + processing_days,
-                'DurationDays': processing_days
-            })
+        start_day = pd.to_numeric(adf['eta_day'], errors='coerce')
+        adf = adf[start_day.notna()]
+        start_day = start_day[start_day.notna()].astype(float)
 
-        return pd.DataFrame(rows)
+        cargo_mt = adf['cargo_mt']
+        duration_days = np.maximum(1.0, cargo_mt / 10000.0)
+
+        return pd.DataFrame({
+            'Vessel': adf['vessel_id'].astype('category'),
+            'Port': _id_column(adf, 'port_id'),
+            'Plant': _id_column(adf, 'plant_id'),
+            'CargoMT': cargo_mt,
+            'StartDay': start_day,
+            'FinishDay': start_day + duration_days,
+            'DurationDays': duration_days
+        }).reset_index(drop=True)
 
     except Exception as e:
         print(f"Gantt data build error: {e}")
         return pd.DataFrame()
 
 
+# Above this many assignments the gantt chart switches from SVG bars to WebGL line segments.
+GANTT_WEBGL_THRESHOLD = 2000
+
+GANTT_PORT_COLORS = {
+    'HALDIA': '#007bff',
+    'PARADIP': '#28a745',
+    'VIZAG': '#ffc107',
+    'MUMBAI': '#dc3545',
+    'CHENNAI': '#17a2b8'
+}
+GANTT_DEFAULT_COLOR = '#6c757d'
+
+
 @app.callback(
-    Output("gantt-chart", "figure"),
-    [Input("stored-solution", "children"),
+    [Output("gantt-chart", "figure"),
+     Output("gantt-rendered", "data")],
+    [Input("stored-solution", "data"),
      Input("refresh-gantt-btn", "n_clicks")],
-    [State("stored-data", "children")]
+    [State("stored-data", "data"),
+     State("gantt-rendered", "data")]
 )
-def update_gantt_chart(stored_solution, refresh_clicks, stored_data):
+def update_gantt_chart(stored_solution, refresh_clicks, stored_data, rendered):
     """Update Gantt chart with detailed vessel schedules"""
     if not stored_solution or not stored_data:
         return go.Figure().add_annotation(
@@ -1544,8 +2338,16 @@ def update_gantt_chart(stored_solution, refresh_clicks, stored_data):
             xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False,
             font=dict(size=14, color="gray")
-        )
+        ), None
     
+    fingerprint = None
+    plan_id = stored_solution.get('plan_id') if isinstance(stored_solution, dict) else None
+    if plan_id:
+        fingerprint = f"{plan_id}|{dataset_fingerprint(stored_data)}"
+        # A re-stored identical plan keeps the current chart; the refresh button always redraws
+        if callback_context.triggered_id != "refresh-gantt-btn":
+            skip_if_rendered(fingerprint, rendered)
+
     try:
         gantt_df = build_gantt_dataframe(stored_solution, stored_data)
 
@@ -1554,40 +2356,65 @@ def update_gantt_chart(stored_solution, refresh_clicks, stored_data):
                 text="No vessel assignments found",
                 xref="paper", yref="paper",
                 x=0.5, y=0.5, showarrow=False
-            )
+            ), fingerprint
 
         # Create figure
         fig = go.Figure()
         
-        # Color map for ports
-        port_colors = {
-            'HALDIA': '#007bff',
-            'PARADIP': '#28a745',
-            'VIZAG': '#ffc107',
-            'MUMBAI': '#dc3545',
-            'CHENNAI': '#17a2b8'
-        }
-        
-        gantt_records = gantt_df.to_dict('records')
-        for i, row in enumerate(gantt_records):
-            color = port_colors.get(row['Port'], '#6c757d')
-            
+        # One trace per port with typed arrays instead of one trace per assignment
+        hovertemplate = (
+            "<b>%{y}</b><br>"
+            "Port: %{fullData.name}<br>"
+            "Plant: %{text}<br>"
+            "Cargo: %{customdata[0]:,.0f} MT<br>"
+            "Days %{customdata[1]:.1f} - %{customdata[2]:.1f}<br>"
+            "Duration: %{customdata[3]:.1f} days<extra></extra>"
+        )
+        use_webgl = len(gantt_df) > GANTT_WEBGL_THRESHOLD
+        for port, port_rows in gantt_df.groupby('Port', sort=False, observed=True):
+            start = port_rows['StartDay'].to_numpy(dtype=np.float32)
+            finish = port_rows['FinishDay'].to_numpy(dtype=np.float32)
+            customdata = np.column_stack([
+                port_rows['CargoMT'].to_numpy(dtype=np.float64),
+                start,
+                finish,
+                port_rows['DurationDays'].to_numpy(dtype=np.float32)
+            ])
+            if use_webgl:
+                # SVG bars stall the browser at this size; draw thick WebGL segments
+                # start -> finish per vessel, separated by NaN gaps
+                count = len(port_rows)
+                x = np.full(count * 3, np.nan, dtype=np.float32)
+                x[0::3], x[1::3] = start, finish
+                y = np.empty(count * 3, dtype=object)
+                y[0::3] = y[1::3] = port_rows['Vessel'].to_numpy()
+                fig.add_trace(go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode='lines',
+                    line=dict(color=GANTT_PORT_COLORS.get(port, GANTT_DEFAULT_COLOR), width=6),
+                    name=port,
+                    text=np.repeat(port_rows['Plant'].to_numpy(), 3),
+                    customdata=np.repeat(customdata, 3, axis=0),
+                    hovertemplate=hovertemplate
+                ))
+                continue
             fig.add_trace(go.Bar(
-                x=[row['FinishDay'] - row['StartDay']],
-                y=[row['Vessel']],
-                base=row['StartDay'],
+                x=finish - start,
+                y=port_rows['Vessel'].to_numpy(),
+                base=start,
                 orientation='h',
-                marker=dict(color=color),
-                name=row['Port'],
-                showlegend=(i == 0 or row['Port'] not in [gantt_records[j]['Port'] for j in range(i)]),
-                hovertemplate=f"<b>{row['Vessel']}</b><br>" +
-                             f"Port: {row['Port']}<br>" +
-                             f"Plant: {row['Plant']}<br>" +
-                             f"Cargo: {row['CargoMT']:,.0f} MT<br>" +
-                             f"Days {row['StartDay']:.1f} - {row['FinishDay']:.1f}<br>" +
-                             f"Duration: {row['DurationDays']:.1f} days<extra></extra>"
+                marker=dict(color=GANTT_PORT_COLORS.get(port, GANTT_DEFAULT_COLOR)),
+                name=port,
+                text=port_rows['Plant'].to_numpy(),
+                textposition='none',
+                customdata=customdata,
+                hovertemplate=hovertemplate
             ))
         
+        # Keep vessels in schedule order rather than grouped by port trace
+        fig.update_yaxes(categoryorder='array', categoryarray=gantt_df['Vessel'].drop_duplicates().to_numpy())
+        
         fig.update_layout(
             title="Vessel Processing Timeline",
             xaxis_title="Time (Days)",
@@ -1599,7 +2426,7 @@ def update_gantt_chart(stored_solution, refresh_clicks, stored_data):
             hovermode='closest'
         )
         
-        return fig
+        return fig, fingerprint
         
     except Exception as e:
         print(f"Gantt chart error: {e}")
@@ -1608,14 +2435,14 @@ def update_gantt_chart(stored_solution, refresh_clicks, stored_data):
             xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False,
             font=dict(size=12, color="red")
-        )
+        ), None
 
 
 @app.callback(
     Output("download-gantt-csv", "data"),
     [Input("export-gantt-btn", "n_clicks")],
-    [State("stored-solution", "children"),
-     State("stored-data", "children")],
+    [State("stored-solution", "data"),
+     State("stored-data", "data")],
     prevent_initial_call=True
 )
 def download_gantt_csv(n_clicks, stored_solution, stored_data):
@@ -1627,23 +2454,23 @@ def download_gantt_csv(n_clicks, stored_solution, stored_data):
         return None
 
     try:
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_buffer:
-            zip_buffer.writestr("gantt_schedule.csv", gantt_df.to_csv(index=False))
+        buffer = export_spool()
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_buffer:
+            write_zip_csv(zip_buffer, "gantt_schedule.csv", gantt_df)
 
-            port_summary = gantt_df.groupby('Port').agg(
+            port_summary = gantt_df.groupby('Port', observed=True).agg(
                 Vessels=('Vessel', 'count'),
                 TotalCargoMT=('CargoMT', 'sum'),
                 AvgDurationDays=('DurationDays', 'mean')
             ).reset_index()
-            zip_buffer.writestr("port_summary.csv", port_summary.to_csv(index=False))
+            write_zip_csv(zip_buffer, "port_summary.csv", port_summary)
 
-            plant_summary = gantt_df.groupby('Plant').agg(
+            plant_summary = gantt_df.groupby('Plant', observed=True).agg(
                 Vessels=('Vessel', 'count'),
                 TotalCargoMT=('CargoMT', 'sum'),
                 AvgDurationDays=('DurationDays', 'mean')
             ).reset_index()
-            zip_buffer.writestr("plant_summary.csv", plant_summary.to_csv(index=False))
+            write_zip_csv(zip_buffer, "plant_summary.csv", plant_summary)
 
             readme = [
                 "Gantt Schedule Export Package",
@@ -1655,60 +2482,54 @@ def download_gantt_csv(n_clicks, stored_solution, stored_data):
             ]
             zip_buffer.writestr("README.txt", "\n".join(readme))
 
-        buffer.seek(0)
-        return dcc.send_bytes(buffer.getvalue(), "gantt_schedule_export.zip")
+        return send_spooled(buffer, "gantt_schedule_export.zip")
     except Exception as e:
         print(f"Gantt export error: {e}")
         return None
 
 
 @app.callback(
-    [Output("schedule-details", "children"),
-     Output("schedule-summary", "children")],
-    [Input("stored-solution", "children")],
-    [State("stored-data", "children")]
+    [Output("schedule-details-table", "data"),
+     Output("schedule-details-table", "page_count")],
+    [Input("stored-solution", "data"),
+     Input("schedule-details-table", "page_current"),
+     Input("schedule-details-table", "page_size"),
+     Input("schedule-details-table", "sort_by")],
+    [State("stored-data", "data")]
+)
+def update_schedule_details_page(stored_solution, page_current, page_size, sort_by, stored_data):
+    """Serve one sorted page of the schedule details table."""
+    if not stored_solution or not stored_data:
+        return [], 1
+
+    try:
+        solution = parse_solution_payload(stored_solution)
+        vessels_df = get_data_frames(stored_data).get('vessels', pd.DataFrame())
+        details_df = schedule_details_frame(panel_assignments_frame(solution), vessels_df)
+        return page_table_frame(details_df, page_current, page_size, sort_by)
+    except Exception as e:
+        print(f"Schedule details error: {e}")
+        return [], 1
+
+
+@app.callback(
+    Output("schedule-summary", "children"),
+    [Input("stored-solution", "data")],
+    [State("stored-data", "data")]
 )
 def update_schedule_info(stored_solution, stored_data):
-    """Update schedule details and summary"""
+    """Update schedule summary"""
     if not stored_solution or not stored_data:
-        return "No schedule available", "No summary available"
+        return "No summary available"
     
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
-        assignments = solution.get('assignments', [])
-        vessels_df = pd.DataFrame(data_dict['vessels'])
-        
-        # Schedule details table
-        details_data = []
-        for assign in assignments[:10]:  # Show first 10
-            vessel_id = assign.get('vessel_id', 'N/A')
-            vessel_row = vessels_df[vessels_df['vessel_id'] == vessel_id]
-            eta = vessel_row.iloc[0]['eta_day'] if not vessel_row.empty else 'N/A'
-            
-            details_data.append({
-                'Vessel': vessel_id,
-                'ETA Day': f"{eta:.1f}" if isinstance(eta, (int, float)) else eta,
-                'Port': assign.get('port_id', 'N/A'),
-                'Plant': assign.get('plant_id', 'N/A')
-            })
-        
-        details_df = pd.DataFrame(details_data)
-        details_table = dash_table.DataTable(
-            data=details_df.to_dict('records'),
-            columns=[{'name': col, 'id': col} for col in details_df.columns],
-            style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '13px'},
-            style_header={'backgroundColor': '#343a40', 'color': 'white', 'fontWeight': 'bold'},
-            style_data_conditional=[
-                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}
-            ],
-            page_size=10
-        )
+        solution = parse_solution_payload(stored_solution)
+        view = solution_view(solution)
         
         # Summary stats
-        total_vessels = len(assignments)
-        ports_used = len(set(a.get('port_id') for a in assignments))
-        plants_served = len(set(a.get('plant_id') for a in assignments))
+        total_vessels = len(view.assignments_df)
+        ports_used = view.port_counts.size
+        plants_served = view.plant_counts.size
         
         summary = html.Div([
             html.H6("Schedule statistics", className="mb-3"),
@@ -1733,12 +2554,12 @@ def update_schedule_info(stored_solution, stored_data):
             ])
         ])
         
-        return details_table, summary
+        return summary
         
     except Exception as e:
-        return f"Error: {str(e)}", f"Error: {str(e)}"
+        return f"Error: {str(e)}"
 
-def prepare_scenario_comparison(stored_solution):
+def prepare_scenario_comparison(stored_solution, stored_baseline=None):
     """Compute scenario comparison artefacts for reuse across callbacks."""
     placeholder_fig = go.Figure().add_annotation(
         text="Run baseline and optimized plans to compare",
@@ -1762,10 +2583,9 @@ def prepare_scenario_comparison(stored_solution):
         )
         return {"summary": summary, "figure": placeholder_fig, "meta": meta, "ready": False}
 
-    try:
-        if isinstance(stored_solution, str):
-            json.loads(stored_solution)
-    except (TypeError, ValueError, json.JSONDecodeError):
+    # Decode the stored plan once; an unreadable payload comes back as None
+    current_totals = plan_totals(stored_solution)
+    if current_totals is None:
         message = "Unable to read the stored plan for comparison."
         summary = dbc.Alert(message, color="danger", className="mb-0")
         error_fig = go.Figure().add_annotation(
@@ -1786,21 +2606,15 @@ def prepare_scenario_comparison(stored_solution):
         return {"summary": summary, "figure": error_fig, "meta": meta, "ready": False}
 
     try:
-        global baseline_solution, current_solution
-
         scenarios: List[str] = []
         costs: List[float] = []
         vessels: List[int] = []
 
-        if baseline_solution:
-            scenarios.append("Baseline (FCFS)")
-            costs.append(float(baseline_solution.get("objective_value", 0) or 0))
-            vessels.append(len(baseline_solution.get("assignments", [])))
-
-        if current_solution:
-            scenarios.append("Optimized (AI)")
-            costs.append(float(current_solution.get("objective_value", 0) or 0))
-            vessels.append(len(current_solution.get("assignments", [])))
+        for label, totals in (("Baseline (FCFS)", plan_totals(stored_baseline)), ("Optimized (AI)", current_totals)):
+            if totals:
+                scenarios.append(label)
+                costs.append(totals[0])
+                vessels.append(totals[1])
 
         if len(scenarios) < 2:
             summary = dbc.Alert(
@@ -1872,7 +2686,7 @@ def prepare_scenario_comparison(stored_solution):
             ], width=4)
         ])
 
-        fig = make_subplots(
+        fig = _make_subplots()(
             rows=1, cols=2,
             subplot_titles=("Cost Comparison", "Vessel Utilization"),
             specs=[[{"type": "bar"}, {"type": "bar"}]]
@@ -1881,8 +2695,8 @@ def prepare_scenario_comparison(stored_solution):
         fig.add_trace(
             go.Bar(
                 x=scenarios,
-                y=costs,
-                marker=dict(color=["#6c757d", "#28a745"]),
+                y=np.asarray(costs, dtype=np.float64),
+                marker=dict(color=SCENARIO_BAR_COLORS),
                 text=[format_currency(c) for c in costs],
                 textposition="outside",
                 name="Cost"
@@ -1893,7 +2707,7 @@ def prepare_scenario_comparison(stored_solution):
         fig.add_trace(
             go.Bar(
                 x=scenarios,
-                y=vessels,
+                y=np.asarray(vessels, dtype=np.int64),
                 marker=dict(color=["#ffc107", "#007bff"]),
                 text=vessels,
                 textposition="outside",
@@ -1956,12 +2770,13 @@ def prepare_scenario_comparison(stored_solution):
 @app.callback(
     [Output("scenario-comparison-summary", "children"),
      Output("scenario-comparison-chart", "figure")],
-    [Input("stored-solution", "children"),
-     Input("compare-scenarios-btn", "n_clicks")]
+    [Input("stored-solution", "data"),
+     Input("compare-scenarios-btn", "n_clicks")],
+    [State("stored-baseline", "data")]
 )
-def update_scenario_comparison(stored_solution, compare_clicks):
+def update_scenario_comparison(stored_solution, compare_clicks, stored_baseline):
     """Compare baseline vs optimized scenarios"""
-    artefacts = prepare_scenario_comparison(stored_solution)
+    artefacts = prepare_scenario_comparison(stored_solution, stored_baseline)
     return artefacts["summary"], artefacts["figure"]
 
 
@@ -1973,10 +2788,11 @@ def update_scenario_comparison(stored_solution, compare_clicks):
     [Input("compare-scenarios-btn", "n_clicks"),
      Input("scenario-modal-close", "n_clicks")],
     [State("scenario-comparison-modal", "is_open"),
-     State("stored-solution", "children")],
+     State("stored-solution", "data"),
+     State("stored-baseline", "data")],
     prevent_initial_call=True
 )
-def toggle_scenario_modal(open_clicks, close_clicks, is_open, stored_solution):
+def toggle_scenario_modal(open_clicks, close_clicks, is_open, stored_solution, stored_baseline):
     """Open a modal snapshot of the scenario comparison dashboard."""
     ctx = callback_context
     if not ctx.triggered:
@@ -1985,7 +2801,7 @@ def toggle_scenario_modal(open_clicks, close_clicks, is_open, stored_solution):
     trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
     if trigger_id == "compare-scenarios-btn" and open_clicks:
-        artefacts = prepare_scenario_comparison(stored_solution)
+        artefacts = prepare_scenario_comparison(stored_solution, stored_baseline)
         return True, artefacts["summary"], artefacts["figure"], artefacts["meta"]
 
     if trigger_id == "scenario-modal-close" and close_clicks:
@@ -1995,9 +2811,9 @@ def toggle_scenario_modal(open_clicks, close_clicks, is_open, stored_solution):
 
 @app.callback(
     Output("cost-breakdown-chart", "figure"),
-    [Input("stored-solution", "children"),
-     Input("stored-simulation", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data"),
+     Input("stored-simulation", "data")],
+    [State("stored-data", "data")]
 )
 def update_cost_breakdown(stored_solution, stored_simulation, stored_data):
     """Update cost breakdown chart - now truly dynamic"""
@@ -2010,50 +2826,16 @@ def update_cost_breakdown(stored_solution, stored_simulation, stored_data):
         )
     
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
+        solution = parse_solution_payload(stored_solution)
+        data_frames = get_data_frames(stored_data)
         
-        # Calculate detailed costs from solution
-        assignments = solution.get('assignments', [])
-        vessels_df = pd.DataFrame(data_dict['vessels'])
-        ports_df = pd.DataFrame(data_dict['ports'])
-        rail_costs_df = pd.DataFrame(data_dict['rail_costs'])
-        
-        # Calculate component costs
-        port_handling_cost = 0
-        rail_transport_cost = 0
-        demurrage_cost = 0
-        
-        for assign in assignments:
-            vessel_id = assign.get('vessel_id')
-            port_id = assign.get('port_id')
-            plant_id = assign.get('plant_id')
-            cargo_mt = assign.get('cargo_mt', 0)
-            
-            # Port handling
-            port_row = ports_df[ports_df['port_id'] == port_id]
-            if not port_row.empty:
-                handling_rate = port_row.iloc[0]['handling_cost_per_mt']
-                port_handling_cost += cargo_mt * handling_rate
-            
-            # Rail transport
-            rail_row = rail_costs_df[
-                (rail_costs_df['port_id'] == port_id) & 
-                (rail_costs_df['plant_id'] == plant_id)
-            ]
-            if not rail_row.empty:
-                rail_rate = rail_row.iloc[0]['cost_per_mt']
-                rail_transport_cost += cargo_mt * rail_rate
-            
-            # Demurrage (simplified - would need actual wait times)
-            vessel_row = vessels_df[vessels_df['vessel_id'] == vessel_id]
-            if not vessel_row.empty:
-                demurrage_rate = vessel_row.iloc[0]['demurrage_rate']
-                # Estimate 0.5 day average delay
-                demurrage_cost += demurrage_rate * 12  # 12 hours estimated wait
+        costs = cached_cost_components(solution, stored_data, data_frames)
+        port_handling_cost = costs['port_handling']
+        rail_transport_cost = costs['rail_transport']
+        demurrage_cost = costs['demurrage']
         
         # Create pie chart
-        labels = ['Port Handling', 'Rail Transport', 'Demurrage', 'Other']
+        labels = COST_BREAKDOWN_LABELS
         values = [
             port_handling_cost,
             rail_transport_cost,
@@ -2065,7 +2847,7 @@ def update_cost_breakdown(stored_solution, stored_simulation, stored_data):
             labels=labels,
             values=values,
             hole=0.4,
-            marker=dict(colors=['#007bff', '#28a745', '#ffc107', '#6c757d']),
+            marker=dict(colors=COST_BREAKDOWN_COLORS),
             textinfo='label+percent',
             textposition='outside'
         )])
@@ -2093,8 +2875,8 @@ def update_cost_breakdown(stored_solution, stored_simulation, stored_data):
 
 @app.callback(
     Output("cost-drivers-analysis", "children"),
-    [Input("stored-solution", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data")],
+    [State("stored-data", "data")]
 )
 def update_cost_drivers(stored_solution, stored_data):
     """Analyze and display key cost drivers"""
@@ -2102,36 +2884,32 @@ def update_cost_drivers(stored_solution, stored_data):
         return html.P("No data available", className="text-muted")
     
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
+        solution = parse_solution_payload(stored_solution)
         
         drivers = []
         
         # Port utilization driver
-        assignments = solution.get('assignments', [])
-        port_counts = {}
-        for assign in assignments:
-            port = assign.get('port_id', 'Unknown')
-            port_counts[port] = port_counts.get(port, 0) + 1
+        view = solution_view(solution)
+        port_counts = view.port_counts
         
-        if port_counts:
-            max_port = max(port_counts, key=port_counts.get)
+        if not port_counts.empty:
+            max_port = port_counts.idxmax()
             drivers.append(
                 html.Div([
                     html.H6("Port utilization", className="text-primary"),
                     html.P(f"Busiest: {max_port} ({port_counts[max_port]} vessels)", className="mb-1"),
-                    html.Small(f"Total ports used: {len(port_counts)}", className="text-muted")
+                    html.Small(f"Total ports used: {port_counts.size}", className="text-muted")
                 ], className="mb-3")
             )
         
         # Cargo distribution
-        total_cargo = sum(assign.get('cargo_mt', 0) for assign in assignments)
+        total_cargo = view.total_cargo
         if total_cargo > 0:
             drivers.append(
                 html.Div([
                     html.H6("Cargo volume", className="text-success"),
                     html.P(f"Total: {total_cargo:,.0f} MT", className="mb-1"),
-                    html.Small(f"Avg per vessel: {total_cargo/len(assignments):,.0f} MT", className="text-muted")
+                    html.Small(f"Avg per vessel: {total_cargo/len(view.assignments_df):,.0f} MT", className="text-muted")
                 ], className="mb-3")
             )
         
@@ -2154,10 +2932,11 @@ def update_cost_drivers(stored_solution, stored_data):
 
 @app.callback(
     Output("cost-timeline-chart", "figure"),
-    [Input("stored-solution", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data")],
+    [State("stored-data", "data"),
+     State("stored-baseline", "data")]
 )
-def update_cost_timeline(stored_solution, stored_data):
+def update_cost_timeline(stored_solution, stored_data, stored_baseline):
     """Create cost timeline and baseline comparison"""
     if not stored_solution:
         return go.Figure().add_annotation(
@@ -2167,17 +2946,18 @@ def update_cost_timeline(stored_solution, stored_data):
         )
     
     try:
-        solution = json.loads(stored_solution)
+        solution = parse_solution_payload(stored_solution)
         
         # Create comparison chart if baseline exists
         scenarios = ['Current Solution']
         costs = [solution.get('objective_value', 0)]
-        colors = ['#28a745']
+        colors = [OPTIMIZED_BAR_COLOR]
         
-        if baseline_solution:
+        baseline_totals = plan_totals(stored_baseline)
+        if baseline_totals:
             scenarios.insert(0, 'Baseline (FCFS)')
-            costs.insert(0, baseline_solution.get('objective_value', 0))
-            colors.insert(0, '#6c757d')
+            costs.insert(0, baseline_totals[0])
+            colors.insert(0, BASELINE_BAR_COLOR)
         
         # Create bar chart
         fig = go.Figure(data=[
@@ -2191,7 +2971,7 @@ def update_cost_timeline(stored_solution, stored_data):
         ])
         
         # Add savings annotation if baseline exists
-        if baseline_solution and len(costs) > 1:
+        if baseline_totals and len(costs) > 1:
             savings = costs[0] - costs[1]
             savings_pct = (savings / costs[0] * 100) if costs[0] > 0 else 0
             
@@ -2227,8 +3007,8 @@ def update_cost_timeline(stored_solution, stored_data):
 
 @app.callback(
     Output("rake-heatmap", "figure"),
-    [Input("stored-solution", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data")],
+    [State("stored-data", "data")]
 )
 def update_rake_heatmap(stored_solution, stored_data):
     """Update rake utilization heatmap"""
@@ -2236,11 +3016,11 @@ def update_rake_heatmap(stored_solution, stored_data):
         return go.Figure()
     
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
+        solution = parse_solution_payload(stored_solution)
+        data_frames = get_data_frames(stored_data)
         
         assignments = solution.get('assignments', [])
-        ports_df = pd.DataFrame(data_dict['ports'])
+        ports_df = data_frames['ports']
         
         return LogisticsVisualizer.create_rake_heatmap(assignments, ports_df)
         
@@ -2250,35 +3030,53 @@ def update_rake_heatmap(stored_solution, stored_data):
 
 
 @app.callback(
-    [Output("rake-statistics", "children"),
-     Output("rake-assignment-table", "children")],
-    [Input("stored-solution", "children"),
-     Input("stored-simulation", "children")],
-    [State("stored-data", "children")]
+    [Output("rake-assignment-datatable", "data"),
+     Output("rake-assignment-datatable", "page_count")],
+    [Input("stored-solution", "data"),
+     Input("rake-assignment-datatable", "page_current"),
+     Input("rake-assignment-datatable", "page_size"),
+     Input("rake-assignment-datatable", "sort_by")]
+)
+def update_rake_assignment_page(stored_solution, page_current, page_size, sort_by):
+    """Serve one sorted page of the rake assignment detail table."""
+    solution = parse_solution_payload(stored_solution)
+    assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
+    if not assignments:
+        return [], 1
+
+    try:
+        return page_table_frame(rake_details_frame(get_assignments_frame(solution)), page_current, page_size, sort_by)
+    except Exception as exc:
+        print(f"Rake assignment table error: {exc}")
+        return [], 1
+
+
+@app.callback(
+    Output("rake-statistics", "children"),
+    [Input("stored-solution", "data"),
+     Input("stored-simulation", "data")]
 )
-def update_rake_panels(stored_solution, stored_simulation, stored_data):
-    """Render rake summary stats and detailed assignment table."""
+def update_rake_panels(stored_solution, stored_simulation):
+    """Render rake summary stats."""
     if not stored_solution:
-        empty_msg = html.P("Run an optimization to view rake utilization", className="text-muted")
-        return empty_msg, empty_msg
+        return html.P("Run an optimization to view rake utilization", className="text-muted")
 
     try:
-        solution = json.loads(stored_solution)
+        solution = parse_solution_payload(stored_solution)
         assignments = solution.get('assignments', [])
 
         if not assignments:
-            empty_msg = html.P("No rake movements planned.", className="text-muted")
-            return empty_msg, empty_msg
+            return html.P("No rake movements planned.", className="text-muted")
 
-        df = pd.DataFrame(assignments)
+        view = solution_view(solution)
 
         # Compute stats
-        total_rakes = int(df.get('rakes_required', pd.Series(dtype=int)).sum()) if 'rakes_required' in df else 0
-        total_cargo = float(df.get('cargo_mt', pd.Series(dtype=float)).sum()) if 'cargo_mt' in df else 0.0
-        unique_ports = df['port_id'].nunique() if 'port_id' in df else 0
-        unique_plants = df['plant_id'].nunique() if 'plant_id' in df else 0
+        total_rakes = view.total_rakes
+        total_cargo = view.total_cargo
+        unique_ports = view.port_counts.size
+        unique_plants = view.plant_counts.size
 
-        simulation = json.loads(stored_simulation) if stored_simulation else {}
+        simulation = parse_solution_payload(stored_simulation) if stored_simulation else {}
         kpis = simulation.get('kpis', {}) if isinstance(simulation, dict) else {}
         rake_utilization = kpis.get('avg_rake_utilization')
 
@@ -2305,41 +3103,10 @@ def update_rake_panels(stored_solution, stored_simulation, stored_data):
                 html.Span(f"{rake_utilization:.2%}", className="badge bg-secondary float-end")
             ]))
 
-        stats_component = dbc.ListGroup(stats_items, flush=True)
-
-        # Prepare detailed table
-        display_df = df.rename(columns={
-            'vessel_id': 'Vessel',
-            'port_id': 'Port',
-            'plant_id': 'Plant',
-            'cargo_mt': 'Cargo (MT)',
-            'rakes_required': 'Rakes Required',
-            'scheduled_day': 'Scheduled Day',
-            'berth_time': 'Berth Day',
-            'eta_day': 'ETA Day'
-        })
-
-        display_columns = [col for col in ['Vessel', 'Port', 'Plant', 'Cargo (MT)',
-                                           'Rakes Required', 'Scheduled Day', 'Berth Day', 'ETA Day']
-                           if col in display_df.columns]
-
-        table = dash_table.DataTable(
-            data=display_df[display_columns].to_dict('records'),
-            columns=[{'name': col, 'id': col} for col in display_columns],
-            page_size=10,
-            style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': 12},
-            style_header={'backgroundColor': '#0d6efd', 'color': 'white', 'fontWeight': 'bold'},
-            style_data_conditional=[
-                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}
-            ],
-            sort_action='native'
-        )
-
-        return stats_component, table
+        return dbc.ListGroup(stats_items, flush=True)
 
     except Exception as exc:
-        error = html.P(f"Error building rake metrics: {exc}", className="text-danger")
-        return error, error
+        return html.P(f"Error building rake metrics: {exc}", className="text-danger")
 
 
 @app.callback(
@@ -2351,14 +3118,14 @@ def update_rake_panels(stored_solution, stored_simulation, stored_data):
         Output("simulation-variance-table", "children")
     ],
     [
-        Input("stored-simulation", "children"),
-        Input("stored-solution", "children"),
-        Input("stored-data", "children")
-    ]
+        Input("stored-simulation", "data"),
+        Input("stored-solution", "data"),
+        Input("stored-data", "data")
+    ],
+    [State("stored-baseline", "data")]
 )
-def update_simulation_comparator(stored_simulation, stored_solution, stored_data):
+def update_simulation_comparator(stored_simulation, stored_solution, stored_data, stored_baseline):
     """Populate the Simulation Comparator tab with summary metrics and visuals."""
-    global baseline_solution
 
     def placeholder_figure(message: str) -> go.Figure:
         fig = go.Figure()
@@ -2401,17 +3168,10 @@ def update_simulation_comparator(stored_simulation, stored_solution, stored_data
 
         columns = []
         for card in cards_data:
-            delta_color = "secondary"
+            delta_color = kpi_delta_color(card)
             delta_text = None
-            raw_delta = card.get('delta')
             raw_delta_pct = card.get('delta_pct')
 
-            if raw_delta is not None and raw_delta != 0:
-                if card['title'] in ['Total Cost', 'Demurrage Cost', 'Avg Vessel Wait']:
-                    delta_color = "success" if raw_delta < 0 else "danger"
-                else:
-                    delta_color = "success" if raw_delta > 0 else "danger"
-
             if raw_delta_pct is not None:
                 delta_text = html.Div(
                     f"{raw_delta_pct:+.1f}% vs plan",
@@ -2454,35 +3214,18 @@ def update_simulation_comparator(stored_simulation, stored_solution, stored_data
         )
 
     data_frames = get_data_frames(stored_data)
-    vessels_df = data_frames.get('vessels', pd.DataFrame())
-    plants_df = data_frames.get('plants', pd.DataFrame())
-    ports_df = data_frames.get('ports', pd.DataFrame())
-    rail_costs_df = data_frames.get('rail_costs', pd.DataFrame())
 
     solution = parse_solution_payload(stored_solution)
     assignments = solution.get('assignments', []) if isinstance(solution, dict) else []
 
-    plan_kpis = calculate_kpis(
-        assignments,
-        vessels_df,
-        plants_df,
-        None,
-        ports_df,
-        rail_costs_df
-    ) if assignments else {}
+    plan_kpis = cached_kpis(solution, stored_data, data_frames) if assignments else {}
 
     baseline_kpis = None
+    baseline_solution = parse_solution_payload(stored_baseline)
     if baseline_solution and isinstance(baseline_solution, dict):
         baseline_assignments = baseline_solution.get('assignments', [])
         if baseline_assignments:
-            baseline_kpis = calculate_kpis(
-                baseline_assignments,
-                vessels_df,
-                plants_df,
-                None,
-                ports_df,
-                rail_costs_df
-            )
+            baseline_kpis = cached_kpis(baseline_solution, stored_data, data_frames)
 
     if not stored_simulation:
         summary = dbc.Alert(
@@ -2542,14 +3285,7 @@ def update_simulation_comparator(stored_simulation, stored_solution, stored_data
             html.Div(dbc.Alert("Variance table unavailable without simulation data.", color="light", className="mb-0"))
         )
 
-    sim_kpis = calculate_kpis(
-        assignments,
-        vessels_df,
-        plants_df,
-        simulation_results,
-        ports_df,
-        rail_costs_df
-    ) if assignments else simulation_results.get('kpis', {})
+    sim_kpis = cached_kpis(solution, stored_data, data_frames, simulation_results) if assignments else simulation_results.get('kpis', {})
 
     plan_cost = plan_kpis.get('total_cost', solution.get('objective_value', 0) if isinstance(solution, dict) else 0)
     sim_cost = sim_kpis.get('total_cost', simulation_results.get('cost_components', {}).get('total', 0))
@@ -2753,67 +3489,74 @@ def update_simulation_comparator(stored_simulation, stored_solution, stored_data
             "Delta %": delta_pct_display
         })
 
-    variance_df = pd.DataFrame(variance_rows)
     variance_table = dash_table.DataTable(
-        data=variance_df.to_dict("records"),
-        columns=[{"name": col, "id": col} for col in variance_df.columns],
+        data=variance_rows,
+        columns=VARIANCE_COLUMNS,
         style_table={"overflowX": "auto"},
-        style_cell={
-            "padding": "8px",
-            "fontSize": "13px"
-        },
-        style_header={
-            "backgroundColor": "#f8f9fa",
-            "fontWeight": "bold"
-        },
+        style_cell=VARIANCE_STYLE_CELL,
+        style_header=VARIANCE_STYLE_HEADER,
         page_size=8
     )
 
     return summary, kpi_panel, performance_fig, readiness_list, variance_table
 
+def _data_status_item(stored_data):
+    if stored_data:
+        return html.Div("Data loaded", className="text-success fw-semibold")
+    return html.Div("No data loaded", className="text-danger fw-semibold")
+
+
+def _solution_status_item(stored_solution):
+    if stored_solution:
+        solution = parse_solution_payload(stored_solution)
+        return html.Div(
+            f"Optimization status: {solution.get('status', 'Unknown')}",
+            className="text-success"
+        )
+    return html.Div("Optimization pending", className="text-warning")
+
+
+def _simulation_status_item(stored_simulation):
+    if stored_simulation:
+        return html.Div("Simulation completed", className="text-success")
+    return html.Div("Simulation pending", className="text-warning")
+
+
 @app.callback(
     Output("system-status", "children"),
-    [Input("stored-data", "children"),
-     Input("stored-solution", "children"),
-     Input("stored-simulation", "children")]
+    [Input("stored-data", "data"),
+     Input("stored-solution", "data"),
+     Input("stored-simulation", "data")]
 )
 def update_system_status(stored_data, stored_solution, stored_simulation):
     """Update system status display"""
-    status_items = []
-    
-    # Data status
-    if stored_data:
-        status_items.append(html.Div("Data loaded", className="text-success fw-semibold"))
-    else:
-        status_items.append(html.Div("No data loaded", className="text-danger fw-semibold"))
-    
-    # Solution status
-    if stored_solution:
-        solution = json.loads(stored_solution)
-        status_items.append(
-            html.Div(
-                f"Optimization status: {solution.get('status', 'Unknown')}",
-                className="text-success"
-            )
-        )
-    else:
-        status_items.append(html.Div("Optimization pending", className="text-warning"))
+    triggered = {item["prop_id"].split(".")[0] for item in callback_context.triggered}
     
-    # Simulation status
-    if stored_simulation:
-        status_items.append(html.Div("Simulation completed", className="text-success"))
-    else:
-        status_items.append(html.Div("Simulation pending", className="text-warning"))
+    # First load renders all three rows; later updates patch only the row that changed
+    if not triggered or "" in triggered:
+        return [
+            _data_status_item(stored_data),
+            _solution_status_item(stored_solution),
+            _simulation_status_item(stored_simulation)
+        ]
     
-    return status_items
+    patched = Patch()
+    if "stored-data" in triggered:
+        patched[0] = _data_status_item(stored_data)
+    if "stored-solution" in triggered:
+        patched[1] = _solution_status_item(stored_solution)
+    if "stored-simulation" in triggered:
+        patched[2] = _simulation_status_item(stored_simulation)
+    return patched
 
 @app.callback(
     Output("quick-insights", "children"),
-    [Input("stored-solution", "children"),
-     Input("stored-simulation", "children")],
-    [State("stored-data", "children")]
+    [Input("stored-solution", "data"),
+     Input("stored-simulation", "data")],
+    [State("stored-data", "data"),
+     State("stored-baseline", "data")]
 )
-def update_quick_insights(stored_solution, stored_simulation, stored_data):
+def update_quick_insights(stored_solution, stored_simulation, stored_data, stored_baseline):
     """Generate quick insights from optimization results"""
     if not stored_solution or not stored_data:
         return html.Div(
@@ -2822,15 +3565,16 @@ def update_quick_insights(stored_solution, stored_simulation, stored_data):
         )
     
     try:
-        solution = json.loads(stored_solution)
-        data_dict = json.loads(stored_data)
+        solution = parse_solution_payload(stored_solution)
+        data_frames = get_data_frames(stored_data)
         
         insights = []
         
         # Cost efficiency insight
         total_cost = solution.get('objective_value', 0)
-        if baseline_solution:
-            baseline_cost = baseline_solution.get('objective_value', 0)
+        baseline_totals = plan_totals(stored_baseline)
+        if baseline_totals:
+            baseline_cost = baseline_totals[0]
             if baseline_cost > 0:
                 improvement = ((baseline_cost - total_cost) / baseline_cost) * 100
                 if improvement > 10:
@@ -2849,7 +3593,7 @@ def update_quick_insights(stored_solution, stored_simulation, stored_data):
         # Vessel utilization insight
         assignments = solution.get('assignments', [])
         if assignments:
-            vessels_df = pd.DataFrame(data_dict['vessels'])
+            vessels_df = data_frames['vessels']
             processed = len(assignments)
             total = len(vessels_df)
             utilization = (processed / total) * 100
@@ -2863,17 +3607,14 @@ def update_quick_insights(stored_solution, stored_simulation, stored_data):
             )
         
         # Bottleneck detection
-        ports_df = pd.DataFrame(data_dict['ports'])
+        ports_df = data_frames['ports']
         if len(ports_df) > 0:
-            port_assignments = {}
-            for assign in assignments:
-                port = assign.get('port_id', 'Unknown')
-                port_assignments[port] = port_assignments.get(port, 0) + 1
+            port_assignments = solution_view(solution).port_counts
             
-            if port_assignments:
-                max_port = max(port_assignments, key=port_assignments.get)
-                max_count = port_assignments[max_port]
-                avg_count = sum(port_assignments.values()) / len(port_assignments)
+            if not port_assignments.empty:
+                max_port = port_assignments.idxmax()
+                max_count = int(port_assignments[max_port])
+                avg_count = port_assignments.mean()
                 
                 if max_count > avg_count * 1.5:
                     insights.append(dbc.Alert(
@@ -2900,62 +3641,67 @@ def update_quick_insights(stored_solution, stored_simulation, stored_data):
         return html.Div(f"Error generating insights: {str(e)}", className="text-danger")
 
 @app.callback(
-    Output("data-summary-table", "children"),
-    [Input("stored-data", "children")]
+    [Output("data-summary-table", "children"),
+     Output("data-summary-rendered", "data")],
+    [Input("stored-data", "data")],
+    [State("data-summary-rendered", "data")]
 )
-def update_data_summary(stored_data):
+def update_data_summary(stored_data, rendered):
     """Create data summary table"""
     if not stored_data:
         return html.Div(
             "No data loaded. Click 'Load Sample Data' or upload CSV files.",
             className="text-muted text-center p-4"
-        )
+        ), None
+    if dataset_expired(stored_data):
+        return html.Div(DATASET_EXPIRED_MESSAGE, className="text-warning text-center p-4"), None
     
+    fingerprint = skip_if_rendered(dataset_fingerprint(stored_data), rendered)
     try:
-        data_dict = json.loads(stored_data)
-        
         summary_rows = []
-        for dataset_name, records in data_dict.items():
-            df = pd.DataFrame(records)
+        for dataset_name, (n_rows, columns) in dataset_shapes(stored_data).items():
             summary_rows.append({
                 'Dataset': dataset_name.upper(),
-                'Records': len(df),
-                'Columns': len(df.columns),
-                'Key Columns': ', '.join(df.columns[:3].tolist())
+                'Records': n_rows,
+                'Columns': len(columns),
+                'Key Columns': ', '.join(str(col) for col in columns[:3])
             })
         
-        summary_df = pd.DataFrame(summary_rows)
-        
         return dash_table.DataTable(
-            data=summary_df.to_dict('records'),
-            columns=[{'name': col, 'id': col} for col in summary_df.columns],
-            style_cell={'textAlign': 'left', 'padding': '10px'},
-            style_header={'backgroundColor': '#343a40', 'color': 'white', 'fontWeight': 'bold'},
-            style_data_conditional=[
-                {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}
-            ]
-        )
+            data=summary_rows,
+            columns=DATA_SUMMARY_COLUMNS,
+            style_cell=DATA_SUMMARY_STYLE_CELL,
+            style_header=DATA_SUMMARY_STYLE_HEADER,
+            style_data_conditional=TABLE_STRIPED_ROWS
+        ), fingerprint
         
     except Exception as e:
         return html.Div(
             f"Error: {str(e)}",
             className="text-danger"
-        )
+        ), None
 
 @app.callback(
     [Output("solver-logs", "children"),
-     Output("audit-trail", "children")],
-    [Input("stored-solution", "children"),
-     Input("stored-simulation", "children")]
+     Output("audit-trail", "children"),
+     Output("logs-rendered", "data")],
+    [Input("stored-solution", "data"),
+     Input("stored-simulation", "data")],
+    [State("logs-rendered", "data")]
 )
-def update_logs_and_audit(stored_solution, stored_simulation):
+def update_logs_and_audit(stored_solution, stored_simulation, rendered):
     """Update solver logs and audit trail"""
+    fingerprint = skip_if_rendered(render_fingerprint(stored_solution, stored_simulation), rendered)
     logs = []
     audit = []
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     if stored_solution:
         try:
-            solution = json.loads(stored_solution)
+            # Only header fields are shown, so skip rebuilding assignments from the packed table
+            solution = stored_solution if isinstance(stored_solution, dict) else parse_solution_payload(stored_solution)
+            vessel_count = (plan_totals(solution) or (0, 0))[1]
+            cost_text = format_currency(solution.get('objective_value', 0))
             
             # Solver logs
             log_entries = solution.get('logs', [])
@@ -2964,15 +3710,16 @@ def update_logs_and_audit(stored_solution, stored_simulation):
                     logs.append(html.P(entry, className="mb-1 font-monospace small"))
             else:
                 # Generate synthetic logs from solution
-                logs.append(html.P(f"Optimization method: {solution.get('method', 'N/A')}", className="mb-1"))
-                logs.append(html.P(f"Status: {solution.get('status', 'N/A')}", className="mb-1"))
-                logs.append(html.P(f"Objective value: {format_currency(solution.get('objective_value', 0))}", className="mb-1"))
-                logs.append(html.P(f"Solve time: {solution.get('solve_time', 0):.2f}s", className="mb-1"))
-                logs.append(html.P(f"Assignments: {len(solution.get('assignments', []))} vessels", className="mb-1"))
+                summary_lines = (
+                    f"Optimization method: {solution.get('method', 'N/A')}",
+                    f"Status: {solution.get('status', 'N/A')}",
+                    f"Objective value: {cost_text}",
+                    f"Solve time: {solution.get('solve_time', 0):.2f}s",
+                    f"Assignments: {vessel_count} vessels",
+                )
+                logs.extend(html.P(line, className="mb-1") for line in summary_lines)
             
             # Audit trail
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             audit.append(
                 dbc.ListGroupItem([
                     html.Div([
@@ -2982,7 +3729,7 @@ def update_logs_and_audit(stored_solution, stored_simulation):
                         html.Br(),
                         html.Small(f"Method: {solution.get('method', 'Unknown')}", className="text-muted"),
                         html.Br(),
-                        html.Small(f"Cost: {format_currency(solution.get('objective_value', 0))}", className="text-muted")
+                        html.Small(f"Cost: {cost_text}", className="text-muted")
                     ])
                 ])
             )
@@ -2992,9 +3739,12 @@ def update_logs_and_audit(stored_solution, stored_simulation):
     
     if stored_simulation:
         try:
-            simulation = json.loads(stored_simulation)
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Result references carry simulation_days, so the cached event log is only
+            # fetched for legacy inline payloads
+            if isinstance(stored_simulation, dict) and 'simulation_days' in stored_simulation:
+                simulation = stored_simulation
+            else:
+                simulation = parse_solution_payload(stored_simulation)
             audit.append(
                 dbc.ListGroupItem([
                     html.Div([
@@ -3010,64 +3760,53 @@ def update_logs_and_audit(stored_solution, stored_simulation):
             pass
     
     if not logs:
-        logs = [html.P("No logs available. Run an optimization first.", className="text-muted")]
+        logs = NO_LOGS_PLACEHOLDER
     
     if not audit:
-        audit = [html.P("No activities yet.", className="text-muted")]
+        audit = NO_AUDIT_PLACEHOLDER
     
-    return logs, dbc.ListGroup(audit)
+    return logs, dbc.ListGroup(audit), fingerprint
 
 @app.callback(
-    Output("export-preview", "children"),
-    [Input("stored-solution", "children")],
-    [State("stored-data", "children")]
+    [Output("export-preview", "children"),
+     Output("export-preview-rendered", "data")],
+    [Input("stored-solution", "data")],
+    [State("stored-data", "data"),
+     State("export-preview-rendered", "data")]
 )
-def update_export_preview(stored_solution, stored_data):
+def update_export_preview(stored_solution, stored_data, rendered):
     """Show preview of exportable data"""
     if not stored_solution or not stored_data:
-        return html.P("Run an optimization to preview export data", className="text-muted")
+        return NO_EXPORT_PREVIEW_PLACEHOLDER, None
     
+    fingerprint = skip_if_rendered(render_fingerprint(stored_solution), rendered)
     try:
-        solution = json.loads(stored_solution)
+        solution = parse_solution_payload(stored_solution)
         assignments = solution.get('assignments', [])
         
         if not assignments:
-            return html.P("No assignments to export", className="text-muted")
-        
-        # Create preview dataframe
-        preview_data = []
-        for i, assign in enumerate(assignments[:5]):  # Show first 5
-            preview_data.append({
-                'Vessel': assign.get('vessel_id', 'N/A'),
-                'Port': assign.get('port_id', 'N/A'),
-                'Plant': assign.get('plant_id', 'N/A'),
-                'Cargo (MT)': f"{assign.get('cargo_mt', 0):,.0f}",
-                'ETA Day': assign.get('eta_day', 'N/A')
-            })
+            return NO_EXPORT_ASSIGNMENTS_PLACEHOLDER, fingerprint
         
-        preview_df = pd.DataFrame(preview_data)
+        preview_rows = export_preview_rows(solution)
         
         result = [
-            html.P(f"Preview (showing 5 of {len(assignments)} assignments):", className="small text-muted mb-2"),
+            html.P(f"Preview (showing {len(preview_rows)} of {len(assignments)} assignments):", className="small text-muted mb-2"),
             dash_table.DataTable(
-                data=preview_df.to_dict('records'),
-                columns=[{'name': col, 'id': col} for col in preview_df.columns],
-                style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '12px'},
-                style_header={'backgroundColor': '#6c757d', 'color': 'white', 'fontWeight': 'bold'},
-                style_data_conditional=[
-                    {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'}
-                ]
+                data=preview_rows,
+                columns=EXPORT_PREVIEW_COLUMNS,
+                style_cell=EXPORT_PREVIEW_STYLE_CELL,
+                style_header=EXPORT_PREVIEW_STYLE_HEADER,
+                style_data_conditional=TABLE_STRIPED_ROWS
             )
         ]
         
-        return result
+        return result, fingerprint
         
     except Exception as e:
-        return html.P(f"Error: {str(e)}", className="text-danger")
+        return html.P(f"Error: {str(e)}", className="text-danger"), None
 
 def run_server(debug: Optional[bool] = None, port=5006, host='127.0.0.1'):
     """Run the Dash server"""
-    import os
     import logging
     
     if debug is None:
@@ -3084,13 +3823,13 @@ def run_server(debug: Optional[bool] = None, port=5006, host='127.0.0.1'):
     print(f"Debug mode: {'ON' if debug else 'OFF'}")
     print(f"Deterministic seed in use: {BASE_RANDOM_SEED}")
     
-    # Initialize ML model (guard against duplicate execution under any reloader)
+    # Initialize ML model (guard against duplicate execution under any reloader).
+    # Training runs on a daemon thread with its own RNG so the server binds straight
+    # away and callbacks never see the global seed change underneath them.
     if os.environ.get("WERKZEUG_RUN_MAIN") in (None, "true"):
         set_global_seed(BASE_RANDOM_SEED, quiet=True)
-        reseed_for_phase("eta_model_training", quiet=True)
-        eta_predictor.train_stub_model()
-        # Restore base seed for downstream callbacks
-        set_global_seed(BASE_RANDOM_SEED, quiet=True)
+        training_rng = np.random.RandomState(derive_phase_seed("eta_model_training"))
+        eta_predictor.train_in_background(random_state=training_rng)
     
     print(f"Server ready at http://{host}:{port}/")
     print("Tip: Leave this terminal open while the dashboard is running.")
@@ -6,16 +6,17 @@ explicitly mentioned. Voyage timings are expressed in days.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple
+
+import numpy as np
 
 
 EXCHANGE_RATE_INR_PER_USD: float = 83.0
 """Representative INR/USD exchange rate used for freight conversion."""
 
 
-@dataclass(frozen=True)
-class PortBenchmark:
+class PortBenchmark(NamedTuple):
     """Realistic cost and capacity assumptions for Indian east-coast ports."""
 
     name: str
@@ -61,9 +62,18 @@ PORT_BENCHMARKS: Dict[str, PortBenchmark] = {
     ),
 }
 
+# Column-wise (structure-of-arrays) view of PORT_BENCHMARKS for vectorized cost math:
+# PORT_ARRAYS[field][PORT_INDEX[port_id]] == getattr(PORT_BENCHMARKS[port_id], field)
+PORT_ORDER = tuple(PORT_BENCHMARKS)
+PORT_INDEX: Dict[str, int] = {port_id: i for i, port_id in enumerate(PORT_ORDER)}
+PORT_ARRAYS: Dict[str, np.ndarray] = {
+    field: np.array([getattr(PORT_BENCHMARKS[port_id], field) for port_id in PORT_ORDER])
+    for field in PortBenchmark._fields
+    if field != "name"
+}
+
 
-@dataclass(frozen=True)
-class VoyageBenchmark:
+class VoyageBenchmark(NamedTuple):
     """Voyage timing assumptions for typical source regions."""
 
     sea_time_days_min: int
@@ -76,8 +86,7 @@ VOYAGE_BENCHMARKS: Dict[str, VoyageBenchmark] = {
 }
 
 
-@dataclass(frozen=True)
-class PlantBenchmark:
+class PlantBenchmark(NamedTuple):
     """Steel plant demand and service characteristics."""
 
     name: str
@@ -114,13 +123,18 @@ RAIL_TRANSIT_BANDS: Dict[str, Dict[str, float]] = {
 }
 
 
+# Band upper bounds and transit days in ascending order, derived once from RAIL_TRANSIT_BANDS
+_RAIL_BANDS_SORTED = sorted(RAIL_TRANSIT_BANDS.values(), key=lambda spec: spec["max_km"])
+_RAIL_BAND_MAX_KM = tuple(spec["max_km"] for spec in _RAIL_BANDS_SORTED)
+_RAIL_BAND_TRANSIT_DAYS = tuple(float(spec["transit_days"]) for spec in _RAIL_BANDS_SORTED)
+
+
 def classify_rail_transit(distance_km: float) -> float:
     """Return the benchmark rail transit time in days for a given distance."""
-    for band in ("SHORT", "MEDIUM", "LONG", "ULTRA"):
-        spec = RAIL_TRANSIT_BANDS[band]
-        if distance_km <= spec["max_km"]:
-            return spec["transit_days"]
-    return RAIL_TRANSIT_BANDS["ULTRA"]["transit_days"]
+    if distance_km != distance_km:  # NaN falls through every band
+        return _RAIL_BAND_TRANSIT_DAYS[-1]
+    band = min(bisect_left(_RAIL_BAND_MAX_KM, distance_km), len(_RAIL_BAND_MAX_KM) - 1)
+    return _RAIL_BAND_TRANSIT_DAYS[band]
 
 
 def get_port_ids() -> List[str]:
@@ -3,18 +3,50 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import io
-import base64
+import binascii
 import re
+import zipfile
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 from config import (
     EXCHANGE_RATE_INR_PER_USD,
+    PORT_ARRAYS,
     PORT_BENCHMARKS,
+    PORT_INDEX,
+    PORT_ORDER,
     PLANT_BENCHMARKS,
     VOYAGE_BENCHMARKS,
     DEFAULT_RAKE_CAPACITY_MT,
     SECONDARY_PORT_PENALTY_PER_MT,
-    get_port_ids,
 )
+from seed_utils import resolve_seed
+
+# Identifier and text columns are pinned to string, so ids such as "001" keep their digits.
+# Blank and NA-like cells ("", "NA", "null", ...) become nulls in text columns too, matching
+# pandas.read_csv, so identifier normalization sees None rather than "". Other columns are
+# still type-inferred by Arrow, which (unlike pandas) parses ISO-8601 dates and timestamps.
+_CSV_TEXT_COLUMNS = (
+    'vessel_id', 'port_id', 'plant_id', 'secondary_port_id', 'cargo_grade', 'quality_requirements',
+)
+_CSV_READ_OPTIONS = pa_csv.ReadOptions(use_threads=True)
+_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={column: pa.string() for column in _CSV_TEXT_COLUMNS},
+    strings_can_be_null=True,
+)
+
+# Delimiters accepted between ports in secondary_port_id
+_SECONDARY_PORT_DELIMITERS = re.compile(r"[|;,]+")
+
+# (column, strictly_positive) lower-bound checks applied by validate_csv_data
+NUMERIC_BOUND_CHECKS = {
+    'vessels': [('cargo_mt', True), ('eta_day', False)],
+    'ports': [('daily_capacity_mt', True), ('rakes_available_per_day', True), ('free_storage_days', False)],
+    'plants': [('daily_demand_mt', True)],
+}
+
 
 class DataLoader:
     """Handles data loading, validation, and toy dataset generation"""
@@ -25,28 +57,52 @@ class DataLoader:
             return None
         return str(value).strip().upper()
 
+    @staticmethod
+    def _normalize_identifier_series(series: pd.Series) -> pd.Series:
+        """Column-wise _normalize_identifier: strip/upper-case strings, missing values to None.
+
+        >>> DataLoader._normalize_identifier_series(pd.Series([' a ', None, np.nan])).tolist()
+        ['A', None, None]
+        """
+        values = np.full(len(series), None, dtype=object)
+        present = series.notna().to_numpy()
+        if present.any():
+            values[present] = series[present].astype(str).str.strip().str.upper().to_numpy()
+        return pd.Series(values, index=series.index, dtype=object)
+
     @staticmethod
     def _normalize_secondary_ports(value: Optional[str]) -> Optional[str]:
         if value is None or (isinstance(value, float) and pd.isna(value)):
             return None
-        if isinstance(value, (list, tuple, set)):
-            tokens = [DataLoader._normalize_identifier(tok) for tok in value if DataLoader._normalize_identifier(tok)]
-        else:
-            tokens = [
-                DataLoader._normalize_identifier(tok)
-                for tok in re.split(r"[|;,]+", str(value))
-                if DataLoader._normalize_identifier(tok)
-            ]
-        if not tokens:
-            return None
-        # Preserve original order but remove duplicates
-        seen = set()
-        ordered_tokens = []
-        for token in tokens:
-            if token not in seen:
-                seen.add(token)
-                ordered_tokens.append(token)
-        return "|".join(ordered_tokens)
+        raw_tokens = value if isinstance(value, (list, tuple, set)) else _SECONDARY_PORT_DELIMITERS.split(str(value))
+        normalized = (DataLoader._normalize_identifier(tok) for tok in raw_tokens)
+        # dict.fromkeys keeps the original order while removing duplicates
+        ordered_tokens = list(dict.fromkeys(tok for tok in normalized if tok))
+        return "|".join(ordered_tokens) if ordered_tokens else None
+
+    @staticmethod
+    def _normalize_secondary_ports_series(series: pd.Series) -> pd.Series:
+        """Column-wise _normalize_secondary_ports: split, normalize and de-duplicate tokens per row."""
+        values = np.full(len(series), None, dtype=object)
+        positions = np.flatnonzero(series.notna().to_numpy())
+        if positions.size:
+            # Work on row positions so duplicate index labels never merge rows
+            present = pd.Series(series.to_numpy(dtype=object)[positions])
+            try:
+                # Strings split on the delimiters; list-like cells are already token lists
+                split = present.str.split(_SECONDARY_PORT_DELIMITERS)
+            except AttributeError:
+                # No string cells at all (e.g. a purely numeric column); use the scalar path
+                return series.apply(DataLoader._normalize_secondary_ports)
+            tokens = split.where(split.notna(), present).explode()
+            tokens = tokens[tokens.notna()].astype(str).str.strip().str.upper()
+            tokens = tokens[tokens != '']
+            # First occurrence per row wins, keeping the original token order
+            tokens = tokens[~pd.MultiIndex.from_arrays([tokens.index, tokens.to_numpy()]).duplicated()]
+            if not tokens.empty:
+                joined = tokens.groupby(level=0, sort=False).agg('|'.join)
+                values[positions[joined.index.to_numpy()]] = joined.to_numpy()
+        return pd.Series(values, index=series.index, dtype=object)
 
     @staticmethod
     def _to_numeric(series: pd.Series, default: float = 0.0) -> pd.Series:
@@ -62,11 +118,13 @@ class DataLoader:
             return data
 
         standardized: Dict[str, pd.DataFrame] = {}
+        # Frames are copied shallowly: every column touched below is replaced via df[col] = ...,
+        # so the caller's arrays are never modified and untouched columns are not duplicated.
 
         if 'ports' in data and isinstance(data['ports'], pd.DataFrame):
-            ports_df = data['ports'].copy()
+            ports_df = data['ports'].copy(deep=False)
             if 'port_id' in ports_df.columns:
-                ports_df['port_id'] = ports_df['port_id'].apply(DataLoader._normalize_identifier)
+                ports_df['port_id'] = DataLoader._normalize_identifier_series(ports_df['port_id'])
 
             numeric_port_cols = [
                 'handling_cost_per_mt',
@@ -84,27 +142,29 @@ class DataLoader:
                 if col not in ports_df.columns:
                     ports_df[col] = 0.0
 
-            for idx, row in ports_df.iterrows():
-                port_id = row.get('port_id')
-                benchmark = PORT_BENCHMARKS.get(port_id)
-                if benchmark:
-                    if ports_df.at[idx, 'storage_cost_per_mt_per_day'] <= 0:
-                        ports_df.at[idx, 'storage_cost_per_mt_per_day'] = benchmark.storage_cost_per_mt_per_day
-                    if ports_df.at[idx, 'free_storage_days'] <= 0:
-                        ports_df.at[idx, 'free_storage_days'] = benchmark.free_storage_days
-                    if ports_df.at[idx, 'handling_cost_per_mt'] <= 0:
-                        ports_df.at[idx, 'handling_cost_per_mt'] = benchmark.handling_cost_per_mt
+            if 'port_id' in ports_df.columns:
+                # Resolve each row's benchmark position once, then gather from the column arrays
+                port_positions = ports_df['port_id'].map(PORT_INDEX)
+                known = port_positions.notna().to_numpy()
+                positions = port_positions[known].to_numpy(dtype=np.int64)
+                for col in ['storage_cost_per_mt_per_day', 'free_storage_days', 'handling_cost_per_mt']:
+                    benchmark_values = np.full(len(ports_df), np.nan)
+                    benchmark_values[known] = PORT_ARRAYS[col][positions]
+                    current = ports_df[col].to_numpy()
+                    backfill = known & (current <= 0)
+                    if backfill.any():
+                        ports_df[col] = np.where(backfill, benchmark_values, current)
 
             standardized['ports'] = ports_df
 
         if 'vessels' in data and isinstance(data['vessels'], pd.DataFrame):
-            vessels_df = data['vessels'].copy()
+            vessels_df = data['vessels'].copy(deep=False)
             for col in ['vessel_id', 'port_id']:
                 if col in vessels_df.columns:
-                    vessels_df[col] = vessels_df[col].apply(DataLoader._normalize_identifier)
+                    vessels_df[col] = DataLoader._normalize_identifier_series(vessels_df[col])
 
             if 'secondary_port_id' in vessels_df.columns:
-                vessels_df['secondary_port_id'] = vessels_df['secondary_port_id'].apply(DataLoader._normalize_secondary_ports)
+                vessels_df['secondary_port_id'] = DataLoader._normalize_secondary_ports_series(vessels_df['secondary_port_id'])
 
             numeric_vessel_cols = ['cargo_mt', 'eta_day', 'demurrage_rate']
             for col in numeric_vessel_cols:
@@ -122,28 +182,29 @@ class DataLoader:
             else:
                 vessels_df['freight_usd_per_mt'] = 0.0
 
-            missing_freight_mask = vessels_df['freight_inr_per_mt'].isna() | (vessels_df['freight_inr_per_mt'] <= 0)
-            vessels_df.loc[missing_freight_mask, 'freight_inr_per_mt'] = (
-                vessels_df.loc[missing_freight_mask, 'freight_usd_per_mt'] * EXCHANGE_RATE_INR_PER_USD
-            )
-            vessels_df['freight_inr_per_mt'] = vessels_df['freight_inr_per_mt'].fillna(0.0)
+            # Missing or non-positive INR freight falls back to the converted USD rate, in one pass
+            freight_inr = vessels_df['freight_inr_per_mt'].to_numpy(dtype=float)
+            freight_usd = vessels_df['freight_usd_per_mt'].to_numpy(dtype=float)
+            freight_inr = np.where(np.isnan(freight_inr) | (freight_inr <= 0),
+                                   freight_usd * EXCHANGE_RATE_INR_PER_USD, freight_inr)
+            vessels_df['freight_inr_per_mt'] = np.nan_to_num(freight_inr, nan=0.0, copy=False)
 
             standardized['vessels'] = vessels_df
 
         if 'plants' in data and isinstance(data['plants'], pd.DataFrame):
-            plants_df = data['plants'].copy()
+            plants_df = data['plants'].copy(deep=False)
             if 'plant_id' in plants_df.columns:
-                plants_df['plant_id'] = plants_df['plant_id'].apply(DataLoader._normalize_identifier)
+                plants_df['plant_id'] = DataLoader._normalize_identifier_series(plants_df['plant_id'])
             if 'daily_demand_mt' in plants_df.columns:
                 plants_df['daily_demand_mt'] = DataLoader._to_numeric(plants_df['daily_demand_mt'], default=0.0)
             standardized['plants'] = plants_df
 
         if 'rail_costs' in data and isinstance(data['rail_costs'], pd.DataFrame):
-            rail_df = data['rail_costs'].copy()
+            rail_df = data['rail_costs'].copy(deep=False)
             if 'port_id' in rail_df.columns:
-                rail_df['port_id'] = rail_df['port_id'].apply(DataLoader._normalize_identifier)
+                rail_df['port_id'] = DataLoader._normalize_identifier_series(rail_df['port_id'])
             if 'plant_id' in rail_df.columns:
-                rail_df['plant_id'] = rail_df['plant_id'].apply(DataLoader._normalize_identifier)
+                rail_df['plant_id'] = DataLoader._normalize_identifier_series(rail_df['plant_id'])
             for col in ['cost_per_mt', 'distance_km', 'transit_days']:
                 if col in rail_df.columns:
                     rail_df[col] = DataLoader._to_numeric(rail_df[col], default=0.0)
@@ -154,24 +215,30 @@ class DataLoader:
         return sanitized
     
     @staticmethod
-    def get_toy_dataset() -> Dict[str, pd.DataFrame]:
-        """Generate embedded toy dataset for immediate demo"""
-        
-        ports_records: List[Dict] = []
-        for port_id in get_port_ids():
-            bench = PORT_BENCHMARKS[port_id]
-            ports_records.append({
-                'port_id': port_id,
-                'port_name': bench.name,
-                'handling_cost_per_mt': bench.handling_cost_per_mt,
-                'storage_cost_per_mt_per_day': bench.storage_cost_per_mt_per_day,
-                'free_storage_days': bench.free_storage_days,
-                'daily_capacity_mt': bench.daily_throughput_mt,
-                'rakes_available_per_day': bench.rakes_available_per_day,
-                'secondary_port_penalty_per_mt': SECONDARY_PORT_PENALTY_PER_MT,
-            })
-
-        vessels_records: List[Dict] = []
+    def get_toy_dataset(seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """Generate embedded toy dataset for immediate demo.
+
+        With a seed the dataset is built once per seed and served as copies; without one it
+        draws from the global NumPy RNG as before.
+        """
+        if seed is None:
+            return DataLoader._build_toy_dataset(np.random)
+        return {name: df.copy() for name, df in _toy_dataset_for_seed(int(seed)).items()}
+
+    @staticmethod
+    def _build_toy_dataset(rng) -> Dict[str, pd.DataFrame]:
+        # Ports come straight off the benchmark column arrays
+        ports = pd.DataFrame({
+            'port_id': list(PORT_ORDER),
+            'port_name': [PORT_BENCHMARKS[port_id].name for port_id in PORT_ORDER],
+            'handling_cost_per_mt': PORT_ARRAYS['handling_cost_per_mt'],
+            'storage_cost_per_mt_per_day': PORT_ARRAYS['storage_cost_per_mt_per_day'],
+            'free_storage_days': PORT_ARRAYS['free_storage_days'],
+            'daily_capacity_mt': PORT_ARRAYS['daily_throughput_mt'],
+            'rakes_available_per_day': PORT_ARRAYS['rakes_available_per_day'],
+            'secondary_port_penalty_per_mt': SECONDARY_PORT_PENALTY_PER_MT,
+        })
+
         vessel_template = [
             ("MV_COKING_1", 85_000, "AUSTRALIA", "PARADIP", "HALDIA"),
             ("MV_IRON_1", 65_000, "AUSTRALIA", "VIZAG", "DHAMRA"),
@@ -184,40 +251,42 @@ class DataLoader:
             ("MV_IRON_4", 74_000, "AUSTRALIA", "PARADIP", "HALDIA"),
         ]
 
-        eta_day = 5
-        for vessel_id, cargo_mt, origin_region, primary_port, secondary_port in vessel_template:
-            voyage = VOYAGE_BENCHMARKS[origin_region]
-            freight_usd_per_mt = 2.6 if origin_region == "AUSTRALIA" else 1.9
-            freight_inr_per_mt = freight_usd_per_mt * EXCHANGE_RATE_INR_PER_USD
-            demurrage_rate_inr = 95_000 if origin_region == "AUSTRALIA" else 82_000
-            vessels_records.append({
-                'vessel_id': vessel_id,
-                'cargo_mt': cargo_mt,
-                'eta_day': eta_day,
-                'port_id': primary_port,
-                'secondary_port_id': secondary_port,
-                'origin_region': origin_region,
-                'sea_time_days_min': voyage.sea_time_days_min,
-                'sea_time_days_max': voyage.sea_time_days_max,
-                'freight_usd_per_mt': freight_usd_per_mt,
-                'freight_inr_per_mt': round(freight_inr_per_mt, 2),
-                'demurrage_rate': demurrage_rate_inr,
-                'cargo_grade': (
-                    'COKING_COAL' if 'COKING' in vessel_id else
-                    'LIMESTONE' if 'LIMESTONE' in vessel_id else 'IRON_ORE'
-                ),
-            })
-            eta_day += np.random.uniform(1.5, 3.5)
-
-        plants_records: List[Dict] = []
-        for plant_id, bench in PLANT_BENCHMARKS.items():
-            plants_records.append({
-                'plant_id': plant_id,
-                'plant_name': bench.name,
-                'daily_demand_mt': bench.daily_demand_mt,
-                'quality_requirements': bench.preferred_grade,
-                'safety_stock_days': bench.safety_stock_days,
-            })
+        # One RNG call for all arrival gaps; draws the same values, in the same order, as
+        # sampling one gap after each vessel
+        eta_gaps = rng.uniform(1.5, 3.5, size=len(vessel_template))
+        eta_days = np.cumsum(np.concatenate(([5.0], eta_gaps[:-1])))
+
+        vessel_ids, cargo_mt, origin_regions, primary_ports, secondary_ports = zip(*vessel_template)
+        voyages = [VOYAGE_BENCHMARKS[origin_region] for origin_region in origin_regions]
+        from_australia = np.array([origin_region == "AUSTRALIA" for origin_region in origin_regions])
+        freight_usd_per_mt = np.where(from_australia, 2.6, 1.9)
+        vessels = pd.DataFrame({
+            'vessel_id': list(vessel_ids),
+            'cargo_mt': np.array(cargo_mt, dtype=np.int64),
+            'eta_day': eta_days,
+            'port_id': list(primary_ports),
+            'secondary_port_id': list(secondary_ports),
+            'origin_region': list(origin_regions),
+            'sea_time_days_min': [voyage.sea_time_days_min for voyage in voyages],
+            'sea_time_days_max': [voyage.sea_time_days_max for voyage in voyages],
+            'freight_usd_per_mt': freight_usd_per_mt,
+            'freight_inr_per_mt': np.round(freight_usd_per_mt * EXCHANGE_RATE_INR_PER_USD, 2),
+            'demurrage_rate': np.where(from_australia, 95_000, 82_000),
+            'cargo_grade': [
+                'COKING_COAL' if 'COKING' in vessel_id else
+                'LIMESTONE' if 'LIMESTONE' in vessel_id else 'IRON_ORE'
+                for vessel_id in vessel_ids
+            ],
+        })
+
+        plant_benchmarks = list(PLANT_BENCHMARKS.values())
+        plants = pd.DataFrame({
+            'plant_id': list(PLANT_BENCHMARKS),
+            'plant_name': [bench.name for bench in plant_benchmarks],
+            'daily_demand_mt': [bench.daily_demand_mt for bench in plant_benchmarks],
+            'quality_requirements': [bench.preferred_grade for bench in plant_benchmarks],
+            'safety_stock_days': [bench.safety_stock_days for bench in plant_benchmarks],
+        })
 
         rail_distance_map = {
             ("PARADIP", "PLANT_A"): (450, 135),
@@ -242,23 +311,23 @@ class DataLoader:
             ("VIZAG", "PLANT_E"): (600, 148),
         }
 
-        rail_records: List[Dict] = []
-        for (port_id, plant_id), (distance_km, base_cost) in rail_distance_map.items():
-            variable_cost = base_cost
-            transit_days = max(2, int(round(distance_km / 250)))
-            rail_records.append({
-                'port_id': port_id,
-                'plant_id': plant_id,
-                'cost_per_mt': variable_cost,
-                'distance_km': distance_km,
-                'transit_days': transit_days,
-            })
+        # Build the rail table column-wise straight from the lane map
+        lanes = list(rail_distance_map)
+        distance_km = np.array([distance for distance, _ in rail_distance_map.values()])
+        rail_costs = pd.DataFrame({
+            'port_id': [port_id for port_id, _ in lanes],
+            'plant_id': [plant_id for _, plant_id in lanes],
+            'cost_per_mt': [base_cost for _, base_cost in rail_distance_map.values()],
+            'distance_km': distance_km,
+            # np.round rounds half to even, matching the built-in round()
+            'transit_days': np.maximum(2, np.round(distance_km / 250).astype(int)),
+        })
 
         raw_dataset = {
-            'ports': pd.DataFrame(ports_records),
-            'vessels': pd.DataFrame(vessels_records),
-            'plants': pd.DataFrame(plants_records),
-            'rail_costs': pd.DataFrame(rail_records)
+            'ports': ports,
+            'vessels': vessels,
+            'plants': plants,
+            'rail_costs': rail_costs
         }
 
         return DataLoader.standardize_dataset(raw_dataset)
@@ -298,40 +367,36 @@ class DataLoader:
                 errors.append(f"{dataset_name}: Dataset is empty")
             
             # Dataset-specific validations
+            # Numeric bounds: one frame-level min() per dataset rather than one per column
+            bound_checks = [check for check in NUMERIC_BOUND_CHECKS.get(dataset_name, ()) if check[0] in df.columns]
+            if bound_checks:
+                column_mins = df[[column for column, _ in bound_checks]].min()
+                for column, strictly_positive in bound_checks:
+                    lowest = column_mins[column]
+                    if strictly_positive and lowest <= 0:
+                        errors.append(f"{dataset_name}: {column} must be positive")
+                    elif not strictly_positive and lowest < 0:
+                        errors.append(f"{dataset_name}: {column} must be non-negative")
+            
             if dataset_name == 'vessels':
-                if 'cargo_mt' in df.columns and (df['cargo_mt'] <= 0).any():
-                    errors.append("vessels: cargo_mt must be positive")
-                if 'eta_day' in df.columns and (df['eta_day'] < 0).any():
-                    errors.append("vessels: eta_day must be non-negative")
                 if 'secondary_port_id' in df.columns:
-                    secondary_series = df['secondary_port_id'].dropna().astype(str).str.strip()
+                    # Upper-case whole cells before splitting: one string op per row, not per token
+                    secondary_series = df['secondary_port_id'].dropna().astype(str).str.upper()
                     if not secondary_series.empty:
-                        port_ids = set(data.get('ports', pd.DataFrame()).get('port_id', []))
-                        bad_values = []
-                        for entry in secondary_series:
-                            if not entry:
-                                continue
-                            tokens = [tok.strip() for tok in re.split(r'[|;,]+', entry) if tok.strip()]
-                            for token in tokens:
-                                token = token.upper()
-                                if token not in port_ids:
-                                    bad_values.append(token)
-                        if bad_values:
+                        port_ids = pd.Index(data.get('ports', pd.DataFrame()).get('port_id', []))
+                        tokens = (
+                            secondary_series.str.split(_SECONDARY_PORT_DELIMITERS)
+                            .explode()
+                            .str.strip()
+                        )
+                        tokens = tokens[tokens.notna() & (tokens != '')]
+                        # Membership is checked once per distinct token
+                        distinct_tokens = pd.Index(tokens.unique())
+                        bad_values = distinct_tokens[~distinct_tokens.isin(port_ids)].to_numpy()
+                        if bad_values.size:
                             errors.append(
-                                f"vessels: secondary_port_id contains unknown ports {sorted(set(bad_values))}"
+                                f"vessels: secondary_port_id contains unknown ports {sorted(bad_values)}"
                             )
-            
-            elif dataset_name == 'ports':
-                if 'daily_capacity_mt' in df.columns and (df['daily_capacity_mt'] <= 0).any():
-                    errors.append("ports: daily_capacity_mt must be positive")
-                if 'rakes_available_per_day' in df.columns and (df['rakes_available_per_day'] <= 0).any():
-                    errors.append("ports: rakes_available_per_day must be positive")
-                if 'free_storage_days' in df.columns and (df['free_storage_days'] < 0).any():
-                    errors.append("ports: free_storage_days must be non-negative")
-            
-            elif dataset_name == 'plants':
-                if 'daily_demand_mt' in df.columns and (df['daily_demand_mt'] <= 0).any():
-                    errors.append("plants: daily_demand_mt must be positive")
         
         return len(errors) == 0, errors   
  
@@ -339,12 +404,28 @@ class DataLoader:
     def parse_uploaded_file(contents: str, filename: str) -> Optional[pd.DataFrame]:
         """Parse uploaded CSV file content"""
         try:
-            content_type, content_string = contents.split(',')
-            decoded = base64.b64decode(content_string)
+            # Skip the data-URL header without slicing the payload into a second string;
+            # a2b_base64 decodes straight from a view of the ASCII bytes
+            header_end = contents.find(',')
+            if header_end < 0:
+                raise ValueError("upload is not a base64 data URL")
+            decoded = binascii.a2b_base64(memoryview(contents.encode('ascii'))[header_end + 1:])
             
-            if 'csv' in filename:
-                df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
-            elif 'xlsx' in filename or 'xls' in filename:
+            extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+            if extension == 'csv':
+                # Read straight from the decoded bytes; no str/StringIO copy
+                table = pa_csv.read_csv(
+                    pa.BufferReader(pa.py_buffer(decoded)),
+                    read_options=_CSV_READ_OPTIONS,
+                    convert_options=_CSV_CONVERT_OPTIONS
+                )
+                # The table is not used again, so let Arrow release each column as it converts
+                df = table.to_pandas(split_blocks=True, self_destruct=True)
+                del table
+            elif extension == 'xlsx':
+                # Name the engine so pandas skips format sniffing; openpyxl is a declared dependency
+                df = pd.read_excel(io.BytesIO(decoded), engine='openpyxl')
+            elif extension == 'xls':
                 df = pd.read_excel(io.BytesIO(decoded))
             else:
                 return None
@@ -355,15 +436,24 @@ class DataLoader:
             return None
     
     @staticmethod
-    def create_sample_csvs() -> Dict[str, str]:
+    def parse_uploaded_files(contents_list: List[str], filenames: List[str]) -> List[Optional[pd.DataFrame]]:
+        """Parse several uploaded files concurrently, preserving input order"""
+        pairs = list(zip(contents_list or [], filenames or []))
+        if len(pairs) <= 1:
+            return [DataLoader.parse_uploaded_file(c, f) for c, f in pairs]
+
+        with ThreadPoolExecutor(max_workers=min(4, len(pairs))) as executor:
+            return list(executor.map(lambda pair: DataLoader.parse_uploaded_file(*pair), pairs))
+    
+    @staticmethod
+    def create_sample_csvs(seed: Optional[int] = None) -> Dict[str, str]:
         """Create sample CSV content for download templates"""
-        toy_data = DataLoader.get_toy_dataset()
-        
-        csv_contents = {}
-        for name, df in toy_data.items():
-            csv_contents[f"{name}.csv"] = df.to_csv(index=False)
-        
-        return csv_contents
+        return {f"{name}.csv": df.to_csv(index=False) for name, df in _toy_dataset_for_seed(resolve_seed(seed)).items()}
+
+    @staticmethod
+    def create_sample_csvs_zip(seed: Optional[int] = None) -> bytes:
+        """Sample CSV templates as one zip archive, streamed straight from the frames (cached per seed)"""
+        return _sample_csvs_zip_for_seed(resolve_seed(seed))
     
     @staticmethod
     def get_data_summary(data: Dict[str, pd.DataFrame]) -> Dict[str, any]:
@@ -372,20 +462,39 @@ class DataLoader:
         
         if 'vessels' in data:
             vessels = data['vessels']
+            totals = vessels.agg({'cargo_mt': 'sum', 'eta_day': 'mean'})
             summary['total_vessels'] = len(vessels)
-            summary['total_cargo_mt'] = vessels['cargo_mt'].sum()
-            summary['avg_eta_days'] = vessels['eta_day'].mean()
+            summary['total_cargo_mt'] = totals['cargo_mt']
+            summary['avg_eta_days'] = totals['eta_day']
             summary['cargo_types'] = vessels['cargo_grade'].unique().tolist()
         
         if 'ports' in data:
             ports = data['ports']
+            totals = ports[['daily_capacity_mt', 'rakes_available_per_day']].sum()
             summary['total_ports'] = len(ports)
-            summary['total_port_capacity'] = ports['daily_capacity_mt'].sum()
-            summary['total_rakes_available'] = ports['rakes_available_per_day'].sum()
+            summary['total_port_capacity'] = totals['daily_capacity_mt']
+            summary['total_rakes_available'] = totals['rakes_available_per_day']
         
         if 'plants' in data:
             plants = data['plants']
             summary['total_plants'] = len(plants)
             summary['total_demand_mt'] = plants['daily_demand_mt'].sum()
         
-        return summary
\ No newline at end of file
+        return summary
+
+
+@lru_cache(maxsize=4)
+def _toy_dataset_for_seed(seed: int) -> Dict[str, pd.DataFrame]:
+    # RandomState(seed) draws the same stream as np.random after np.random.seed(seed)
+    return DataLoader._build_toy_dataset(np.random.RandomState(seed))
+
+
+@lru_cache(maxsize=4)
+def _sample_csvs_zip_for_seed(seed: int) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for name, df in _toy_dataset_for_seed(seed).items():
+            with zip_file.open(f"{name}.csv", "w") as entry:
+                with io.TextIOWrapper(entry, encoding="utf-8", newline="") as text_entry:
+                    df.to_csv(text_entry, index=False)
+    return buffer.getvalue()
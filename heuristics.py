@@ -5,21 +5,65 @@ Refines MILP solutions and provides scalable optimization for large problems
 import random
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from deap import base, creator, tools, algorithms
 import copy
+import os
 import time
 import math
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 from utils import ETAPredictor, CostCalculator
 from config import DEFAULT_RAKE_CAPACITY_MT, SECONDARY_PORT_PENALTY_PER_MT, PORT_BENCHMARKS
-from seed_utils import get_current_seed
+from seed_utils import get_current_seed, set_global_seed
+
+# Independent SA chains launched by run_parallel_simulated_annealing; fixed so that
+# the same seed searches the same way on every host, whatever its CPU count
+SA_MAX_CHAINS = 4
+
+# Island-model GA: islands per run (fixed, like SA_MAX_CHAINS) and the smallest
+# population an island may run
+GA_MAX_ISLANDS = 4
+GA_MIN_ISLAND_SIZE = 6
+
+# Smallest workloads worth a process pool, roughly one second of serial work each:
+# GA counts vessels x individuals x generations, SA counts assignments x iterations x chains
+GA_MIN_PARALLEL_WORK = 100_000
+SA_MIN_PARALLEL_WORK = 50_000
+
+# Per-process optimizer built once by the pool initializer, reused by every chain
+_WORKER_OPTIMIZER = None
+
+
+def _init_sa_worker(data: Dict[str, pd.DataFrame], predicted_delay_days: Dict[str, Dict[str, float]]):
+    global _WORKER_OPTIMIZER
+    _WORKER_OPTIMIZER = HeuristicOptimizer(data)
+    # Score with the parent's delays: the worker's ETA stub would draw from a different RNG state
+    _WORKER_OPTIMIZER.predicted_delay_days = predicted_delay_days
+
+
+def _init_ga_worker(data: Dict[str, pd.DataFrame], predicted_delay_days: Dict[str, Dict[str, float]]):
+    _init_sa_worker(data, predicted_delay_days)
+    _WORKER_OPTIMIZER._setup_deap()
+
+
+def _ga_island_worker(args: Tuple[List, int, int, int]) -> List[Tuple[float, List[Tuple]]]:
+    """Evolve one GA island for an epoch inside a pool worker"""
+    return _WORKER_OPTIMIZER._evolve_island(*args)
+
+
+def _sa_chain_worker(args: Tuple[Dict, int, int]) -> Dict:
+    """Run one seeded SA chain inside a pool worker"""
+    initial_solution, max_iterations, seed = args
+    set_global_seed(seed, quiet=True)
+    return _WORKER_OPTIMIZER.run_simulated_annealing(initial_solution, max_iterations=max_iterations)
 
 class HeuristicOptimizer:
     """Heuristic optimization using GA and Simulated Annealing"""
     
     def __init__(self, data: Dict[str, pd.DataFrame]):
+        self.data = data
         self.vessels_df = data['vessels']
         self.ports_df = data['ports']
         self.plants_df = data['plants'] 
@@ -31,6 +75,22 @@ class HeuristicOptimizer:
         self.plant_lookup = self.plants_df.set_index('plant_id').to_dict('index')
         self.vessel_lookup = self.vessels_df.set_index('vessel_id').to_dict('index')
         
+        # Flat per-lane / per-vessel / per-port rates so fitness evaluation never touches pandas
+        self.rail_cost_lookup: Dict[Tuple[str, str], float] = {}
+        if {'port_id', 'plant_id', 'cost_per_mt'}.issubset(self.rail_costs_df.columns):
+            for port_id, plant_id, cost_per_mt in zip(self.rail_costs_df['port_id'],
+                                                      self.rail_costs_df['plant_id'],
+                                                      self.rail_costs_df['cost_per_mt']):
+                self.rail_cost_lookup.setdefault((port_id, plant_id), float(cost_per_mt))
+        self.freight_rate_lookup: Dict[str, float] = {
+            vessel_id: float(CostCalculator.get_freight_inr_per_mt(vessel_data) or 0.0)
+            for vessel_id, vessel_data in self.vessel_lookup.items()
+        }
+        self._port_rate_cache: Dict[str, Tuple[float, float, float]] = {}
+        self.compatible_plants_by_grade: Dict[str, List[str]] = {}
+        for plant_id, grade in zip(self.plants_df['plant_id'], self.plants_df['quality_requirements']):
+            self.compatible_plants_by_grade.setdefault(grade, []).append(plant_id)
+
         # DEAP setup will be done when needed
         self.toolbox = None
 
@@ -86,8 +146,6 @@ class HeuristicOptimizer:
                 continue
 
             vessel_data = self.vessel_lookup.get(vessel_id)
-            port_data = self.port_lookup.get(port_id, {}).copy()
-            benchmark = PORT_BENCHMARKS.get(port_id)
 
             if not vessel_data:
                 continue
@@ -96,17 +154,7 @@ class HeuristicOptimizer:
             if cargo_mt <= 0:
                 continue
 
-            handling_rate = float(port_data.get('handling_cost_per_mt', 0.0) or 0.0)
-            storage_rate = float(port_data.get('storage_cost_per_mt_per_day', 0.0) or 0.0)
-            free_days = float(port_data.get('free_storage_days', 0.0) or 0.0)
-
-            if benchmark:
-                if handling_rate <= 0:
-                    handling_rate = benchmark.handling_cost_per_mt
-                if storage_rate <= 0:
-                    storage_rate = benchmark.storage_cost_per_mt_per_day
-                if free_days <= 0:
-                    free_days = benchmark.free_storage_days
+            handling_rate, storage_rate, free_days = self._get_port_rates(port_id)
 
             costs['port_handling'] += handling_rate * cargo_mt
 
@@ -145,7 +193,7 @@ class HeuristicOptimizer:
             if primary_port and primary_port != str(port_id).strip().upper():
                 costs['rerouting_penalty'] += cargo_mt * self.secondary_port_penalty_per_mt
 
-            costs['ocean_freight'] += CostCalculator.calculate_ocean_freight_cost(cargo_mt, vessel_data)
+            costs['ocean_freight'] += cargo_mt * self.freight_rate_lookup.get(vessel_id, 0.0)
 
         costs['total'] = (
             costs['ocean_freight'] +
@@ -159,10 +207,7 @@ class HeuristicOptimizer:
         return costs
 
     def _get_compatible_plants(self, cargo_grade: str) -> List[str]:
-        matches = self.plants_df[
-            self.plants_df['quality_requirements'] == cargo_grade
-        ]
-        return matches['plant_id'].tolist()
+        return self.compatible_plants_by_grade.get(cargo_grade, [])
 
     def _build_assignment_record(self, vessel_id: str, vessel_data: Dict, port_id: str, plant_id: str) -> Dict:
         cargo_mt = float(vessel_data.get('cargo_mt', 0.0) or 0.0)
@@ -360,8 +405,7 @@ class HeuristicOptimizer:
         """Create a random individual for GA"""
         individual = []
         
-        for _, vessel in self.vessels_df.iterrows():
-            vessel_id = vessel['vessel_id']
+        for vessel_id, vessel in self.vessel_lookup.items():
             cargo_grade = vessel['cargo_grade']
             eta_day = float(vessel['eta_day'])
 
@@ -370,9 +414,7 @@ class HeuristicOptimizer:
                 continue
 
             # Find compatible plants
-            compatible_plants = self.plants_df[
-                self.plants_df['quality_requirements'] == cargo_grade
-            ]['plant_id'].tolist()
+            compatible_plants = self._get_compatible_plants(cargo_grade)
             
             if compatible_plants:
                 plant_id = random.choice(compatible_plants)
@@ -447,14 +489,32 @@ class HeuristicOptimizer:
     
     def _get_rail_cost(self, port_id: str, plant_id: str) -> float:
         """Get rail transport cost between port and plant"""
-        try:
-            cost_row = self.rail_costs_df[
-                (self.rail_costs_df['port_id'] == port_id) & 
-                (self.rail_costs_df['plant_id'] == plant_id)
-            ]
-            return cost_row.iloc[0]['cost_per_mt'] if not cost_row.empty else 100.0
-        except:
-            return 100.0
+        return self.rail_cost_lookup.get((port_id, plant_id), 100.0)
+
+    def _get_port_rates(self, port_id: str) -> Tuple[float, float, float]:
+        """Handling rate, storage rate and free storage days for a port, with benchmark fallbacks"""
+        rates = self._port_rate_cache.get(port_id)
+        if rates is not None:
+            return rates
+
+        port_data = self.port_lookup.get(port_id, {})
+        benchmark = PORT_BENCHMARKS.get(port_id)
+
+        handling_rate = float(port_data.get('handling_cost_per_mt', 0.0) or 0.0)
+        storage_rate = float(port_data.get('storage_cost_per_mt_per_day', 0.0) or 0.0)
+        free_days = float(port_data.get('free_storage_days', 0.0) or 0.0)
+
+        if benchmark:
+            if handling_rate <= 0:
+                handling_rate = benchmark.handling_cost_per_mt
+            if storage_rate <= 0:
+                storage_rate = benchmark.storage_cost_per_mt_per_day
+            if free_days <= 0:
+                free_days = benchmark.free_storage_days
+
+        rates = (handling_rate, storage_rate, free_days)
+        self._port_rate_cache[port_id] = rates
+        return rates
     
     def _calculate_constraint_penalties(self, assignments: List[Dict]) -> float:
         """Calculate penalty for constraint violations"""
@@ -529,9 +589,7 @@ class HeuristicOptimizer:
         
         if mutation_type in ['plant', 'plant_time']:
             # Change plant assignment
-            compatible_plants = self.plants_df[
-                self.plants_df['quality_requirements'] == cargo_grade
-            ]['plant_id'].tolist()
+            compatible_plants = self._get_compatible_plants(cargo_grade)
             if compatible_plants:
                 plant_id = random.choice(compatible_plants)
         
@@ -594,12 +652,23 @@ class HeuristicOptimizer:
         
         # Get best solution
         best_individual = tools.selBest(population, 1)[0]
+        solve_time = time.time() - start_time
+
+        result = self._finalize_ga_result(
+            best_individual, solve_time, generations, population_size, logbook, seed_solution
+        )
+
+        print(f"GA completed in {solve_time:.2f}s - Best cost: ₹{result['objective_value']:,.2f}")
+        return result
+
+    def _finalize_ga_result(self, best_individual, solve_time: float, generations: int,
+                            population_size: int, evolution_log, seed_solution: Optional[List[Dict]],
+                            extra: Optional[Dict] = None) -> Dict:
+        """Compare the best GA individual with greedy and seed plans, polish each and keep the cheapest"""
         best_assignments = self._individual_to_assignments(best_individual)
         best_cost_components = self._calculate_cost_components(best_assignments)
         best_cost = best_cost_components['total']
 
-        solve_time = time.time() - start_time
-
         seed_used = get_current_seed()
 
         result = {
@@ -609,10 +678,12 @@ class HeuristicOptimizer:
             'solve_time': solve_time,
             'generations': generations,
             'population_size': population_size,
-            'evolution_log': logbook,
+            'evolution_log': evolution_log,
             'rng_seed': seed_used,
             'cost_components': best_cost_components
         }
+        if extra:
+            result.update(extra)
 
         candidates = [result]
 
@@ -631,16 +702,127 @@ class HeuristicOptimizer:
                     'solve_time': solve_time,
                     'generations': generations,
                     'population_size': population_size,
-                    'evolution_log': logbook,
+                    'evolution_log': evolution_log,
                     'rng_seed': seed_used,
                     'cost_components': seed_cost_components
                 })
 
         refined_candidates = [self._refine_with_local_search(candidate) for candidate in candidates]
-        result = min(refined_candidates, key=lambda sol: sol['objective_value'])
+        return min(refined_candidates, key=lambda sol: sol['objective_value'])
+
+    def run_island_genetic_algorithm(self, population_size: int = 50, generations: int = 100,
+                                     seed_solution: Optional[List[Dict]] = None,
+                                     islands: Optional[int] = None,
+                                     migration_interval: int = 10,
+                                     migrants: int = 2,
+                                     progress_callback: Optional[Callable[[str], None]] = None) -> Dict:
+        """Run an island-model GA: islands evolve in worker processes and exchange elites in a ring
+
+        progress_callback, when given, receives a short status line after every migration epoch.
+        """
+        if islands is None:
+            islands = GA_MAX_ISLANDS
+        islands = max(1, int(islands))
+        if generations <= 0:
+            return self.run_genetic_algorithm(population_size, generations, seed_solution)
+
+        print(f"Running island GA ({islands} islands, Pop: {population_size}, Gen: {generations})")
+        start_time = time.time()
+        base_seed = get_current_seed()
+        island_size = max(GA_MIN_ISLAND_SIZE, population_size // islands)
+        migration_interval = max(1, int(migration_interval))
+        epochs = math.ceil(generations / migration_interval)
+
+        seeded_individual = self._assignments_to_individual(seed_solution) if seed_solution else None
+        populations = [[seeded_individual] if seeded_individual else [] for _ in range(islands)]
+        evolution_log = []
+        best = {}
+
+        def epoch_tasks(epoch: int):
+            epoch_generations = min(migration_interval, generations - epoch * migration_interval)
+            return [
+                (populations[island], island_size, epoch_generations,
+                 (base_seed + 7919 * island + 104729 * epoch) % (2 ** 32))
+                for island in range(islands)
+            ]
 
-        print(f"GA completed in {solve_time:.2f}s - Best cost: ₹{result['objective_value']:,.2f}")
+        def migrate(ranked_islands, epoch: int):
+            # Ring topology: each island replaces its worst members with its neighbour's elites
+            for island in range(islands):
+                own = [ind for _, ind in ranked_islands[island]]
+                # A lone island still runs in epochs (for progress reports) but has no neighbour
+                incoming = [ind for _, ind in ranked_islands[island - 1][:migrants]] if islands > 1 else []
+                populations[island] = own[:island_size - len(incoming)] + incoming
+            best_costs = [ranked[0][0] for ranked in ranked_islands if ranked]
+            for ranked in ranked_islands:
+                if ranked and ranked[0][0] < best.get('cost', float('inf')):
+                    best['cost'], best['individual'] = ranked[0]
+            evolution_log.append({
+                'epoch': epoch,
+                'gen': min(generations, (epoch + 1) * migration_interval),
+                'min': min(best_costs) if best_costs else None,
+                'avg': float(np.mean(best_costs)) if best_costs else None
+            })
+            if progress_callback and best:
+                progress_callback(
+                    f"GA generation {evolution_log[-1]['gen']}/{generations} "
+                    f"across {islands} island{'s' if islands > 1 else ''} - best cost ₹{best['cost']:,.0f}"
+                )
+
+        # Only the worker count follows the host; islands and their seeds never do
+        workers = min(islands, os.cpu_count() or 1)
+        work = len(self.vessel_lookup) * island_size * islands * generations
+        parallel = workers > 1 and work >= GA_MIN_PARALLEL_WORK
+        if parallel:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_ga_worker,
+                                         initargs=(self.data, self.predicted_delay_days)) as executor:
+                    for epoch in range(epochs):
+                        migrate(list(executor.map(_ga_island_worker, epoch_tasks(epoch))), epoch)
+            except Exception as e:
+                print(f"Parallel GA unavailable ({e}); evolving {islands} islands serially")
+                parallel = False
+        if not parallel:
+            populations = [[seeded_individual] if seeded_individual else [] for _ in range(islands)]
+            evolution_log = []
+            best.clear()
+            for epoch in range(epochs):
+                migrate([self._evolve_island(*task) for task in epoch_tasks(epoch)], epoch)
+        # Leave the same RNG state behind whichever path ran
+        set_global_seed(base_seed, quiet=True)
+
+        best_individual = best['individual']
+        solve_time = time.time() - start_time
+
+        result = self._finalize_ga_result(
+            best_individual, solve_time, generations, island_size * islands, evolution_log,
+            seed_solution, extra={'islands': islands, 'migration_interval': migration_interval}
+        )
+
+        print(f"Island GA completed in {solve_time:.2f}s - Best cost: ₹{result['objective_value']:,.2f}")
         return result
+
+    def _evolve_island(self, individuals: List[List[Tuple]], island_size: int,
+                       generations: int, seed: int) -> List[Tuple[float, List[Tuple]]]:
+        """Evolve one island population; returns (cost, individual) pairs sorted best first"""
+        set_global_seed(seed, quiet=True)
+        if self.toolbox is None:
+            self._setup_deap()
+
+        population = [creator.Individual(ind) for ind in individuals[:island_size]]
+        if len(population) < island_size:
+            population.extend(self.toolbox.population(n=island_size - len(population)))
+        for ind in population:
+            ind.fitness.values = self.toolbox.evaluate(ind)
+
+        population, _ = algorithms.eaSimple(
+            population, self.toolbox,
+            cxpb=0.7, mutpb=0.2,
+            ngen=generations,
+            verbose=False
+        )
+        ranked = sorted(population, key=lambda ind: ind.fitness.values[0])
+        return [(ind.fitness.values[0], list(ind)) for ind in ranked]
     
     def _assignments_to_individual(self, assignments: List[Dict]) -> Optional[List[Tuple]]:
         """Convert assignments to GA individual format"""
@@ -737,6 +919,49 @@ class HeuristicOptimizer:
         print(f"SA completed in {solve_time:.2f}s - Final cost: ${best_cost:,.2f}")
         return result
     
+    def run_parallel_simulated_annealing(self, initial_solution: Dict,
+                                         max_iterations: int = 1000,
+                                         chains: Optional[int] = None) -> Dict:
+        """Run independent SA chains from distinct seeds in worker processes and keep the best"""
+        if chains is None:
+            chains = SA_MAX_CHAINS
+        chains = max(1, int(chains))
+        if chains == 1:
+            return self.run_simulated_annealing(initial_solution, max_iterations=max_iterations)
+
+        start_time = time.time()
+        base_seed = get_current_seed()
+        seeds = [(base_seed + 7919 * chain) % (2 ** 32) for chain in range(chains)]
+        tasks = [(initial_solution, max_iterations, seed) for seed in seeds]
+
+        # Only the worker count follows the host; chains and their seeds never do
+        workers = min(chains, os.cpu_count() or 1)
+        work = len(initial_solution.get('assignments') or []) * max_iterations * chains
+        results = None
+        if workers > 1 and work >= SA_MIN_PARALLEL_WORK:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_sa_worker,
+                                         initargs=(self.data, self.predicted_delay_days)) as executor:
+                    results = list(executor.map(_sa_chain_worker, tasks))
+            except Exception as e:
+                # Pools are unavailable in daemonic workers and some sandboxes; run chains in-process
+                print(f"Parallel SA unavailable ({e}); running {chains} chains serially")
+        if results is None:
+            results = []
+            for seed in seeds:
+                set_global_seed(seed, quiet=True)
+                results.append(self.run_simulated_annealing(initial_solution, max_iterations=max_iterations))
+        set_global_seed(base_seed, quiet=True)
+
+        best = min(results, key=lambda sol: sol['objective_value'])
+        best['chains'] = chains
+        best['chain_costs'] = [sol['objective_value'] for sol in results]
+        best['solve_time'] = time.time() - start_time
+        best['rng_seed'] = base_seed
+
+        print(f"Parallel SA completed {chains} chains in {best['solve_time']:.2f}s - Best cost: ${best['objective_value']:,.2f}")
+        return best
+
     def _generate_neighbor(self, assignments: List[Dict]) -> List[Dict]:
         """Generate neighbor solution for simulated annealing"""
         neighbor = copy.deepcopy(assignments)
@@ -758,9 +983,7 @@ class HeuristicOptimizer:
         
         if modification == 'plant':
             # Change plant assignment
-            compatible_plants = self.plants_df[
-                self.plants_df['quality_requirements'] == cargo_grade
-            ]['plant_id'].tolist()
+            compatible_plants = self._get_compatible_plants(cargo_grade)
             
             if len(compatible_plants) > 1:
                 current_plant = assignment['plant_id']
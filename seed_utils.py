@@ -82,6 +82,12 @@ def get_current_seed() -> int:
     return _CURRENT_SEED
 
 
+def derive_phase_seed(phase: str, *, offset: int = 0) -> int:
+    """Return the seed `reseed_for_phase` would apply, without touching any RNG."""
+    base = get_current_seed()
+    return (abs(hash((phase, base))) + offset) % (2 ** 32)
+
+
 def reseed_for_phase(phase: str, *, offset: int = 0, quiet: bool = True) -> int:
     """Derive a deterministic seed for a named phase and apply it.
 
@@ -89,13 +95,12 @@ def reseed_for_phase(phase: str, *, offset: int = 0, quiet: bool = True) -> int:
     reproducible. For example, `reseed_for_phase("simulation")` keeps the
     simulation RNG sequence stable without interfering with optimization.
     """
-    base = get_current_seed()
-    derived = (abs(hash((phase, base))) + offset) % (2 ** 32)
-    return set_global_seed(derived, quiet=quiet)
+    return set_global_seed(derive_phase_seed(phase, offset=offset), quiet=quiet)
 
 
 __all__ = [
     "DEFAULT_SEED",
+    "derive_phase_seed",
     "get_current_seed",
     "resolve_seed",
     "reseed_for_phase",
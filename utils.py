@@ -2,9 +2,10 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.model_selection import train_test_split
 import random
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from config import (
     EXCHANGE_RATE_INR_PER_USD,
@@ -13,34 +14,99 @@ from config import (
     DEMURRAGE_PENALTY_PER_MT_PER_DAY,
 )
 
+class BoundedMemo:
+    """Small thread-safe LRU memo for per-plan / per-dataset results.
+
+    Keys are hashable fingerprints. Entries keyed on ``id()`` of live objects should pass
+    those objects as ``anchors``; they are held with the value and compared by identity on
+    lookup, so a recycled id() never returns a stale entry.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[object, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, anchors: tuple = (), default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            held, value = entry
+            if len(held) != len(anchors) or any(a is not b for a, b in zip(held, anchors)):
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, anchors: tuple = ()):
+        """Store ``value`` under ``key`` (evicting the least recently used entry) and return it."""
+        with self._lock:
+            self._entries[key] = (tuple(anchors), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class ETAPredictor:
     """ML stub for ETA/delay prediction - placeholder for real ML model"""
     
     def __init__(self):
         self.model = None
         self.is_trained = False
+        # Held while fitting so a prediction issued mid-training waits for the model
+        self._train_lock = threading.RLock()
         
-    def train_stub_model(self, historical_data: Optional[pd.DataFrame] = None):
-        """Train a simple stub model for ETA prediction"""
-        # Generate synthetic training data if none provided
-        if historical_data is None:
-            n_samples = 1000
-            X = np.random.rand(n_samples, 4)  # weather, port_congestion, vessel_size, season
-            # Synthetic delay pattern: weather + congestion + random noise
-            y = (X[:, 0] * 2 + X[:, 1] * 3 + np.random.normal(0, 0.5, n_samples)) * 24  # hours
-            y = np.clip(y, 0, 72)  # Max 3 days delay
-        else:
-            # TODO: Extract features from real historical data
-            X = historical_data[['weather_score', 'port_congestion', 'vessel_size', 'season']].values
-            y = historical_data['actual_delay_hours'].values
+    def train_stub_model(self, historical_data: Optional[pd.DataFrame] = None,
+                         random_state: Optional[np.random.RandomState] = None):
+        """Train a simple stub model for ETA prediction
         
-        # Train simple gradient boosting model
-        self.model = GradientBoostingRegressor(n_estimators=50, random_state=42)
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        self.model.fit(X_train, y_train)
-        self.is_trained = True
-        
-        return self.model.score(X_test, y_test)
+        Synthetic data is drawn from ``random_state`` when given, otherwise from
+        the global NumPy RNG.
+        """
+        rng = np.random if random_state is None else random_state
+        with self._train_lock:
+            # Generate synthetic training data if none provided
+            if historical_data is None:
+                n_samples = 1000
+                X = rng.rand(n_samples, 4)  # weather, port_congestion, vessel_size, season
+                # Synthetic delay pattern: weather + congestion + random noise
+                y = (X[:, 0] * 2 + X[:, 1] * 3 + rng.normal(0, 0.5, n_samples)) * 24  # hours
+                y = np.clip(y, 0, 72)  # Max 3 days delay
+            else:
+                # TODO: Extract features from real historical data
+                X = historical_data[['weather_score', 'port_congestion', 'vessel_size', 'season']].values
+                y = historical_data['actual_delay_hours'].values
+            
+            # Train simple gradient boosting model (sklearn imported here to keep startup light)
+            from sklearn.ensemble import GradientBoostingRegressor
+            from sklearn.model_selection import train_test_split
+
+            self.model = GradientBoostingRegressor(n_estimators=50, random_state=42)
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            self.model.fit(X_train, y_train)
+            self.is_trained = True
+            
+            return self.model.score(X_test, y_test)
+    
+    def train_in_background(self, random_state: Optional[np.random.RandomState] = None) -> threading.Thread:
+        """Start train_stub_model on a daemon thread and return the thread"""
+        thread = threading.Thread(
+            target=self.train_stub_model,
+            kwargs={'random_state': random_state},
+            name='eta-model-training',
+            daemon=True,
+        )
+        thread.start()
+        return thread
     
     def predict_delay(self, vessel_id: str, port_id: str, base_eta: float, 
                      weather_score: float = None, port_congestion: float = None) -> float:
@@ -58,7 +124,10 @@ class ETAPredictor:
             Predicted delay in hours
         """
         if not self.is_trained:
-            self.train_stub_model()
+            with self._train_lock:
+                # Background training may have finished while we waited for the lock
+                if not self.is_trained:
+                    self.train_stub_model()
         
         # Use defaults if not provided
         if weather_score is None:
@@ -181,14 +250,14 @@ class CostCalculator:
 
         port_lookup: Dict[str, Dict] = {}
         if ports_df is not None and not ports_df.empty:
-            for _, row in ports_df.iterrows():
+            for row in ports_df.to_dict('records'):
                 port_id = normalize(row.get('port_id'))
                 if port_id:
-                    port_lookup[port_id] = row.to_dict()
+                    port_lookup[port_id] = row
 
         rail_lookup: Dict[Tuple[str, str], float] = {}
         if rail_costs_df is not None and not rail_costs_df.empty:
-            for _, row in rail_costs_df.iterrows():
+            for row in rail_costs_df.to_dict('records'):
                 port_id = normalize(row.get('port_id'))
                 plant_id = normalize(row.get('plant_id'))
                 if port_id and plant_id:
@@ -196,13 +265,36 @@ class CostCalculator:
 
         vessel_lookup: Dict[str, Dict] = {}
         if vessels_df is not None and not vessels_df.empty:
-            for _, row in vessels_df.iterrows():
+            for row in vessels_df.to_dict('records'):
                 vessel_id = normalize(row.get('vessel_id'))
                 if vessel_id:
-                    vessel_lookup[vessel_id] = row.to_dict()
+                    vessel_lookup[vessel_id] = row
 
         average_rail_cost = float(rail_costs_df['cost_per_mt'].mean()) if rail_costs_df is not None and not rail_costs_df.empty else 0.0
 
+        def resolve_port(port_id):
+            """Port rates with benchmark fallbacks for missing or zero values."""
+            port_data = port_lookup.get(port_id, {}).copy()
+            benchmark = PORT_BENCHMARKS.get(port_id)
+            if benchmark and not port_data:
+                port_data = {
+                    'handling_cost_per_mt': benchmark.handling_cost_per_mt,
+                    'storage_cost_per_mt_per_day': benchmark.storage_cost_per_mt_per_day,
+                    'free_storage_days': benchmark.free_storage_days
+                }
+            if port_data and benchmark:
+                # Ensure key rates exist using benchmark fallback when needed
+                if port_data.get('handling_cost_per_mt', 0.0) in (None, 0.0):
+                    port_data['handling_cost_per_mt'] = benchmark.handling_cost_per_mt
+                if port_data.get('storage_cost_per_mt_per_day', 0.0) in (None, 0.0):
+                    port_data['storage_cost_per_mt_per_day'] = benchmark.storage_cost_per_mt_per_day
+                if port_data.get('free_storage_days', 0.0) in (None, 0.0):
+                    port_data['free_storage_days'] = benchmark.free_storage_days
+            return port_data
+
+        # Benchmark-resolved port rates, computed once per port rather than once per assignment
+        resolved_ports: Dict[str, Dict] = {}
+
         for assignment in assignments:
             vessel_id_raw = assignment.get('vessel_id')
             port_id_raw = assignment.get('port_id')
@@ -217,25 +309,12 @@ class CostCalculator:
             if port_id is None or vessel_id is None:
                 continue
 
-            port_data = port_lookup.get(port_id, {}).copy()
-            benchmark = PORT_BENCHMARKS.get(port_id)
-            if benchmark and not port_data:
-                port_data = {
-                    'handling_cost_per_mt': benchmark.handling_cost_per_mt,
-                    'storage_cost_per_mt_per_day': benchmark.storage_cost_per_mt_per_day,
-                    'free_storage_days': benchmark.free_storage_days
-                }
+            if port_id not in resolved_ports:
+                resolved_ports[port_id] = resolve_port(port_id)
+            port_data = resolved_ports[port_id]
             if not port_data:
                 continue
 
-            # Ensure key rates exist using benchmark fallback when needed
-            if port_data.get('handling_cost_per_mt', 0.0) in (None, 0.0) and benchmark:
-                port_data['handling_cost_per_mt'] = benchmark.handling_cost_per_mt
-            if port_data.get('storage_cost_per_mt_per_day', 0.0) in (None, 0.0) and benchmark:
-                port_data['storage_cost_per_mt_per_day'] = benchmark.storage_cost_per_mt_per_day
-            if port_data.get('free_storage_days', 0.0) in (None, 0.0) and benchmark:
-                port_data['free_storage_days'] = benchmark.free_storage_days
-
             costs['port_handling'] += CostCalculator.calculate_port_handling_cost(cargo_mt, port_data)
 
             rail_cost_per_mt = rail_lookup.get((port_id, plant_id), average_rail_cost)
@@ -324,7 +403,12 @@ def format_currency(amount: float) -> str:
     """Format currency with appropriate units"""
     if amount is None or (isinstance(amount, float) and np.isnan(amount)):
         amount = 0.0
-    value = float(amount)
+    # Paise never show in the output, so rounding first lets repeated totals share one cache entry
+    return _format_currency_cached(round(float(amount), 2))
+
+
+@lru_cache(maxsize=1024)
+def _format_currency_cached(value: float) -> str:
     sign = "-" if value < 0 else ""
     value = abs(value)
 
@@ -348,6 +432,13 @@ def format_tonnage(tonnage: float) -> str:
     else:
         return f"{tonnage:.0f} MT"
 
+def _assignment_actual_berth(assignment: Dict):
+    """Actual berth day for an assignment, falling back to scheduled/planned period."""
+    actual = assignment.get('actual_berth_time', assignment.get('berth_time'))
+    if actual is None:
+        actual = assignment.get('scheduled_day', assignment.get('time_period'))
+    return actual
+
 def calculate_kpis(assignments: List[Dict], vessels_df: pd.DataFrame, 
                   plants_df: pd.DataFrame, simulation_results: Dict = None,
                   ports_df: Optional[pd.DataFrame] = None,
@@ -355,9 +446,8 @@ def calculate_kpis(assignments: List[Dict], vessels_df: pd.DataFrame,
     """Calculate key performance indicators"""
     kpis: Dict[str, float] = {}
 
-    vessel_lookup = vessels_df.set_index('vessel_id').to_dict('index') if not vessels_df.empty else {}
-    port_lookup = ports_df.set_index('port_id').to_dict('index') if ports_df is not None and not ports_df.empty else {}
-    plant_lookup = plants_df.set_index('plant_id').to_dict('index') if not plants_df.empty else {}
+    # Only membership is needed here, so skip materializing per-row dicts of the reference tables
+    known_vessels = set(vessels_df['vessel_id']) if not vessels_df.empty else set()
 
     if simulation_results:
         # Start with KPIs coming from simulation (already aggregated)
@@ -383,7 +473,7 @@ def calculate_kpis(assignments: List[Dict], vessels_df: pd.DataFrame,
         # Operational estimates directly from assignments
         total_delivered = sum(a.get('cargo_mt', 0.0) for a in assignments)
         unique_vessels_all = {a['vessel_id'] for a in assignments if 'vessel_id' in a}
-        unique_vessels = {v for v in unique_vessels_all if v in vessel_lookup}
+        unique_vessels = unique_vessels_all & known_vessels
         total_vessels = len(vessels_df)
         horizon_days = max((a.get('time_period') or 1) for a in assignments) if assignments else 1
         horizon_days = max(1, horizon_days)
@@ -406,36 +496,37 @@ def calculate_kpis(assignments: List[Dict], vessels_df: pd.DataFrame,
         else:
             kpis['vessels_processed_pct'] = 0.0
 
-        # Aggregate per vessel to avoid counting splits multiple times
-        per_vessel_wait_days: Dict[str, float] = {}
-        for vessel_id in unique_vessels:
-            if vessel_id not in vessel_lookup:
-                continue
-            eta_day = float(vessel_lookup[vessel_id].get('eta_day', 0))
-            # Find earliest actual berth across this vessel's assignments
-            actual_values = []
-            for a in assignments:
-                if a.get('vessel_id') != vessel_id:
-                    continue
-                actual = a.get('actual_berth_time', a.get('berth_time'))
-                if actual is None:
-                    actual = a.get('scheduled_day', a.get('time_period'))
-                if actual is not None:
-                    actual_values.append(float(actual))
-            if actual_values:
-                earliest_actual = min(actual_values)
-                per_vessel_wait_days[vessel_id] = max(0.0, earliest_actual - eta_day)
-            else:
-                per_vessel_wait_days[vessel_id] = 0.0
+        # Aggregate per vessel to avoid counting splits multiple times: earliest actual
+        # berth per vessel in one groupby instead of rescanning assignments per vessel
+        estimated_demurrage = 0.0
+        kpis['avg_vessel_wait_hours'] = 0.0
+        if unique_vessels:
+            berth_frame = pd.DataFrame({
+                'vessel_id': [a.get('vessel_id') for a in assignments],
+                'actual': [_assignment_actual_berth(a) for a in assignments],
+            })
+            berth_frame = berth_frame[berth_frame['vessel_id'].isin(unique_vessels)]
+            earliest_actual = (
+                berth_frame.assign(actual=berth_frame['actual'].astype(float))
+                .groupby('vessel_id')['actual'].min()
+            )
 
-        waits = [wd for wd in per_vessel_wait_days.values() if wd > 0]
-        kpis['avg_vessel_wait_hours'] = (sum(waits) * 24.0 / len(waits)) if waits else 0.0
+            vessel_frame = vessels_df.set_index('vessel_id')
+            eta_days = (
+                vessel_frame['eta_day'].astype(float) if 'eta_day' in vessel_frame.columns
+                else pd.Series(0.0, index=vessel_frame.index)
+            )
+            wait_days = (earliest_actual - eta_days.reindex(earliest_actual.index)).clip(lower=0.0).fillna(0.0)
 
-        # Demurrage based on per-vessel wait and rate
-        estimated_demurrage = 0.0
-        for vessel_id, wait_days in per_vessel_wait_days.items():
-            if wait_days > 0 and vessel_id in vessel_lookup:
-                estimated_demurrage += wait_days * float(vessel_lookup[vessel_id].get('demurrage_rate', 0.0))
+            waits = wait_days[wait_days > 0]
+            kpis['avg_vessel_wait_hours'] = float(waits.sum() * 24.0 / len(waits)) if len(waits) else 0.0
+
+            # Demurrage based on per-vessel wait and rate
+            if 'demurrage_rate' in vessel_frame.columns:
+                demurrage_rates = vessel_frame['demurrage_rate'].astype(float).reindex(waits.index)
+                estimated_demurrage = float((waits * demurrage_rates).sum())
+            else:
+                estimated_demurrage = 0.0
         if 'demurrage_cost' not in kpis:
             kpis['demurrage_cost'] = estimated_demurrage
 
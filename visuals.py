@@ -3,8 +3,6 @@ Plotly visualization functions for the logistics dashboard
 Creates interactive charts, Gantt charts, KPI cards, and heatmaps
 """
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
@@ -222,27 +220,32 @@ class LogisticsVisualizer:
         
         fig = go.Figure()
         
-        # Add bars for each assignment
-        for i, row in df_gantt.iterrows():
-            color = port_colors.get(row['Port'], port_colors['default'])
-            
+        # One filled trace per port → plant lane; each bar is a polygon separated by None gaps
+        for resource, lane in df_gantt.groupby('Resource', sort=False):
+            color = port_colors.get(lane['Port'].iloc[0], port_colors['default'])
+            xs, ys, hover_text = [], [], []
+            for row in lane.itertuples():
+                label = (
+                    f"<b>{row.Task}</b><br>"
+                    f"Port: {row.Port}<br>"
+                    f"Plant: {row.Plant}<br>"
+                    f"Cargo: {format_tonnage(row.Cargo_MT)}<br>"
+                    f"Start: {row.Start.strftime('%Y-%m-%d %H:%M')}<br>"
+                    f"End: {row.Finish.strftime('%Y-%m-%d %H:%M')}"
+                )
+                xs.extend([row.Start, row.Finish, row.Finish, row.Start, row.Start, None])
+                ys.extend([row.Index - 0.4, row.Index - 0.4, row.Index + 0.4, row.Index + 0.4, row.Index - 0.4, None])
+                hover_text.extend([label] * 5 + [None])
+
             fig.add_trace(go.Scatter(
-                x=[row['Start'], row['Finish'], row['Finish'], row['Start'], row['Start']],
-                y=[i-0.4, i-0.4, i+0.4, i+0.4, i-0.4],
+                x=xs,
+                y=ys,
                 fill='toself',
                 fillcolor=color,
                 line=dict(color=color, width=2),
-                hovertemplate=(
-                    f"<b>{row['Task']}</b><br>"
-                    f"Port: {row['Port']}<br>"
-                    f"Plant: {row['Plant']}<br>"
-                    f"Cargo: {format_tonnage(row['Cargo_MT'])}<br>"
-                    f"Start: {row['Start'].strftime('%Y-%m-%d %H:%M')}<br>"
-                    f"End: {row['Finish'].strftime('%Y-%m-%d %H:%M')}<br>"
-                    "<extra></extra>"
-                ),
-                name=row['Resource'],
-                showlegend=i == 0 or row['Resource'] not in [df_gantt.iloc[j]['Resource'] for j in range(i)]
+                text=hover_text,
+                hovertemplate="%{text}<extra></extra>",
+                name=resource
             ))
         
         # Update layout
@@ -285,6 +288,7 @@ class LogisticsVisualizer:
         
         if scenarios and len(scenarios) > 1:
             # Multi-scenario comparison
+            from plotly.subplots import make_subplots
             fig = make_subplots(
                 rows=1, cols=2,
                 subplot_titles=("Cost Breakdown", "Scenario Comparison"),
@@ -354,39 +358,31 @@ class LogisticsVisualizer:
         ports = ports_df['port_id'].tolist()
         days = list(range(1, simulation_days + 1))
         
-        utilization_matrix = np.zeros((len(ports), len(days)))
-        availability_matrix = np.zeros((len(ports), len(days)))
-        
-        # Fill availability matrix
-        port_lookup = ports_df.set_index('port_id').to_dict('index')
-        for i, port_id in enumerate(ports):
-            daily_rakes = port_lookup[port_id]['rakes_available_per_day']
-            availability_matrix[i, :] = daily_rakes
-        
-        # Fill utilization matrix from assignments
-        for assignment in assignments:
-            port_id = assignment.get('port_id')
-            # Be robust: get time_period, or fallback to berth_time, default to day 1
-            tp_val = assignment.get('time_period')
-            if tp_val is None:
-                tp_val = assignment.get('berth_time')
-            if tp_val is None:
-                tp_val = 1
-            try:
-                day_val = int(float(tp_val))
-            except Exception:
-                day_val = 1
-            rakes_required = assignment.get('rakes_required', 1)
-
-            if port_id in ports:
-                port_idx = ports.index(port_id)
-                day_idx = min(max(day_val - 1, 0), len(days) - 1)
-                utilization_matrix[port_idx, day_idx] += rakes_required
+        utilization_matrix = np.zeros((len(ports), len(days)), dtype=np.float32)
+        availability_matrix = np.zeros((len(ports), len(days)), dtype=np.float32)
+        port_index = {port_id: i for i, port_id in enumerate(ports)}
+        
+        # Fill availability matrix (last row wins for duplicated port ids)
+        port_rakes = ports_df.drop_duplicates('port_id', keep='last').set_index('port_id')['rakes_available_per_day']
+        availability_matrix[:] = port_rakes.reindex(ports).to_numpy(dtype=np.float32)[:, None]
+        
+        # Fill utilization matrix from assignments in one scatter-add
+        frame = pd.DataFrame.from_records(assignments)
+        empty = pd.Series(np.nan, index=frame.index)
+        # Be robust: get time_period, or fallback to berth_time, default to day 1
+        tp_val = pd.to_numeric(frame.get('time_period', empty), errors='coerce').fillna(
+            pd.to_numeric(frame.get('berth_time', empty), errors='coerce')
+        ).fillna(1)
+        day_idx = np.clip(np.trunc(tp_val.to_numpy(dtype=float)).astype(np.int64) - 1, 0, len(days) - 1)
+        rakes_required = pd.to_numeric(frame.get('rakes_required', empty), errors='coerce').fillna(1).to_numpy(dtype=np.float32)
+        port_idx = frame.get('port_id', empty).map(pd.Series(port_index)).to_numpy(dtype=float)
+        matched = ~np.isnan(port_idx)
+        np.add.at(utilization_matrix, (port_idx[matched].astype(np.int64), day_idx[matched]), rakes_required[matched])
         
         # Calculate utilization percentage
         utilization_pct = np.divide(utilization_matrix, availability_matrix, 
-                                  out=np.zeros_like(utilization_matrix), 
-                                  where=availability_matrix!=0) * 100
+                                  out=np.zeros_like(availability_matrix), 
+                                  where=availability_matrix!=0) * np.float32(100)
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
@@ -394,7 +390,7 @@ class LogisticsVisualizer:
             x=[f"Day {d}" for d in days],
             y=ports,
             colorscale='RdYlBu_r',
-            text=utilization_matrix.astype(int),
+            text=utilization_matrix.astype(np.int32),
             texttemplate="%{text}",
             textfont={"size": 10},
             hovertemplate=(
@@ -460,6 +456,7 @@ class LogisticsVisualizer:
         df_plants = pd.DataFrame(plant_data)
         
         # Create subplot with bar chart and fulfillment percentage
+        from plotly.subplots import make_subplots
         fig = make_subplots(
             rows=1, cols=2,
             subplot_titles=("Demand vs Delivered", "Fulfillment Percentage"),
@@ -555,7 +552,8 @@ class LogisticsVisualizer:
         
         df_timeline = pd.DataFrame(timeline_data)
         
-        # Create scatter plot timeline
+        # Create scatter plot timeline; plotly.express is heavy, so import it on first use
+        import plotly.express as px
         fig = px.scatter(
             df_timeline, 
             x='Time_Step', 